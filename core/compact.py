@@ -0,0 +1,239 @@
+"""Variante compacta de la MLP 2-2-1 sin asignaciones en el bucle caliente.
+
+``CompactMLP221`` guarda parámetros, gradientes y cachés en ``array('d')``
+preasignados, usa ``__slots__`` (sin ``__dict__`` por instancia) y desenrolla
+los bucles de la topología fija 2-2-1. Las operaciones se hacen en el mismo
+orden que en ``MLP221``, así que los resultados coinciden bit a bit.
+
+Ejecutar ``python -m core.compact`` compara las asignaciones por época de ambas
+variantes.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import List, Optional, Sequence
+
+from .activations import sigmoid
+from .initializers import init_weights
+from .losses import bce
+from .model import MLP221
+
+
+class CompactMLP221:
+    """
+    MLP 2-2-1 con búferes preasignados; misma interfaz que ``MLP221``.
+
+    Distribución de ``_p`` (y de ``_g`` para los gradientes), igual que
+    ``MLP221.get_params``:
+        0-3: W1[0][0], W1[0][1], W1[1][0], W1[1][1]
+        4-5: b1[0], b1[1]
+        6-7: W2[0][0], W2[0][1]
+        8:   b2[0]
+
+    ``_c`` guarda la caché de la pasada hacia adelante: x1, x2, z1[0], z1[1],
+    a1[0], a1[1], z2.
+    """
+
+    __slots__ = ("_p", "_g", "_c", "yhat")
+
+    def __init__(self, init: str = "fixed", seed: Optional[int] = None):
+        self._p = array("d", bytes(8 * 9))
+        self._g = array("d", bytes(8 * 9))
+        self._c = array("d", bytes(8 * 7))
+        self.yhat = 0.0
+        reference = MLP221()
+        if init != "fixed":
+            init_weights(reference, init, seed)
+        self.set_params(reference.get_params())
+
+    # ------------------------------------------------------------------ cálculo
+    def forward(self, x: Sequence[float]) -> float:
+        """Propagación hacia adelante; no crea listas ni objetos intermedios."""
+
+        p = self._p
+        c = self._c
+        x0 = x[0]
+        x1 = x[1]
+        c[0] = x0
+        c[1] = x1
+
+        z = p[4]
+        z += p[0] * x0
+        z += p[1] * x1
+        c[2] = z
+        a0 = sigmoid(z)
+        c[4] = a0
+
+        z = p[5]
+        z += p[2] * x0
+        z += p[3] * x1
+        c[3] = z
+        a1 = sigmoid(z)
+        c[5] = a1
+
+        z = p[8]
+        z += p[6] * a0
+        z += p[7] * a1
+        c[6] = z
+        self.yhat = yhat = sigmoid(z)
+        return yhat
+
+    def backward(self, y: float) -> None:
+        """Calcula los gradientes BCE+sigmoide en el búfer ``_g``."""
+
+        p = self._p
+        g = self._g
+        c = self._c
+        delta2 = self.yhat - y
+        a0 = c[4]
+        a1 = c[5]
+
+        g[6] = delta2 * a0
+        g[7] = delta2 * a1
+        g[8] = delta2
+
+        d0 = (p[6] * delta2) * (a0 * (1.0 - a0))
+        d1 = (p[7] * delta2) * (a1 * (1.0 - a1))
+
+        g[4] = d0
+        g[0] = d0 * c[0]
+        g[1] = d0 * c[1]
+        g[5] = d1
+        g[2] = d1 * c[0]
+        g[3] = d1 * c[1]
+
+    def step(self, lr: float) -> None:
+        """Descenso de gradiente sobre los 9 parámetros (desenrollado)."""
+
+        p = self._p
+        g = self._g
+        p[4] -= lr * g[4]
+        p[0] -= lr * g[0]
+        p[1] -= lr * g[1]
+        p[5] -= lr * g[5]
+        p[2] -= lr * g[2]
+        p[3] -= lr * g[3]
+        p[8] -= lr * g[8]
+        p[6] -= lr * g[6]
+        p[7] -= lr * g[7]
+
+    def train_step(self, x: Sequence[float], y: float, lr: float, keep_grads: bool = False) -> float:
+        """
+        Forward, pérdida, backward y step fusionados (ver ``MLP221.train_step``).
+
+        Los gradientes se calculan siempre en ``_g``, así que ``keep_grads`` solo
+        existe por compatibilidad de interfaz.
+        """
+        self.forward(x)
+        loss = bce(self.yhat, y)
+        self.backward(y)
+        self.step(lr)
+        return loss
+
+    def predict(self, x: Sequence[float]) -> float:
+        """Realiza una predicción para la entrada x (igual que forward)."""
+
+        return self.forward(x)
+
+    # ------------------------------------------------------------------ estado
+    def get_params(self) -> List[float]:
+        """Devuelve los 9 parámetros en el orden de ``MLP221.get_params``."""
+
+        return self._p.tolist()
+
+    def set_params(self, params: Sequence[float]) -> None:
+        """Carga los 9 parámetros en el orden de ``MLP221.get_params``."""
+
+        if len(params) != 9:
+            raise ValueError("Se esperaban 9 parámetros")
+        for i in range(9):
+            self._p[i] = float(params[i])
+
+    # Vistas con la forma de MLP221 (para trazas y la UI); crean listas nuevas.
+    W1 = property(lambda self: [[self._p[0], self._p[1]], [self._p[2], self._p[3]]])
+    b1 = property(lambda self: [self._p[4], self._p[5]])
+    W2 = property(lambda self: [[self._p[6], self._p[7]]])
+    b2 = property(lambda self: [self._p[8]])
+    dW1 = property(lambda self: [[self._g[0], self._g[1]], [self._g[2], self._g[3]]])
+    db1 = property(lambda self: [self._g[4], self._g[5]])
+    dW2 = property(lambda self: [[self._g[6], self._g[7]]])
+    db2 = property(lambda self: [self._g[8]])
+    x = property(lambda self: [self._c[0], self._c[1]])
+    z1 = property(lambda self: [self._c[2], self._c[3]])
+    a1 = property(lambda self: [self._c[4], self._c[5]])
+    z2 = property(lambda self: [self._c[6]])
+
+
+def _epoch(net, data, lr: float) -> None:
+    for x, y in data:
+        net.forward(x)
+        net.backward(y)
+        net.step(lr)
+
+
+class _NullNet:
+    """Modelo vacío para medir lo que asigna el propio arnés del benchmark."""
+
+    def forward(self, x):
+        return 0.0
+
+    def backward(self, y):
+        pass
+
+    def step(self, lr):
+        pass
+
+
+def _transient_bytes(net, data, lr: float) -> int:
+    """Pico de bytes asignados durante una época por encima de la memoria estable."""
+
+    tracemalloc.start()
+    _epoch(net, data, lr)
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    _epoch(net, data, lr)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - base
+
+
+def allocation_benchmark(epochs: int = 2000, lr: float = 0.5) -> None:
+    """
+    Compara ``MLP221`` y ``CompactMLP221`` sobre el XOR.
+
+    Muestra el tiempo por época, los bytes que tracemalloc ve asignarse de forma
+    transitoria dentro de una época (pico menos memoria estable, descontando lo
+    que asigna el propio arnés) y la variación neta de bloques de memoria tras
+    todas las épocas.
+    """
+    from data.xor import DATA
+
+    data = [(list(x), y) for x, y in DATA]
+    harness = _transient_bytes(_NullNet(), data, lr)
+    print("| modelo | µs/época | bytes transitorios/época | bloques netos |")
+    print("|---|---:|---:|---:|")
+    for cls in (MLP221, CompactMLP221):
+        net = cls()
+        _epoch(net, data, lr)  # calentamiento
+
+        start = time.perf_counter()
+        for _ in range(epochs):
+            _epoch(net, data, lr)
+        per_epoch = (time.perf_counter() - start) / epochs * 1e6
+
+        transient = max(_transient_bytes(net, data, lr) - harness, 0)
+
+        blocks = sys.getallocatedblocks()
+        for _ in range(epochs):
+            _epoch(net, data, lr)
+        delta = sys.getallocatedblocks() - blocks
+        print(f"| {cls.__name__} | {per_epoch:.2f} | {transient} | {delta} |")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Micro-benchmark de asignaciones por época")
+    parser.add_argument("--epochs", type=int, default=2000)
+    allocation_benchmark(parser.parse_args().epochs)
@@ -0,0 +1,64 @@
+"""Esquemas de inicialización de pesos para la MLP 2–2–1.
+
+Todos los esquemas aleatorios usan un ``random.Random`` propio sembrado con la
+semilla indicada, de modo que la misma semilla produce siempre los mismos pesos
+sin alterar el estado global del módulo ``random``.
+"""
+
+import math
+import random
+from typing import Optional
+
+# Esquemas disponibles; "fixed" reproduce los pesos didácticos preajustados.
+SCHEMES = ("fixed", "uniform", "xavier", "he")
+
+
+def init_weights(net, scheme: str = "xavier", seed: Optional[int] = None) -> None:
+    """
+    Reinicializa en el lugar los pesos y sesgos de una red 2-2-1.
+
+    Esquemas:
+        - fixed:   pesos preajustados cerca de una solución del XOR
+        - uniform: pesos y sesgos en U(-1, 1)
+        - xavier:  Glorot uniforme, U(-l, l) con l = sqrt(6 / (fan_in + fan_out)),
+                   sesgos en cero
+        - he:      normal N(0, sqrt(2 / fan_in)), sesgos en cero
+
+    Parámetros:
+        net: Red con atributos W1, b1, W2 y b2
+        scheme: Nombre del esquema (ver ``SCHEMES``)
+        seed: Semilla del generador; None usa entropía del sistema
+    """
+    if scheme not in SCHEMES:
+        raise ValueError(f"Esquema de inicialización desconocido: {scheme!r}")
+
+    if scheme == "fixed":
+        net.W1 = [[ 4.0,  4.0],
+                  [-4.0, -4.0]]
+        net.b1 = [-2.0, 6.0]
+        net.W2 = [[6.0, 6.0]]
+        net.b2 = [-9.0]
+        return
+
+    rng = random.Random(seed)
+
+    if scheme == "uniform":
+        def draw(fan_in, fan_out):
+            return rng.uniform(-1.0, 1.0)
+        net.b1 = [rng.uniform(-1.0, 1.0) for _ in range(2)]
+        net.b2 = [rng.uniform(-1.0, 1.0)]
+    elif scheme == "xavier":
+        def draw(fan_in, fan_out):
+            limit = math.sqrt(6.0 / (fan_in + fan_out))
+            return rng.uniform(-limit, limit)
+        net.b1 = [0.0, 0.0]
+        net.b2 = [0.0]
+    else:
+        def draw(fan_in, fan_out):
+            return rng.gauss(0.0, math.sqrt(2.0 / fan_in))
+        net.b1 = [0.0, 0.0]
+        net.b2 = [0.0]
+
+    # Capa Entrada → Oculta: fan_in=2, fan_out=2; capa Oculta → Salida: 2 → 1
+    net.W1 = [[draw(2, 2) for _ in range(2)] for _ in range(2)]
+    net.W2 = [[draw(2, 1) for _ in range(2)]]
@@ -1,5 +1,6 @@
-from typing import List
+from typing import List, Optional, Sequence
 from .activations import sigmoid, d_sigmoid_from_a
+from .initializers import init_weights
 from .losses import bce
 
 class MLP221:
@@ -14,8 +15,12 @@ class MLP221:
         
     La implementación usa listas y bucles de Python explícitos
     por claridad educativa en lugar de arreglos numpy.
+
+    Args:
+        init: Esquema de inicialización ("fixed", "uniform", "xavier", "he")
+        seed: Semilla para los esquemas aleatorios
     """
-    def __init__(self):
+    def __init__(self, init: str = "fixed", seed: Optional[int] = None):
         # Pesos y sesgos de la capa Entrada → Oculta
         # W1[i][j]: peso desde la entrada j a la neurona oculta i
         self.W1 = [[ 4.0,  4.0],   # pesos a h1
@@ -27,6 +32,9 @@ class MLP221:
         self.W2 = [[6.0, 6.0]]     # pesos desde h1, h2 a y
         self.b2 = [-9.0]           # sesgo para la salida y
 
+        if init != "fixed":
+            init_weights(self, init, seed)
+
         # Caché de la pasada hacia adelante (para visualización y backprop)
         self.x  = [0.0, 0.0]       # valores de entrada
         self.z1 = [0.0, 0.0]       # pre-activación de la capa oculta
@@ -119,6 +127,87 @@ class MLP221:
         for i in range(2):
             self.W2[0][i] -= lr * self.dW2[0][i]
 
+    def train_step(self, x: List[float], y: float, lr: float, keep_grads: bool = False) -> float:
+        """
+        Paso de entrenamiento fusionado: forward, pérdida, backward y step en una pasada.
+
+        Equivale a ``forward(x)``, ``bce``, ``backward(y)`` y ``step(lr)`` con
+        las mismas operaciones en el mismo orden (resultados idénticos), pero
+        lee cada parámetro una sola vez en variables locales y no recorre
+        ``range(2)``. Solo ``yhat`` se actualiza siempre; las cachés de forward
+        y de gradientes se rellenan únicamente con ``keep_grads=True`` (por
+        ejemplo, cuando un trazador las necesita).
+
+        Con ``keep_grads=False`` (por defecto) ``x``, ``z1``, ``a1``, ``z2`` y
+        ``dW1``/``db1``/``dW2``/``db2`` NO son válidos tras el paso: conservan
+        los valores de la última ``forward``/``backward`` (o del último paso con
+        ``keep_grads=True``), anteriores a la actualización de los pesos. Quien
+        necesite mostrarlos debe llamar antes a ``forward(x)``.
+
+        Args:
+            x: Vector de entrada [x1, x2]
+            y: Etiqueta verdadera (0 o 1)
+            lr: Tasa de aprendizaje
+            keep_grads: Guardar cachés de forward y gradientes
+
+        Returns:
+            Pérdida BCE de la muestra antes de actualizar
+        """
+        w1a, w1b = self.W1
+        b1 = self.b1
+        w2 = self.W2[0]
+        b2 = self.b2
+        x0 = x[0]
+        x1 = x[1]
+
+        # Forward
+        z10 = b1[0]
+        z10 += w1a[0] * x0
+        z10 += w1a[1] * x1
+        a0 = sigmoid(z10)
+        z11 = b1[1]
+        z11 += w1b[0] * x0
+        z11 += w1b[1] * x1
+        a1 = sigmoid(z11)
+        z2 = b2[0]
+        z2 += w2[0] * a0
+        z2 += w2[1] * a1
+        self.yhat = yhat = sigmoid(z2)
+        loss = bce(yhat, y)
+
+        # Backward (con W2 previo a la actualización)
+        delta2 = yhat - y
+        g_w20 = delta2 * a0
+        g_w21 = delta2 * a1
+        d0 = (w2[0] * delta2) * d_sigmoid_from_a(a0)
+        d1 = (w2[1] * delta2) * d_sigmoid_from_a(a1)
+        g_w1a0 = d0 * x0
+        g_w1a1 = d0 * x1
+        g_w1b0 = d1 * x0
+        g_w1b1 = d1 * x1
+
+        # Step
+        b1[0] -= lr * d0
+        w1a[0] -= lr * g_w1a0
+        w1a[1] -= lr * g_w1a1
+        b1[1] -= lr * d1
+        w1b[0] -= lr * g_w1b0
+        w1b[1] -= lr * g_w1b1
+        b2[0] -= lr * delta2
+        w2[0] -= lr * g_w20
+        w2[1] -= lr * g_w21
+
+        if keep_grads:
+            self.x = [x0, x1]
+            self.z1 = [z10, z11]
+            self.a1 = [a0, a1]
+            self.z2 = [z2]
+            self.dW1 = [[g_w1a0, g_w1a1], [g_w1b0, g_w1b1]]
+            self.db1 = [d0, d1]
+            self.dW2 = [[g_w20, g_w21]]
+            self.db2 = [delta2]
+        return loss
+
     def predict(self, x: List[float]) -> float:
         """
         Realiza una predicción para la entrada x.
@@ -130,3 +219,31 @@ class MLP221:
             Predicción de la red (igual que forward)
         """
         return self.forward(x)
+
+    def get_params(self) -> List[float]:
+        """
+        Devuelve los 9 parámetros aplanados.
+
+        Orden: W1[0][0], W1[0][1], W1[1][0], W1[1][1], b1[0], b1[1],
+        W2[0][0], W2[0][1], b2[0].
+        """
+        return [
+            self.W1[0][0], self.W1[0][1], self.W1[1][0], self.W1[1][1],
+            self.b1[0], self.b1[1],
+            self.W2[0][0], self.W2[0][1], self.b2[0],
+        ]
+
+    def set_params(self, params: Sequence[float]) -> None:
+        """
+        Carga los 9 parámetros aplanados en el orden de ``get_params``.
+
+        Args:
+            params: Secuencia de 9 valores
+        """
+        if len(params) != 9:
+            raise ValueError("Se esperaban 9 parámetros")
+        p = [float(v) for v in params]
+        self.W1 = [[p[0], p[1]], [p[2], p[3]]]
+        self.b1 = [p[4], p[5]]
+        self.W2 = [[p[6], p[7]]]
+        self.b2 = [p[8]]
@@ -0,0 +1,306 @@
+"""Inferencia cuantizada en enteros (int8 o punto fijo de 16 bits) para ``MLP221``.
+
+Cuantización posterior al entrenamiento, simétrica y con una escala por tensor:
+
+- ``W1`` y ``W2`` pasan a enteros con signo de ``bits`` bits
+  (``escala = max|W| / (2^(bits-1) - 1)``);
+- las entradas se cuantizan igual con la escala de ``input_range``;
+- ``b1`` y ``b2`` se guardan como enteros anchos en la escala del acumulador
+  (``s_x·s_W1`` y ``s_W2·s_a``), así se suman sin reescalar;
+- las activaciones ocultas y la salida son enteros sin signo de ``bits`` bits
+  (``a = q / (2^bits - 1)``).
+
+La sigmoide es una tabla (LUT) de ``2^lut_bits`` entradas sobre
+``[-z_range, z_range)``; fuera de ese intervalo satura. El paso del acumulador
+al índice de la tabla usa un multiplicador de punto fijo (``m / 2^shift``,
+entero por entero y desplazamiento con redondeo), así que ninguna operación
+entre la entrada cuantizada y la salida usa flotantes.
+
+``QuantizedMLP221.predict`` hace la pasada con enteros de Python y
+``predict_batch_q`` la misma con NumPy sobre lotes, con resultados idénticos
+bit a bit. En int8 los acumuladores tienen un rango acotado (unos 10^5
+valores), así que el multiplicador, el redondeo y la tabla se precalculan en una
+tabla por capa indexada directamente por el acumulador: cada activación cuesta
+una suma de productos int32 y un acceso a memoria. ``quantization_report``
+compara con la red en float64 sobre ``DATA`` y una grilla densa.
+
+Requiere NumPy. Ejecutar ``python -m core.quantized`` imprime el reporte y mide
+el rendimiento.
+"""
+
+import argparse
+import math
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .activations import sigmoid
+from .model import MLP221
+
+BITS = (8, 16)
+_MULT_BITS = 23  # precisión de los multiplicadores de punto fijo (sin desbordar int64)
+_MAX_FUSED = 1 << 22  # entradas máximas de una tabla fusionada
+
+
+def _fixed_multiplier(real: float) -> Tuple[int, int]:
+    """Aproxima ``real > 0`` como ``m / 2**shift`` con ``m`` de ``_MULT_BITS`` bits."""
+
+    if real <= 0.0:
+        return 0, 0
+    fraction, exponent = math.frexp(real)  # real = fraction · 2^exponent, fraction en [0.5, 1)
+    m = round(fraction * (1 << _MULT_BITS))
+    shift = _MULT_BITS - exponent
+    if m == 1 << _MULT_BITS:
+        m >>= 1
+        shift -= 1
+    if shift < 1:
+        return m << (1 - shift), 1
+    return m, shift
+
+
+def _scale(values: Sequence[float], qmax: int) -> float:
+    peak = max(abs(v) for v in values)
+    return peak / qmax if peak > 0.0 else 1.0
+
+
+class QuantizedMLP221:
+    """Red 2-2-1 con pesos enteros, escalas por tensor y sigmoide por tabla."""
+
+    def __init__(
+        self,
+        net: MLP221,
+        bits: int = 8,
+        lut_bits: int = 10,
+        z_range: float = 8.0,
+        input_range: float = 1.0,
+    ):
+        """
+        Parámetros:
+            net: Red entrenada (se leen sus pesos una vez)
+            bits: 8 (int8) o 16 (punto fijo int16) para pesos, entradas y activaciones
+            lut_bits: La tabla de la sigmoide tiene ``2^lut_bits`` entradas
+            z_range: La tabla cubre ``[-z_range, z_range)``; fuera satura
+            input_range: Máximo ``|x|`` representable en las entradas
+        """
+        if bits not in BITS:
+            raise ValueError(f"bits debe ser uno de {BITS}")
+        if not 4 <= lut_bits <= 16:
+            raise ValueError("lut_bits debe estar entre 4 y 16")
+        self.bits = bits
+        self.lut_bits = lut_bits
+        self.z_range = z_range
+        self.qmax = (1 << (bits - 1)) - 1  # enteros con signo: pesos y entradas
+        self.amax = (1 << bits) - 1  # enteros sin signo: activaciones
+
+        W1 = [w for row in net.W1 for w in row]
+        W2 = list(net.W2[0])
+        self.s_x = input_range / self.qmax
+        self.s_w1 = _scale(W1, self.qmax)
+        self.s_w2 = _scale(W2, self.qmax)
+        self.w1 = [round(w / self.s_w1) for w in W1]  # W1[0][0], W1[0][1], W1[1][0], W1[1][1]
+        self.w2 = [round(w / self.s_w2) for w in W2]
+        acc1 = self.s_x * self.s_w1
+        acc2 = self.s_w2 / self.amax
+        self.b1 = [round(b / acc1) for b in net.b1]
+        self.b2 = round(net.b2[0] / acc2)
+
+        size = 1 << lut_bits
+        self._half = size // 2
+        per_unit = size / (2.0 * z_range)  # índices de la tabla por unidad de z
+        self.lut = [
+            round(sigmoid((i - self._half) / per_unit) * self.amax) for i in range(size)
+        ]
+        self.m1, self.shift1 = _fixed_multiplier(acc1 * per_unit)
+        self.m2, self.shift2 = _fixed_multiplier(acc2 * per_unit)
+
+        dtype = np.int8 if bits == 8 else np.int16
+        self._w1 = np.array(self.w1, dtype=dtype).reshape(2, 2)
+        self._w2 = np.array(self.w2, dtype=dtype)
+        self._b1 = np.array(self.b1, dtype=np.int64)
+        self._lut = np.array(self.lut, dtype=np.uint8 if bits == 8 else np.uint16)
+        self._fused = self._fuse() if bits == 8 else None
+
+    def _fuse(self):
+        """
+        Tablas acumulador → activación de cada capa (solo int8), con su desplazamiento.
+
+        Devuelve None si alguna tabla superaría ``_MAX_FUSED`` entradas (sesgos
+        enormes frente a los pesos); entonces se usa el camino general.
+        """
+        reach1 = 2 * self.qmax * max(abs(w) for w in self.w1)
+        low1 = min(self.b1) - reach1
+        high1 = max(self.b1) + reach1
+        reach2 = self.amax * sum(abs(w) for w in self.w2)
+        low2 = self.b2 - reach2
+        high2 = self.b2 + reach2
+        if max(high1 - low1, high2 - low2) >= _MAX_FUSED:
+            return None
+        acc1 = np.arange(low1, high1 + 1, dtype=np.int64)
+        acc2 = np.arange(low2, high2 + 1, dtype=np.int64)
+        return (
+            self._lookup(acc1, self.m1, self.shift1), [b - low1 for b in self.b1],
+            self._lookup(acc2, self.m2, self.shift2), self.b2 - low2,
+        )
+
+    def _index(self, acc: int, m: int, shift: int) -> int:
+        i = ((acc * m + (1 << (shift - 1))) >> shift) + self._half
+        return 0 if i < 0 else (len(self.lut) - 1 if i >= len(self.lut) else i)
+
+    def quantize_input(self, x: Sequence[float]) -> List[int]:
+        """Entrada ``[x1, x2]`` en enteros con la escala de ``input_range`` (satura)."""
+
+        q = self.qmax
+        return [max(-q, min(q, round(v / self.s_x))) for v in x]
+
+    def predict_q(self, xq: Sequence[int]) -> int:
+        """Salida entera en ``[0, 2^bits - 1]`` para una entrada ya cuantizada."""
+
+        w, lut = self.w1, self.lut
+        a0 = lut[self._index(self.b1[0] + w[0] * xq[0] + w[1] * xq[1], self.m1, self.shift1)]
+        a1 = lut[self._index(self.b1[1] + w[2] * xq[0] + w[3] * xq[1], self.m1, self.shift1)]
+        acc = self.b2 + self.w2[0] * a0 + self.w2[1] * a1
+        return lut[self._index(acc, self.m2, self.shift2)]
+
+    def predict(self, x: Sequence[float]) -> float:
+        """Probabilidad de la clase 1 (misma interfaz que ``MLP221.predict``)."""
+
+        return self.predict_q(self.quantize_input(x)) / self.amax
+
+    def quantize_inputs(self, X) -> np.ndarray:
+        """Lote ``(B, 2)`` de flotantes a enteros de ``bits`` bits (satura)."""
+
+        X = np.asarray(X, dtype=np.float64).reshape(-1, 2)
+        q = np.clip(np.rint(X / self.s_x), -self.qmax, self.qmax)
+        return q.astype(self._w1.dtype)
+
+    def _lookup(self, acc: np.ndarray, m: int, shift: int) -> np.ndarray:
+        idx = ((acc * m + (1 << (shift - 1))) >> shift) + self._half
+        return self._lut[np.clip(idx, 0, len(self.lut) - 1)]
+
+    def predict_batch_q(self, Xq: np.ndarray) -> np.ndarray:
+        """Salidas enteras ``(B,)`` (uint8 o uint16) para un lote ya cuantizado."""
+
+        if self._fused is not None:
+            table1, (b10, b11), table2, b2 = self._fused
+            Xq = np.asarray(Xq).reshape(-1, 2)
+            x0 = Xq[:, 0].astype(np.int32)
+            x1 = Xq[:, 1].astype(np.int32)
+            w1, w2 = self.w1, self.w2
+            a0 = table1[x0 * w1[0] + x1 * w1[1] + b10].astype(np.int32)
+            a1 = table1[x0 * w1[2] + x1 * w1[3] + b11].astype(np.int32)
+            return table2[a0 * w2[0] + a1 * w2[1] + b2]
+        Xq = np.asarray(Xq).reshape(-1, 2).astype(np.int64)
+        acc1 = Xq @ self._w1.T.astype(np.int64) + self._b1
+        a = self._lookup(acc1, self.m1, self.shift1).astype(np.int64)
+        acc2 = a @ self._w2.astype(np.int64) + self.b2
+        return self._lookup(acc2, self.m2, self.shift2)
+
+    def predict_batch(self, X) -> np.ndarray:
+        """Probabilidades ``(B,)`` en float64 para un lote ``X (B, 2)``."""
+
+        return self.predict_batch_q(self.quantize_inputs(X)) / self.amax
+
+    def nbytes(self) -> int:
+        """Bytes de pesos, sesgos, tabla de la sigmoide y tablas fusionadas (int8)."""
+
+        fused = 0 if self._fused is None else self._fused[0].nbytes + self._fused[2].nbytes
+        return self._w1.nbytes + self._w2.nbytes + 3 * 8 + self._lut.nbytes + fused
+
+
+class QuantReport(NamedTuple):
+    """Comparación de la red cuantizada con la red en float64."""
+
+    bits: int
+    data_max_error: float
+    data_mean_error: float
+    data_agreement: float  # fracción de DATA con la misma decisión (umbral 0.5)
+    grid_max_error: float
+    grid_mean_error: float
+    grid_agreement: float
+    grid_points: int
+
+    def to_markdown(self) -> str:
+        return "\n".join([
+            "| conjunto | error máx. | error medio | misma decisión |",
+            "|---|---:|---:|---:|",
+            f"| DATA (int{self.bits}) | {self.data_max_error:.2e} | {self.data_mean_error:.2e} "
+            f"| {self.data_agreement * 100:.2f}% |",
+            f"| grilla {self.grid_points} puntos (int{self.bits}) | {self.grid_max_error:.2e} "
+            f"| {self.grid_mean_error:.2e} | {self.grid_agreement * 100:.2f}% |",
+        ])
+
+
+def _compare(q: QuantizedMLP221, net: MLP221, X: np.ndarray) -> Tuple[float, float, float]:
+    from .vectorized import BatchedMLP221
+
+    reference = BatchedMLP221.from_nets([net]).predict(X)[0]
+    quantized = q.predict_batch(X)
+    error = np.abs(quantized - reference)
+    agreement = float(np.mean((quantized > 0.5) == (reference > 0.5)))
+    return float(error.max()), float(error.mean()), agreement
+
+
+def quantization_report(
+    net: MLP221,
+    q: Optional[QuantizedMLP221] = None,
+    resolution: int = 201,
+    low: float = -0.5,
+    high: float = 1.5,
+) -> QuantReport:
+    """
+    Compara ``q`` (por defecto int8 con ``input_range`` que cubre la grilla)
+    con ``net`` sobre ``DATA`` y sobre una grilla ``resolution × resolution``.
+    """
+    from data.xor import DATA
+
+    if q is None:
+        q = QuantizedMLP221(net, input_range=max(abs(low), abs(high)))
+    axis = np.linspace(low, high, resolution)
+    grid = np.stack(np.meshgrid(axis, axis), axis=-1).reshape(-1, 2)
+    data = np.array([x for x, _ in DATA], dtype=np.float64)
+    return QuantReport(q.bits, *_compare(q, net, data), *_compare(q, net, grid), len(grid))
+
+
+if __name__ == "__main__":
+    from core.initializers import SCHEMES
+    from trainer.train import train
+    from .vectorized import BatchedMLP221
+
+    parser = argparse.ArgumentParser(description="Reporte de precisión y rendimiento int8/int16")
+    parser.add_argument("--train", type=int, default=3000, help="Épocas antes de cuantizar")
+    parser.add_argument("--lr", type=float, default=0.5)
+    parser.add_argument("--init", choices=SCHEMES, default="fixed")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--lut-bits", type=int, default=10)
+    parser.add_argument("--resolution", type=int, default=201)
+    parser.add_argument("--batch", type=int, default=1 << 20, help="Muestras del benchmark")
+    args = parser.parse_args()
+
+    net = MLP221(init=args.init, seed=args.seed)
+    train(net, epochs=args.train, lr=args.lr)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(-0.5, 1.5, size=(args.batch, 2))
+
+    def timed(fn, *call) -> float:
+        fn(*call)  # calentamiento
+        start = time.perf_counter()
+        fn(*call)
+        return time.perf_counter() - start
+
+    reference = BatchedMLP221.from_nets([net])
+    print("| motor | muestras/s | bytes por entrada |\n|---|---:|---:|")
+    rate = args.batch / timed(reference.predict, X)
+    print(f"| float64 (BatchedMLP221) | {rate:.3e} | 16 |")
+    for bits in BITS:
+        q = QuantizedMLP221(net, bits, args.lut_bits, input_range=1.5)
+        Xq = q.quantize_inputs(X)
+        print(f"| int{bits} (predict_batch_q) | {args.batch / timed(q.predict_batch_q, Xq):.3e} "
+              f"| {Xq.itemsize * 2} |")
+        assert all(q.predict_q(xq) == out for xq, out in zip(Xq[:2000].tolist(),
+                                                               q.predict_batch_q(Xq[:2000])))
+
+    for bits in BITS:
+        q = QuantizedMLP221(net, bits, args.lut_bits, input_range=1.5)
+        print(f"\nint{bits}: {q.nbytes()} bytes de modelo")
+        print(quantization_report(net, q, args.resolution).to_markdown())
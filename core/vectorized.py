@@ -0,0 +1,267 @@
+"""Población vectorizada de redes 2-2-1 con precisión configurable (NumPy).
+
+``BatchedMLP221`` guarda P redes como una matriz ``(P, 9)`` de parámetros (en el
+orden de ``MLP221.get_params``) y evalúa todas a la vez sobre un lote de
+entradas. Los parámetros y activaciones usan ``dtype`` (float64 o float32, para
+ahorrar ancho de banda de memoria), mientras que la pérdida BCE se acumula
+siempre en float64.
+
+Requiere NumPy. Ejecutar ``python -m core.vectorized`` compara ambos dtypes con
+la ``MLP221`` de referencia y mide rendimiento y memoria.
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .model import MLP221
+
+DTYPES = ("float64", "float32")
+
+
+def sigmoid(z: np.ndarray) -> np.ndarray:
+    """Sigmoide estable elemento a elemento (misma formulación dual que la escalar)."""
+
+    e = np.exp(-np.abs(z))
+    return np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e)).astype(z.dtype, copy=False)
+
+
+def bce(yhat: np.ndarray, y: np.ndarray, eps: float = 1e-12) -> np.ndarray:
+    """BCE elemento a elemento calculada en float64 (independiente del dtype de entrada)."""
+
+    yhat = np.clip(np.asarray(yhat, dtype=np.float64), eps, 1.0 - eps)
+    y = np.asarray(y, dtype=np.float64)
+    return -(y * np.log(yhat) + (1.0 - y) * np.log(1.0 - yhat))
+
+
+class BatchedMLP221:
+    """
+    P redes 2-2-1 independientes entrenadas con operaciones vectorizadas.
+
+    Los objetivos ``Y`` pueden ser compartidos (forma ``(B,)``) o propios de
+    cada red (forma ``(P, B)``).
+
+    Args:
+        params: Matriz ``(P, 9)`` (o vector de 9) de parámetros iniciales
+        dtype: "float64" o "float32" para parámetros y activaciones
+    """
+
+    def __init__(self, params, dtype: str = "float64"):
+        if str(np.dtype(dtype)) not in DTYPES:
+            raise ValueError(f"dtype no soportado: {dtype!r}")
+        self.dtype = np.dtype(dtype)
+        self.params = np.array(params, dtype=self.dtype).reshape(-1, 9)
+
+    @classmethod
+    def from_nets(cls, nets: Iterable, dtype: str = "float64") -> "BatchedMLP221":
+        """Apila los parámetros de varias redes (``MLP221`` o compatibles)."""
+
+        return cls([net.get_params() for net in nets], dtype)
+
+    @classmethod
+    def from_seeds(
+        cls, seeds: Iterable[int], scheme: str = "xavier", dtype: str = "float64"
+    ) -> "BatchedMLP221":
+        """Crea una red por semilla con el esquema de inicialización indicado."""
+
+        return cls.from_nets((MLP221(init=scheme, seed=s) for s in seeds), dtype)
+
+    @property
+    def size(self) -> int:
+        """Cantidad de redes de la población."""
+
+        return self.params.shape[0]
+
+    def to_net(self, index: int) -> MLP221:
+        """Devuelve la red ``index`` como una ``MLP221`` en float64."""
+
+        net = MLP221()
+        net.set_params(self.params[index].astype(np.float64).tolist())
+        return net
+
+    def _inputs(self, X, Y=None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        X = np.asarray(X, dtype=self.dtype).reshape(-1, 2)
+        if Y is None:
+            return X, None
+        Y = np.asarray(Y, dtype=self.dtype)
+        if Y.ndim == 1:
+            Y = np.broadcast_to(Y, (self.size, Y.shape[0]))
+        return X, Y
+
+    def _forward(self, X: np.ndarray):
+        p = self.params
+        x0 = X[:, 0][None, :]
+        x1 = X[:, 1][None, :]
+        a0 = sigmoid(p[:, 4:5] + p[:, 0:1] * x0 + p[:, 1:2] * x1)
+        a1 = sigmoid(p[:, 5:6] + p[:, 2:3] * x0 + p[:, 3:4] * x1)
+        yhat = sigmoid(p[:, 8:9] + p[:, 6:7] * a0 + p[:, 7:8] * a1)
+        return a0, a1, yhat
+
+    def predict(self, X) -> np.ndarray:
+        """Predicciones ``(P, B)`` de todas las redes para el lote ``X (B, 2)``."""
+
+        X, _ = self._inputs(X)
+        return self._forward(X)[2]
+
+    def losses(self, X, Y) -> np.ndarray:
+        """Pérdida BCE media por red, en float64."""
+
+        X, Y = self._inputs(X, Y)
+        return bce(self._forward(X)[2], Y).mean(axis=1)
+
+    def gradients(self, X, Y) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gradientes medios sobre el lote completo.
+
+        Returns:
+            Tupla (gradientes ``(P, 9)`` en ``dtype``, pérdidas ``(P,)`` en float64)
+        """
+        X, Y = self._inputs(X, Y)
+        p = self.params
+        a0, a1, yhat = self._forward(X)
+        x0 = X[:, 0][None, :]
+        x1 = X[:, 1][None, :]
+        delta2 = yhat - Y
+        d0 = p[:, 6:7] * delta2 * (a0 * (1.0 - a0))
+        d1 = p[:, 7:8] * delta2 * (a1 * (1.0 - a1))
+        grads = np.stack(
+            [
+                (d0 * x0).mean(axis=1), (d0 * x1).mean(axis=1),
+                (d1 * x0).mean(axis=1), (d1 * x1).mean(axis=1),
+                d0.mean(axis=1), d1.mean(axis=1),
+                (delta2 * a0).mean(axis=1), (delta2 * a1).mean(axis=1),
+                delta2.mean(axis=1),
+            ],
+            axis=1,
+        )
+        return grads, bce(yhat, Y).mean(axis=1)
+
+    def _rates(self, lr) -> np.ndarray:
+        """LR escalar o uno por red (forma ``(P,)``) en el dtype de la población."""
+
+        lr = np.asarray(lr, dtype=self.dtype)
+        if lr.ndim and lr.shape != (self.size,):
+            raise ValueError("lr debe ser un escalar o un vector con un valor por red")
+        return lr
+
+    def gd_step(self, X, Y, lr) -> np.ndarray:
+        """Un paso de descenso por lote completo; devuelve las pérdidas previas."""
+
+        grads, losses = self.gradients(X, Y)
+        lr = self._rates(lr)
+        self.params -= (lr[:, None] if lr.ndim else lr) * grads
+        return losses
+
+    def sgd_epoch(self, X, Y, lr) -> np.ndarray:
+        """
+        Una época de SGD muestra a muestra, vectorizada sobre la población.
+
+        Recorre las muestras en orden como ``trainer.train`` y actualiza las P
+        redes a la vez, así que en float64 sigue la misma trayectoria que entrenar
+        cada ``MLP221`` por separado. ``lr`` puede ser un escalar o un vector
+        ``(P,)`` con un LR por red.
+
+        Returns:
+            Pérdida media de la época por red, en float64
+        """
+        X, Y = self._inputs(X, Y)
+        p = self.params
+        lr = self._rates(lr)
+        total = np.zeros(self.size, dtype=np.float64)
+        for k in range(X.shape[0]):
+            x0 = X[k, 0]
+            x1 = X[k, 1]
+            y = Y[:, k]
+            a0 = sigmoid(p[:, 4] + p[:, 0] * x0 + p[:, 1] * x1)
+            a1 = sigmoid(p[:, 5] + p[:, 2] * x0 + p[:, 3] * x1)
+            yhat = sigmoid(p[:, 8] + p[:, 6] * a0 + p[:, 7] * a1)
+            total += bce(yhat, y)
+
+            delta2 = yhat - y
+            d0 = (p[:, 6] * delta2) * (a0 * (1.0 - a0))
+            d1 = (p[:, 7] * delta2) * (a1 * (1.0 - a1))
+            p[:, 4] -= lr * d0
+            p[:, 0] -= lr * (d0 * x0)
+            p[:, 1] -= lr * (d0 * x1)
+            p[:, 5] -= lr * d1
+            p[:, 2] -= lr * (d1 * x0)
+            p[:, 3] -= lr * (d1 * x1)
+            p[:, 8] -= lr * delta2
+            p[:, 6] -= lr * (delta2 * a0)
+            p[:, 7] -= lr * (delta2 * a1)
+        return total / X.shape[0]
+
+
+def parity_report(seeds: Sequence[int] = range(8), epochs: int = 2000, lr: float = 0.5):
+    """
+    Compara la población vectorizada con ``MLP221`` entrenada red a red.
+
+    Returns:
+        Diccionario ``{dtype: (máx. error absoluto en pérdidas, en parámetros)}``
+    """
+    from data.xor import DATA
+    from trainer.train import train
+
+    X = np.array([x for x, _ in DATA])
+    Y = np.array([y for _, y in DATA])
+    ref_losses, ref_params = [], []
+    for seed in seeds:
+        net = MLP221(init="xavier", seed=seed)
+        ref_losses.append(list(train(net, epochs=epochs, lr=lr)))
+        ref_params.append(net.get_params())
+    ref_losses = np.array(ref_losses)
+    ref_params = np.array(ref_params)
+
+    report = {}
+    for dtype in DTYPES:
+        pop = BatchedMLP221.from_seeds(seeds, "xavier", dtype)
+        losses = np.stack([pop.sgd_epoch(X, Y, lr) for _ in range(epochs)], axis=1)
+        report[dtype] = (
+            float(np.abs(losses - ref_losses).max()),
+            float(np.abs(pop.params.astype(np.float64) - ref_params).max()),
+        )
+    return report
+
+
+def benchmark(population: int = 4096, batch: int = 65536, steps: int = 20) -> None:
+    """Mide throughput y memoria pico de ``gd_step`` para cada dtype."""
+
+    rng = np.random.default_rng(0)
+    X = rng.random((batch, 2))
+    Y = (np.round(X[:, 0]) != np.round(X[:, 1])).astype(np.float64)
+    print("| dtype | pasos/s | redes·muestras/s | memoria pico (MiB) |")
+    print("|---|---:|---:|---:|")
+    for dtype in DTYPES:
+        pop = BatchedMLP221(rng.normal(size=(population, 9)), dtype)
+        Xd = X.astype(dtype)
+        Yd = Y.astype(dtype)
+        pop.gd_step(Xd[:1024], Yd[:1024], 0.5)  # calentamiento
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(steps):
+            pop.gd_step(Xd, Yd, 0.5)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        rate = steps / elapsed
+        print(
+            f"| {dtype} | {rate:.2f} | {rate * population * batch:.3e} "
+            f"| {peak / 2**20:.1f} |"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Paridad y benchmark de precisión")
+    parser.add_argument("--population", type=int, default=1024)
+    parser.add_argument("--batch", type=int, default=16384)
+    parser.add_argument("--steps", type=int, default=10)
+    args = parser.parse_args()
+
+    print("| dtype | máx. error pérdidas | máx. error parámetros |\n|---|---:|---:|")
+    for dtype, (loss_err, param_err) in parity_report().items():
+        print(f"| {dtype} | {loss_err:.3e} | {param_err:.3e} |")
+    print()
+    benchmark(args.population, args.batch, args.steps)
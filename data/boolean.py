@@ -0,0 +1,41 @@
+"""Las 16 funciones booleanas de dos entradas como tablas de verdad.
+
+Las filas siguen el orden de ``data.xor.DATA`` (``[0,0]``, ``[0,1]``, ``[1,0]``,
+``[1,1]``) y cada función es la tupla de sus 4 salidas. ``A`` es la primera
+entrada y ``B`` la segunda. La misma red 2-2-1 puede aprender cualquiera de
+ellas; ``trainer.boolean`` entrena las 16 juntas en una sola llamada compilada.
+"""
+
+from typing import Dict, List, Tuple
+
+from data.xor import DATA
+
+INPUTS: List[list] = [x for x, _ in DATA]
+
+FUNCTIONS: Dict[str, Tuple[float, float, float, float]] = {
+    "FALSE": (0.0, 0.0, 0.0, 0.0),
+    "AND": (0.0, 0.0, 0.0, 1.0),
+    "A_AND_NOT_B": (0.0, 0.0, 1.0, 0.0),
+    "A": (0.0, 0.0, 1.0, 1.0),
+    "NOT_A_AND_B": (0.0, 1.0, 0.0, 0.0),
+    "B": (0.0, 1.0, 0.0, 1.0),
+    "XOR": (0.0, 1.0, 1.0, 0.0),
+    "OR": (0.0, 1.0, 1.0, 1.0),
+    "NOR": (1.0, 0.0, 0.0, 0.0),
+    "XNOR": (1.0, 0.0, 0.0, 1.0),
+    "NOT_B": (1.0, 0.0, 1.0, 0.0),
+    "A_OR_NOT_B": (1.0, 0.0, 1.0, 1.0),
+    "NOT_A": (1.0, 1.0, 0.0, 0.0),
+    "NOT_A_OR_B": (1.0, 1.0, 0.0, 1.0),
+    "NAND": (1.0, 1.0, 1.0, 0.0),
+    "TRUE": (1.0, 1.0, 1.0, 1.0),
+}
+
+
+def truth_table(name: str) -> List[Tuple[list, float]]:
+    """Muestras ``([x1, x2], y)`` de la función ``name`` (sin distinguir mayúsculas)."""
+
+    key = name.upper()
+    if key not in FUNCTIONS:
+        raise ValueError(f"Función booleana desconocida {name!r}; opciones: {', '.join(FUNCTIONS)}")
+    return [(list(x), y) for x, y in zip(INPUTS, FUNCTIONS[key])]
@@ -0,0 +1,274 @@
+"""Conjuntos de datos intercambiables para entrenar y exportar la MLP.
+
+Un ``Dataset`` es una secuencia de muestras ``([x1, x2], y)`` que se recorre por
+bloques (*chunks*) de ``chunk_size`` muestras. Los conjuntos generados producen
+cada bloque bajo demanda a partir de una semilla, y los ``.npy`` se leen con
+``mmap``, de modo que el bucle de entrenamiento puede recorrer millones de
+muestras sin materializarlas nunca como listas de Python.
+"""
+
+import hashlib
+import random
+from abc import ABC, abstractmethod
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from data.xor import DATA
+
+Sample = Tuple[List[float], float]
+
+
+class Dataset(ABC):
+    """Interfaz común: longitud, acceso por bloques e iteración en streaming."""
+
+    name = "dataset"
+    n_inputs = 2
+    chunk_size = 4096
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Cantidad de muestras."""
+
+    @abstractmethod
+    def chunk(self, index: int) -> List[Sample]:
+        """Devuelve las muestras ``[index * chunk_size, (index + 1) * chunk_size)``."""
+
+    @property
+    def num_chunks(self) -> int:
+        """Cantidad de bloques del conjunto."""
+
+        return -(-len(self) // self.chunk_size)
+
+    def iter_chunks(self, start: int = 0, stop: Optional[int] = None) -> Iterator[List[Sample]]:
+        """Recorre los bloques ``start..stop-1`` generándolos de a uno."""
+
+        stop = self.num_chunks if stop is None else min(stop, self.num_chunks)
+        for index in range(start, stop):
+            yield self.chunk(index)
+
+    def iter_range(self, start: int, stop: int) -> Iterator[Sample]:
+        """Recorre las muestras ``start..stop-1`` generando solo los bloques necesarios."""
+
+        size = self.chunk_size
+        for index in range(start // size, -(-stop // size)):
+            base = index * size
+            block = self.chunk(index)
+            yield from block[max(start - base, 0):stop - base]
+
+    def __iter__(self) -> Iterator[Sample]:
+        for block in self.iter_chunks():
+            yield from block
+
+    def fingerprint(self) -> str:
+        """Resumen SHA-256 del contenido; identifica el conjunto en cachés de resultados.
+
+        Por defecto recorre todas las muestras. Los conjuntos que se derivan de
+        unos pocos parámetros lo redefinen para no generarlas.
+        """
+
+        digest = hashlib.sha256(f"{type(self).__name__}:{self.n_inputs}".encode())
+        for block in self.iter_chunks():
+            digest.update(repr(block).encode())
+        return digest.hexdigest()
+
+
+class ListDataset(Dataset):
+    """Conjunto en memoria a partir de una lista de muestras."""
+
+    def __init__(self, samples: Sequence[Sample], name: str = "lista"):
+        self.samples = list(samples)
+        self.name = name
+        self.n_inputs = len(self.samples[0][0]) if self.samples else 2
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def chunk(self, index: int) -> List[Sample]:
+        start = index * self.chunk_size
+        return self.samples[start:start + self.chunk_size]
+
+    def __iter__(self) -> Iterator[Sample]:
+        return iter(self.samples)
+
+
+# Conjunto XOR clásico de 4 filas; es el valor por defecto en todo el proyecto.
+XOR = ListDataset(DATA, name="xor")
+
+
+class _GeneratedDataset(Dataset):
+    """Base de los conjuntos sintéticos: cada bloque tiene su propia semilla.
+
+    Sembrar por bloque permite regenerar cualquier bloque de forma independiente
+    (útil para repartir el conjunto entre procesos) y garantiza que cada época
+    vea exactamente las mismas muestras.
+    """
+
+    def __init__(self, size: int, seed: int = 0):
+        if size <= 0:
+            raise ValueError("El tamaño del conjunto debe ser positivo")
+        self.size = size
+        self.seed = seed
+
+    def __len__(self) -> int:
+        return self.size
+
+    def chunk(self, index: int) -> List[Sample]:
+        start = index * self.chunk_size
+        stop = min(start + self.chunk_size, self.size)
+        rng = random.Random(f"{self.name}:{self.seed}:{index}")
+        return [self._sample(i, rng) for i in range(start, stop)]
+
+    @abstractmethod
+    def _sample(self, i: int, rng: random.Random) -> Sample:
+        """Muestra ``i`` generada con ``rng`` (ya sembrado para su bloque)."""
+
+    def fingerprint(self) -> str:
+        # El contenido queda determinado por la clase y sus parámetros
+        params = sorted(vars(self).items())
+        return hashlib.sha256(f"{type(self).__name__}:{params!r}".encode()).hexdigest()
+
+
+class NoisyXOR(_GeneratedDataset):
+    """Filas XOR repetidas con ruido gaussiano en las entradas y etiquetas volteadas."""
+
+    name = "noisy-xor"
+
+    def __init__(self, size: int = 4096, noise: float = 0.1, flip: float = 0.0, seed: int = 0):
+        super().__init__(size, seed)
+        self.noise = noise
+        self.flip = flip
+
+    def _sample(self, i: int, rng: random.Random) -> Sample:
+        x, y = DATA[i % len(DATA)]
+        x = [x[0] + rng.gauss(0.0, self.noise), x[1] + rng.gauss(0.0, self.noise)]
+        if self.flip and rng.random() < self.flip:
+            y = 1.0 - y
+        return x, y
+
+
+class XORClouds(_GeneratedDataset):
+    """Nubes gaussianas continuas alrededor de las 4 esquinas, etiquetadas con XOR."""
+
+    name = "clouds"
+
+    def __init__(self, size: int = 1_000_000, sigma: float = 0.2, seed: int = 0):
+        super().__init__(size, seed)
+        self.sigma = sigma
+
+    def _sample(self, i: int, rng: random.Random) -> Sample:
+        corner = rng.randrange(4)
+        x, y = DATA[corner]
+        return [rng.gauss(x[0], self.sigma), rng.gauss(x[1], self.sigma)], y
+
+
+class Parity(Dataset):
+    """Las 2**n combinaciones de n bits con su paridad; con n=2 coincide con XOR.
+
+    Las filas se derivan del índice, así que no se guardan. Solo ``n_bits=2`` es
+    compatible con la arquitectura 2-2-1.
+    """
+
+    name = "parity"
+
+    def __init__(self, n_bits: int = 2):
+        if n_bits < 1:
+            raise ValueError("n_bits debe ser al menos 1")
+        self.n_bits = n_bits
+        self.n_inputs = n_bits
+
+    def __len__(self) -> int:
+        return 1 << self.n_bits
+
+    def chunk(self, index: int) -> List[Sample]:
+        start = index * self.chunk_size
+        stop = min(start + self.chunk_size, len(self))
+        n = self.n_bits
+        samples = []
+        for i in range(start, stop):
+            bits = [float((i >> (n - 1 - b)) & 1) for b in range(n)]
+            samples.append((bits, float(bin(i).count("1") & 1)))
+        return samples
+
+    def fingerprint(self) -> str:
+        return hashlib.sha256(f"parity:{self.n_bits}".encode()).hexdigest()
+
+
+class NpyDataset(Dataset):
+    """Conjunto leído con ``mmap`` desde un ``.npy`` de forma ``(N, n_inputs + 1)``.
+
+    La última columna es la etiqueta. Requiere NumPy.
+    """
+
+    def __init__(self, path: str):
+        import numpy as np
+
+        self.path = path
+        self.name = path
+        self.array = np.load(path, mmap_mode="r")
+        if self.array.ndim != 2 or self.array.shape[1] < 2:
+            raise ValueError("Se esperaba un arreglo (N, n_inputs + 1)")
+        self.n_inputs = self.array.shape[1] - 1
+
+    def __len__(self) -> int:
+        return self.array.shape[0]
+
+    def __getstate__(self):
+        # Al enviarlo a otro proceso se reabre el archivo en vez de copiarlo
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def chunk(self, index: int) -> List[Sample]:
+        start = index * self.chunk_size
+        rows = self.array[start:start + self.chunk_size].tolist()
+        return [(row[:-1], row[-1]) for row in rows]
+
+    def fingerprint(self) -> str:
+        # Hash de los bytes del archivo en bloques: no hace falta convertir filas
+        digest = hashlib.sha256()
+        with open(self.path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+
+def save_npy(dataset: Dataset, path: str) -> None:
+    """Vuelca un conjunto a ``.npy`` bloque a bloque (sin cargarlo entero)."""
+
+    import numpy as np
+
+    out = np.lib.format.open_memmap(
+        path, mode="w+", dtype=np.float64, shape=(len(dataset), dataset.n_inputs + 1)
+    )
+    row = 0
+    for block in dataset.iter_chunks():
+        out[row:row + len(block)] = [x + [y] for x, y in block]
+        row += len(block)
+    out.flush()
+    del out
+
+
+def load_dataset(spec: str) -> Dataset:
+    """
+    Construye un conjunto a partir de una especificación de texto.
+
+    Formatos: ``xor``, ``noisy-xor[:N]``, ``clouds[:N]``, ``parity[:BITS]``,
+    ``bool:FUNCIÓN`` (una de las 16 de ``data.boolean``, p. ej. ``bool:nand``)
+    o una ruta a un archivo ``.npy``.
+    """
+    if spec.endswith(".npy"):
+        return NpyDataset(spec)
+    name, _, arg = spec.partition(":")
+    if name == "xor":
+        return XOR
+    if name == "noisy-xor":
+        return NoisyXOR(int(arg)) if arg else NoisyXOR()
+    if name == "clouds":
+        return XORClouds(int(arg)) if arg else XORClouds()
+    if name == "parity":
+        return Parity(int(arg)) if arg else Parity()
+    if name == "bool":
+        from data.boolean import truth_table
+
+        return ListDataset(truth_table(arg), name=f"bool:{arg.lower()}")
+    raise ValueError(f"Conjunto de datos desconocido: {spec!r}")
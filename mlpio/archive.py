@@ -0,0 +1,248 @@
+"""Archivo comprimido por bloques de épocas, con índice, para las trazas Markdown.
+
+``trazas.md`` crece sin límite y leer la época 2999 obliga a recorrerlo entero.
+``TraceArchiveWriter`` escribe el mismo texto en tramas comprimidas
+independientes (gzip o lzma), una por cada bloque de ``block_epochs`` épocas, y
+un índice binario aparte con un registro de tamaño fijo por sección:
+
+    clave (int64) | desplazamiento de la trama | largo de la trama |
+    desplazamiento del texto dentro de la trama | largo del texto
+
+La clave es el número de época; el encabezado inicial usa ``PREAMBLE`` y las
+predicciones finales ``TAIL``. Como las épocas se registran consecutivas, el
+registro de la época e está en una posición calculable: leer una época cuesta
+un ``seek`` en el índice, un ``seek`` en el archivo y descomprimir una trama.
+
+Las tramas son miembros gzip (o flujos xz) completos y concatenados, así que el
+archivo sigue siendo un ``.gz``/``.xz`` válido: ``zcat trazas.md.gz`` devuelve
+el Markdown completo. Ejecutar ``python -m mlpio.archive --help`` para extraer
+un rango de épocas a Markdown plano.
+"""
+
+import argparse
+import bisect
+import gzip
+import lzma
+import os
+import struct
+import sys
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+CODECS = {
+    "gzip": (".gz", lambda data: gzip.compress(data, 6, mtime=0), gzip.decompress),
+    "lzma": (".xz", lambda data: lzma.compress(data, preset=6), lzma.decompress),
+}
+
+PREAMBLE = -1
+TAIL = 1 << 62
+
+_MAGIC = b"MLPTRZ1\n"
+_HEADER = struct.Struct("<8s8s")
+_RECORD = struct.Struct("<qQIII")
+
+
+def archive_path(path_md: str, codec: str) -> str:
+    """Ruta del archivo comprimido para ``path_md`` (``trazas.md`` → ``trazas.md.gz``)."""
+
+    return path_md + CODECS[codec][0]
+
+
+class TraceArchiveWriter:
+    """Escribe secciones de texto por época en tramas comprimidas con índice."""
+
+    def __init__(self, path: str, codec: str = "gzip", block_epochs: int = 50):
+        """
+        Parámetros:
+            path: Archivo de datos; el índice se escribe en ``path + ".idx"``
+            codec: "gzip" o "lzma"
+            block_epochs: Épocas por trama (más épocas: mejor compresión,
+                lectura de una época algo más cara)
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Códec de archivo desconocido: {codec!r}")
+        self.path = path
+        self.codec = codec
+        self.block_epochs = max(1, block_epochs)
+        self._compress = CODECS[codec][1]
+        self._data = open(path, "wb")
+        self._index = open(path + ".idx", "wb")
+        self._index.write(_HEADER.pack(_MAGIC, codec.encode()))
+        self._offset = 0
+        self._block: List[Tuple[int, bytes]] = []
+        self._epochs_in_block = 0
+        self._key = PREAMBLE
+        self._parts: List[str] = []
+
+    def write(self, text: str) -> None:
+        """Añade texto a la sección actual."""
+
+        self._parts.append(text)
+
+    def begin_epoch(self, epoch: int) -> None:
+        """Cierra la sección actual y abre la de ``epoch``."""
+
+        self._end_section()
+        if self._epochs_in_block >= self.block_epochs:
+            self._flush_block()
+        self._key = epoch
+        self._epochs_in_block += 1
+
+    def begin_tail(self) -> None:
+        """Cierra la última época y abre la sección final (predicciones)."""
+
+        self._end_section()
+        self._flush_block()
+        self._key = TAIL
+
+    def _end_section(self) -> None:
+        if self._parts:
+            self._block.append((self._key, "".join(self._parts).encode("utf-8")))
+            self._parts = []
+
+    def _flush_block(self) -> None:
+        if not self._block:
+            return
+        records = []
+        position = 0
+        for key, text in self._block:
+            records.append((key, position, len(text)))
+            position += len(text)
+        frame = self._compress(b"".join(text for _, text in self._block))
+        self._data.write(frame)
+        self._data.flush()
+        for key, start, length in records:
+            self._index.write(_RECORD.pack(key, self._offset, len(frame), start, length))
+        self._index.flush()
+        self._offset += len(frame)
+        self._block = []
+        self._epochs_in_block = 0
+
+    def close(self) -> None:
+        """Escribe la trama pendiente y cierra ambos archivos."""
+
+        if self._data.closed:
+            return
+        self._end_section()
+        self._flush_block()
+        self._data.close()
+        self._index.close()
+
+
+class TraceArchive:
+    """Lector con acceso aleatorio por época a un archivo de ``TraceArchiveWriter``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path + ".idx", "rb") as index:
+            magic, codec = _HEADER.unpack(index.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path}.idx no es un índice de trazas")
+            raw = index.read()
+        self.codec = codec.rstrip(b"\0").decode()
+        self._decompress = CODECS[self.codec][2]
+        count = len(raw) // _RECORD.size
+        self._records = [
+            _RECORD.unpack_from(raw, i * _RECORD.size) for i in range(count)
+        ]
+        self._keys = [record[0] for record in self._records]
+        self._frame: Tuple[int, bytes] = (-1, b"")
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> "TraceArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def epochs(self) -> List[int]:
+        """Épocas registradas, en orden."""
+
+        return [key for key in self._keys if key not in (PREAMBLE, TAIL)]
+
+    @property
+    def frames(self) -> int:
+        """Cantidad de tramas comprimidas."""
+
+        return len({record[1] for record in self._records})
+
+    def _find(self, key: int) -> Optional[int]:
+        """Posición del registro de ``key``: directa si las épocas son consecutivas."""
+
+        keys = self._keys
+        if len(keys) > 1 and keys[0] == PREAMBLE and key not in (PREAMBLE, TAIL):
+            guess = key - keys[1] + 1
+            if 0 <= guess < len(keys) and keys[guess] == key:
+                return guess
+        i = bisect.bisect_left(keys, key)
+        return i if i < len(keys) and keys[i] == key else None
+
+    def _section(self, position: int) -> str:
+        _, offset, length, start, size = self._records[position]
+        if self._frame[0] != offset:
+            if self._file is None:
+                self._file = open(self.path, "rb")
+            self._file.seek(offset)
+            self._frame = (offset, self._decompress(self._file.read(length)))
+        return self._frame[1][start:start + size].decode("utf-8")
+
+    def read(self, key: int) -> str:
+        """Texto de la época ``key`` (o de ``PREAMBLE``/``TAIL``); '' si no existe."""
+
+        position = self._find(key)
+        return "" if position is None else self._section(position)
+
+    def iter_range(self, first: int, last: int) -> Iterator[str]:
+        """Secciones de las épocas ``first..last`` (cada trama se descomprime una vez)."""
+
+        start = bisect.bisect_left(self._keys, max(first, PREAMBLE + 1))
+        stop = bisect.bisect_right(self._keys, min(last, TAIL - 1))
+        for position in range(start, stop):
+            yield self._section(position)
+
+    def to_markdown(self, out, first: Optional[int] = None, last: Optional[int] = None) -> None:
+        """Escribe en ``out`` el encabezado, las épocas pedidas y las predicciones finales."""
+
+        epochs = self.epochs() or [0]
+        first = epochs[0] if first is None else first
+        last = epochs[-1] if last is None else last
+        out.write(self.read(PREAMBLE))
+        for text in self.iter_range(first, last):
+            out.write(text)
+        out.write(self.read(TAIL))
+
+
+def _parse_range(text: str) -> Tuple[Optional[int], Optional[int]]:
+    if not text:
+        return None, None
+    first, sep, last = text.partition("-")
+    if not sep:
+        return int(first), int(first)
+    return (int(first) if first else None), (int(last) if last else None)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extrae épocas de un archivo de trazas comprimido")
+    parser.add_argument("archive", help="Archivo de trazas (p. ej. trazas.md.gz)")
+    parser.add_argument("--epochs", default="", help="Época o rango: 2999, 100-200, 2990-")
+    parser.add_argument("--out", default="-", help="Markdown de salida (- = salida estándar)")
+    parser.add_argument("--list", action="store_true", help="Mostrar resumen del archivo")
+    args = parser.parse_args()
+
+    with TraceArchive(args.archive) as archive:
+        if args.list:
+            epochs = archive.epochs()
+            span = f"{epochs[0]}–{epochs[-1]}" if epochs else "ninguna"
+            print(f"{args.archive}: {archive.codec}, {len(epochs)} épocas ({span}), "
+                  f"{archive.frames} tramas, {os.path.getsize(args.archive)} bytes")
+        else:
+            first, last = _parse_range(args.epochs)
+            if args.out == "-":
+                archive.to_markdown(sys.stdout, first, last)
+            else:
+                with open(args.out, "w", encoding="utf-8") as file:
+                    archive.to_markdown(file, first, last)
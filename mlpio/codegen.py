@@ -0,0 +1,193 @@
+"""Generación de un módulo predictor autónomo a partir de una red entrenada.
+
+``generate_predictor`` escribe el código fuente de un módulo Python sin
+dependencias del proyecto: los 9 pesos van incrustados como literales (``repr``
+de ``float`` es exacto) y la pasada 2-2-1 está desenrollada en unas pocas
+expresiones, con las mismas operaciones y en el mismo orden que
+``MLP221.forward``, así que ``predict`` devuelve exactamente el mismo valor.
+Con ``vectorized=True`` el módulo incluye además ``predict_batch`` con NumPy.
+
+``verify_predictor`` importa el módulo generado y lo compara con
+``MLP221.predict`` en una grilla. Ejecutar ``python -m mlpio.codegen --help``
+para la CLI, que además mide la carga y el costo por predicción.
+"""
+
+import argparse
+import importlib.util
+import itertools
+import math
+import os
+import time
+from types import ModuleType
+
+from core.model import MLP221
+
+_HEADER = '''"""Predictor MLP 2-2-1 generado por mlpio.codegen: no editar a mano.
+
+{description}
+
+Parámetros (orden de MLP221.get_params): W1[0][0], W1[0][1], W1[1][0], W1[1][1],
+b1[0], b1[1], W2[0][0], W2[0][1], b2[0].
+"""
+
+from math import exp
+{numpy_import}
+PARAMS = ({params})
+
+
+def _sigmoid(z):
+    if z >= 0:
+        return 1.0 / (1.0 + exp(-z))
+    ez = exp(z)
+    return ez / (1.0 + ez)
+
+
+def predict(x):
+    """Probabilidad de la clase 1 para la entrada ``x = [x1, x2]``."""
+
+    x0 = x[0]
+    x1 = x[1]
+    h0 = _sigmoid({b10!r} + {w100!r} * x0 + {w101!r} * x1)
+    h1 = _sigmoid({b11!r} + {w110!r} * x0 + {w111!r} * x1)
+    return _sigmoid({b2!r} + {w20!r} * h0 + {w21!r} * h1)
+'''
+
+_BATCH = '''
+
+def _sigmoid_np(z):
+    e = np.exp(-np.abs(z))
+    return np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e))
+
+
+def predict_batch(X):
+    """Probabilidades ``(B,)`` para un lote ``X`` de forma ``(B, 2)``."""
+
+    X = np.asarray(X, dtype=np.float64).reshape(-1, 2)
+    x0 = X[:, 0]
+    x1 = X[:, 1]
+    h0 = _sigmoid_np({b10!r} + {w100!r} * x0 + {w101!r} * x1)
+    h1 = _sigmoid_np({b11!r} + {w110!r} * x0 + {w111!r} * x1)
+    return _sigmoid_np({b2!r} + {w20!r} * h0 + {w21!r} * h1)
+'''
+
+
+def generate_predictor(net: MLP221, vectorized: bool = False, description: str = "") -> str:
+    """
+    Código fuente del módulo predictor con los pesos actuales de ``net``.
+
+    Parámetros:
+        net: Red (``MLP221`` o compatible con ``get_params``)
+        vectorized: Si es True se agrega ``predict_batch`` (requiere NumPy al importar)
+        description: Línea libre para el docstring del módulo (p. ej. cómo se entrenó);
+            se escapan las barras invertidas y las comillas triples (rutas de Windows)
+
+    Devuelve:
+        Texto del módulo
+    """
+    p = [float(v) for v in net.get_params()]
+    if not all(math.isfinite(v) for v in p):
+        raise ValueError("La red tiene parámetros no finitos (¿divergió el entrenamiento?)")
+    names = ("w100", "w101", "w110", "w111", "b10", "b11", "w20", "w21", "b2")
+    values = dict(zip(names, p))
+    description = description or "Pesos incrustados como constantes; no depende de core."
+    source = _HEADER.format(
+        description=description.replace("\\", "\\\\").replace('"""', '\\"""'),
+        numpy_import="\nimport numpy as np\n" if vectorized else "",
+        params=", ".join(repr(v) for v in p),
+        **values,
+    )
+    if vectorized:
+        source += _BATCH.format(**values)
+    return source
+
+
+def export_predictor(
+    net: MLP221, path: str = "predictor.py", vectorized: bool = False, description: str = ""
+) -> None:
+    """Escribe el módulo de ``generate_predictor`` en ``path``."""
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(generate_predictor(net, vectorized, description))
+
+
+def load_predictor(path: str) -> ModuleType:
+    """Importa un módulo generado desde su ruta (sin tocar ``sys.path``)."""
+
+    name = "_predictor_" + os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def verify_predictor(
+    module: ModuleType,
+    net: MLP221,
+    resolution: int = 101,
+    low: float = -0.5,
+    high: float = 1.5,
+    tol: float = 1e-12,
+) -> float:
+    """
+    Compara el predictor generado con ``net.predict`` en una grilla cuadrada.
+
+    ``predict`` debe coincidir bit a bit; ``predict_batch`` (si existe) dentro
+    de ``tol``, porque ``numpy.exp`` puede diferir de ``math.exp`` en el último
+    bit.
+
+    Devuelve:
+        Máxima diferencia absoluta encontrada
+
+    Lanza:
+        AssertionError si ``predict`` difiere o ``predict_batch`` supera ``tol``
+    """
+    step = (high - low) / (resolution - 1)
+    axis = [low + i * step for i in range(resolution)]
+    points = [[a, b] for a, b in itertools.product(axis, axis)]
+    expected = [net.predict(x) for x in points]
+
+    worst = max(abs(module.predict(x) - e) for x, e in zip(points, expected))
+    if worst != 0.0:
+        raise AssertionError(f"predict difiere de MLP221.predict: {worst:.3e}")
+    if hasattr(module, "predict_batch"):
+        batch = module.predict_batch(points).tolist()
+        worst = max(abs(b - e) for b, e in zip(batch, expected))
+        if worst > tol:
+            raise AssertionError(f"predict_batch difiere de MLP221.predict: {worst:.3e}")
+    return worst
+
+
+if __name__ == "__main__":
+    from core.initializers import SCHEMES
+    from trainer.train import train
+
+    parser = argparse.ArgumentParser(description="Genera un módulo predictor autónomo")
+    parser.add_argument("--train", type=int, default=3000, help="Épocas antes de generar")
+    parser.add_argument("--lr", type=float, default=0.5)
+    parser.add_argument("--init", choices=SCHEMES, default="fixed")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--numpy", action="store_true", help="Incluir predict_batch vectorizado")
+    parser.add_argument("--out", default="predictor.py")
+    args = parser.parse_args()
+
+    net = MLP221(init=args.init, seed=args.seed)
+    train(net, epochs=args.train, lr=args.lr)
+    export_predictor(
+        net, args.out, args.numpy,
+        f"Entrenado {args.train} épocas con lr={args.lr} (init={args.init}, seed={args.seed}).",
+    )
+
+    start = time.perf_counter()
+    module = load_predictor(args.out)
+    loaded = time.perf_counter() - start
+    error = verify_predictor(module, net)
+
+    def per_call(fn, x=(0.25, 0.75), n=200_000) -> float:
+        t = time.perf_counter()
+        for _ in range(n):
+            fn(x)
+        return (time.perf_counter() - t) / n
+
+    print(f"Escrito {args.out} | carga {loaded * 1e6:.0f} µs | error máximo {error:.1e}")
+    print(f"MLP221.predict: {per_call(net.predict) * 1e9:.0f} ns/predicción")
+    print(f"predict generado: {per_call(module.predict) * 1e9:.0f} ns/predicción")
@@ -1,39 +1,117 @@
-"""Utilidades para exportar resultados del entrenamiento a archivos."""
+"""Utilidades para exportar resultados del entrenamiento a archivos.
 
-from typing import Iterable
+matplotlib se importa solo al dibujar con él. La curva de pérdida también puede
+generarse con ``renderer="raster"`` (``mlpio.raster``, solo biblioteca
+estándar), que evita cargar matplotlib en ``--export`` y trabajos por lotes.
+"""
 
-import matplotlib
+from typing import Iterable, Optional, Sequence, Tuple
 
-# Seleccionar backend sin GUI para poder guardar gráficos en cualquier entorno.
-matplotlib.use("Agg")
+from core.model import MLP221
+from data.datasets import XOR, Dataset
+from trainer.history import LossHistory
 
-import matplotlib.pyplot as plt
+RENDERERS = ("matplotlib", "raster")
 
-from core.model import MLP221
-from data.xor import DATA
 
+def _figure(**kwargs):
+    """``Figure`` con lienzo Agg, sin el estado global de ``pyplot``."""
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(**kwargs)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def export_loss_plot(
+    losses: Iterable[float], path: str = "loss.png", renderer: str = "matplotlib"
+) -> None:
+    """Genera y guarda la curva de pérdida promedio por época.
+
+    Con un ``LossHistory`` se dibuja su versión decimada (medias por bloque), de
+    modo que exportar millones de épocas no recorre ni copia toda la serie.
+    """
+
+    if isinstance(losses, LossHistory):
+        points = losses.decimated(4000)
+    else:
+        points = list(enumerate(losses, start=1))
+    export_loss_points(points, path, renderer)
+
+
+def export_loss_points(
+    points: Sequence[Tuple[float, float]], path: str = "loss.png", renderer: str = "matplotlib"
+) -> None:
+    """Dibuja pares ``(época, pérdida)`` ya decimados y guarda la figura.
+
+    Usa ``Figure`` con el lienzo Agg directamente, sin el estado global de
+    ``pyplot``, así que puede llamarse desde cualquier hilo o proceso. Con
+    ``renderer="raster"`` usa el rasterizador PNG propio de ``mlpio.raster``.
+    """
+
+    if renderer not in RENDERERS:
+        raise ValueError(f"Renderizador desconocido: {renderer!r}")
+    if renderer == "raster":
+        from mlpio.raster import render_loss_png
+
+        render_loss_png(points, path)
+        return
+
+    fig = _figure()
+    ax = fig.add_subplot()
+    ax.plot([p[0] for p in points], [p[1] for p in points])
+    ax.set_xlabel("Época")
+    ax.set_ylabel("Pérdida media (BCE)")
+    ax.set_title("Curva de pérdida — XOR (MLP 2–2–1)")
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
+
+
+def export_loss_surface(surface, path: str = "paisaje.png", levels: int = 30) -> None:
+    """Dibuja un ``LossSurface`` de ``trainer.landscape`` como mapa de contornos.
+
+    Los niveles se reparten en escala logarítmica (la BCE cubre varios órdenes
+    de magnitud) y el centro del corte se marca con una cruz.
+    """
+
+    import numpy as np
 
-def export_loss_plot(losses: Iterable[float], path: str = "loss.png") -> None:
-    """Genera y guarda la curva de pérdida promedio por época."""
+    losses = np.log10(np.clip(surface.losses, 1e-12, None))
+    fig = _figure(figsize=(6, 5))
+    ax = fig.add_subplot()
+    filled = ax.contourf(surface.alphas, surface.betas, losses, levels=levels, cmap="viridis")
+    ax.contour(surface.alphas, surface.betas, losses, levels=levels, colors="k",
+               linewidths=0.3, alpha=0.5)
+    fig.colorbar(filled, ax=ax, label="log10 pérdida media (BCE)")
+    ax.plot([0], [0], marker="x", color="white", markersize=9, markeredgewidth=2)
+    ax.set_xlabel(surface.labels[0])
+    ax.set_ylabel(surface.labels[1])
+    ax.set_title("Paisaje de pérdida — XOR (MLP 2–2–1)")
+    fig.tight_layout()
+    fig.savefig(path, dpi=150)
 
-    loss_values = list(losses)
-    plt.figure()
-    plt.plot(range(1, len(loss_values) + 1), loss_values)
-    plt.xlabel("Época")
-    plt.ylabel("Pérdida media (BCE)")
-    plt.title("Curva de pérdida — XOR (MLP 2–2–1)")
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(path, dpi=150)
-    plt.close()
 
+def export_pred_table(
+    net: MLP221,
+    path_md: str = "predicciones.md",
+    dataset: Optional[Dataset] = None,
+    max_rows: int = 64,
+) -> None:
+    """Escribe una tabla Markdown con las predicciones actuales de la red.
 
-def export_pred_table(net: MLP221, path_md: str = "predicciones.md") -> None:
-    """Escribe una tabla Markdown con las predicciones actuales de la red."""
+    Para conjuntos grandes solo se listan las primeras ``max_rows`` muestras.
+    """
 
+    data = XOR if dataset is None else dataset
     with open(path_md, "w", encoding="utf-8") as file:
         file.write("# Predicciones XOR (final)\n\n")
         file.write("| x1 | x2 | y | ŷ |\n|---:|---:|---:|---:|\n")
-        for x, y in DATA:
+        for row, (x, y) in enumerate(data):
+            if row == max_rows:
+                file.write(f"\n_{len(data) - max_rows} filas más omitidas._\n")
+                break
             yhat = net.predict(x)
-            file.write(f"| {int(x[0])} | {int(x[1])} | {int(y)} | {yhat:.4f} |\n")
+            file.write(f"| {x[0]:g} | {x[1]:g} | {y:g} | {yhat:.4f} |\n")
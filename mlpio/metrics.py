@@ -0,0 +1,99 @@
+"""Flujo de métricas estructuradas por época en JSONL o CSV.
+
+Alternativa ligera a ``MarkdownTracer``: un registro compacto por época (época,
+pérdida, precisión, norma del gradiente medio, norma de los pesos y duración de
+la época), pensado para que herramientas externas sigan corridas largas con
+``tail -f``. Las líneas se acumulan en memoria y se escriben cada
+``flush_every`` registros; cada ``fsync_interval`` segundos además se fuerza
+``os.fsync`` para que lo escrito sobreviva a un corte. Con ~110 bytes por
+registro, 100 000 épocas ocupan unos 11 MB.
+"""
+
+import json
+import os
+import time
+from typing import List, Optional
+
+FIELDS = ("epoch", "loss", "accuracy", "grad_norm", "weight_norm", "step_time")
+FORMATS = ("jsonl", "csv")
+
+
+class MetricsWriter:
+    """Sumidero de métricas por época con escritura en búfer y fsync periódico."""
+
+    def __init__(
+        self,
+        path: str = "metricas.jsonl",
+        fmt: Optional[str] = None,
+        flush_every: int = 256,
+        fsync_interval: float = 5.0,
+    ):
+        """
+        Parámetros:
+            path: Archivo de salida (se sobrescribe)
+            fmt: "jsonl" o "csv"; por defecto se deduce de la extensión
+            flush_every: Registros acumulados antes de escribir al archivo
+            fsync_interval: Segundos mínimos entre llamadas a ``os.fsync``
+        """
+        if fmt is None:
+            fmt = "csv" if path.endswith(".csv") else "jsonl"
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato de métricas no soportado: {fmt!r}")
+        self.path = path
+        self.fmt = fmt
+        self.flush_every = max(1, flush_every)
+        self.fsync_interval = fsync_interval
+        self._pending: List[str] = []
+        self._last_sync = time.monotonic()
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        if fmt == "csv":
+            self._file.write(",".join(FIELDS) + "\n")
+
+    def log_epoch(
+        self,
+        epoch: int,
+        loss: float,
+        accuracy: float,
+        grad_norm: float,
+        weight_norm: float,
+        step_time: float,
+    ) -> None:
+        """Encola el registro de una época (9 cifras significativas por valor)."""
+
+        values = [epoch] + [
+            float(f"{v:.9g}") for v in (loss, accuracy, grad_norm, weight_norm, step_time)
+        ]
+        if self.fmt == "jsonl":
+            line = json.dumps(dict(zip(FIELDS, values)), separators=(",", ":"))
+        else:
+            line = ",".join(map(str, values))
+        self._pending.append(line)
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self, sync: bool = False) -> None:
+        """Escribe lo acumulado; hace ``fsync`` si se pide o si venció el intervalo."""
+
+        if self._file.closed:
+            return
+        if self._pending:
+            self._file.write("\n".join(self._pending) + "\n")
+            self._pending.clear()
+        self._file.flush()
+        now = time.monotonic()
+        if sync or now - self._last_sync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def close(self) -> None:
+        """Vacía el búfer, sincroniza y cierra el archivo."""
+
+        if not self._file.closed:
+            self.flush(sync=True)
+            self._file.close()
+
+    def __enter__(self) -> "MetricsWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
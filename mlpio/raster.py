@@ -0,0 +1,221 @@
+"""Rasterizador mínimo de la curva de pérdida con codificación PNG propia.
+
+Alternativa ligera a matplotlib para ``--export`` y trabajos por lotes: dibuja
+la polilínea, los ejes, las marcas y sus etiquetas en un ``bytearray`` RGB y lo
+codifica como PNG con ``zlib`` (sin filtro por fila: las zonas lisas de un
+gráfico ya comprimen muy bien y así no hay bucles por byte). Solo usa la
+biblioteca estándar, así que importarlo cuesta milisegundos frente a los
+cientos que cuesta matplotlib.
+
+El texto usa una fuente de mapa de bits de 3×5 píxeles con dígitos, signos y
+las pocas mayúsculas necesarias para los rótulos de los ejes.
+"""
+
+import math
+import struct
+import zlib
+from typing import Dict, List, Sequence, Tuple
+
+Color = Tuple[int, int, int]
+
+WHITE: Color = (255, 255, 255)
+BLACK: Color = (0, 0, 0)
+GRID: Color = (225, 225, 225)
+BLUE: Color = (31, 119, 180)
+
+# Fuente 3×5: cada glifo son 5 filas de 3 bits (el bit 2 es la columna izquierda)
+_FONT: Dict[str, Tuple[int, ...]] = {
+    "0": (7, 5, 5, 5, 7), "1": (2, 6, 2, 2, 7), "2": (7, 1, 7, 4, 7),
+    "3": (7, 1, 7, 1, 7), "4": (5, 5, 7, 1, 1), "5": (7, 4, 7, 1, 7),
+    "6": (7, 4, 7, 5, 7), "7": (7, 1, 1, 1, 1), "8": (7, 5, 7, 5, 7),
+    "9": (7, 5, 7, 1, 7), ".": (0, 0, 0, 0, 2), "-": (0, 0, 7, 0, 0),
+    "+": (0, 2, 7, 2, 0), "e": (0, 7, 7, 4, 7), " ": (0, 0, 0, 0, 0),
+    "(": (1, 2, 2, 2, 1), ")": (4, 2, 2, 2, 4),
+    "A": (2, 5, 7, 5, 5), "B": (6, 5, 6, 5, 6), "C": (7, 4, 4, 4, 7),
+    "D": (6, 5, 5, 5, 6), "E": (7, 4, 6, 4, 7), "I": (7, 2, 2, 2, 7),
+    "O": (7, 5, 5, 5, 7), "P": (7, 5, 7, 4, 4), "R": (6, 5, 6, 5, 5),
+}
+
+
+class Raster:
+    """Imagen RGB de 8 bits con primitivas de dibujo y salida PNG."""
+
+    def __init__(self, width: int, height: int, background: Color = WHITE):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(bytes(background) * (width * height))
+
+    def point(self, x: int, y: int, color: Color) -> None:
+        """Pinta un píxel (se ignora si cae fuera de la imagen)."""
+
+        if 0 <= x < self.width and 0 <= y < self.height:
+            i = 3 * (y * self.width + x)
+            self.pixels[i:i + 3] = bytes(color)
+
+    def hline(self, x0: int, x1: int, y: int, color: Color) -> None:
+        """Segmento horizontal de ``x0`` a ``x1`` inclusive."""
+
+        if not 0 <= y < self.height:
+            return
+        x0, x1 = max(min(x0, x1), 0), min(max(x0, x1), self.width - 1)
+        if x0 <= x1:
+            i = 3 * (y * self.width + x0)
+            self.pixels[i:i + 3 * (x1 - x0 + 1)] = bytes(color) * (x1 - x0 + 1)
+
+    def vline(self, x: int, y0: int, y1: int, color: Color) -> None:
+        """Segmento vertical de ``y0`` a ``y1`` inclusive."""
+
+        for y in range(max(min(y0, y1), 0), min(max(y0, y1), self.height - 1) + 1):
+            self.point(x, y, color)
+
+    def line(self, x0: int, y0: int, x1: int, y1: int, color: Color) -> None:
+        """Segmento arbitrario (Bresenham)."""
+
+        dx, dy = abs(x1 - x0), -abs(y1 - y0)
+        sx = 1 if x0 < x1 else -1
+        sy = 1 if y0 < y1 else -1
+        err = dx + dy
+        while True:
+            self.point(x0, y0, color)
+            if x0 == x1 and y0 == y1:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x0 += sx
+            if e2 <= dx:
+                err += dx
+                y0 += sy
+
+    def text(self, x: int, y: int, text: str, color: Color = BLACK, scale: int = 2) -> None:
+        """Escribe ``text`` con la esquina superior izquierda en ``(x, y)``."""
+
+        for char in text:
+            for row, bits in enumerate(_FONT.get(char, _FONT[" "])):
+                for col in range(3):
+                    if bits & (4 >> col):
+                        for dy in range(scale):
+                            self.hline(x + col * scale, x + col * scale + scale - 1,
+                                       y + row * scale + dy, color)
+            x += 4 * scale
+
+    def png(self, level: int = 6) -> bytes:
+        """Codifica la imagen como PNG RGB de 8 bits."""
+
+        return encode_png(self.width, self.height, self.pixels, level)
+
+    def save(self, path: str) -> None:
+        with open(path, "wb") as file:
+            file.write(self.png())
+
+
+def text_width(text: str, scale: int = 2) -> int:
+    """Ancho en píxeles de ``text`` con la fuente 3×5."""
+
+    return max(0, 4 * scale * len(text) - scale)
+
+
+def encode_png(width: int, height: int, rgb, level: int = 6) -> bytes:
+    """PNG de ``width × height`` a partir de píxeles RGB contiguos."""
+
+    stride = 3 * width
+    rows = bytearray()
+    for y in range(height):
+        rows.append(0)  # tipo de filtro: ninguno
+        rows += rgb[y * stride:(y + 1) * stride]
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return (struct.pack(">I", len(data)) + kind + data
+                + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header)
+            + chunk(b"IDAT", zlib.compress(bytes(rows), level)) + chunk(b"IEND", b""))
+
+
+def nice_ticks(low: float, high: float, count: int = 6) -> List[float]:
+    """Marcas "redondas" (1, 2 o 5 × 10^k) que cubren ``[low, high]``."""
+
+    if not high > low:
+        high = low + 1.0
+    raw = (high - low) / max(1, count - 1)
+    magnitude = 10.0 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    first = math.ceil(low / step - 1e-9)
+    last = math.floor(high / step + 1e-9)
+    return [k * step for k in range(first, last + 1)]
+
+
+def _label(value: float) -> str:
+    if value == 0:
+        return "0"
+    if abs(value) >= 1e5 or abs(value) < 1e-3:
+        mantissa, exponent = f"{value:.1e}".split("e")
+        return f"{mantissa}e{int(exponent)}"
+    return f"{value:.6g}"
+
+
+def render_loss_png(
+    points: Sequence[Tuple[float, float]],
+    path: str,
+    width: int = 960,
+    height: int = 720,
+) -> None:
+    """
+    Dibuja pares ``(época, pérdida)`` con ejes, grilla y marcas, y guarda un PNG.
+
+    Mismo contenido que ``export_loss_points`` con matplotlib (sin título, con
+    rótulos en mayúsculas sin tildes), en una fracción del tiempo y la memoria.
+    """
+    image = Raster(width, height)
+    left, right, top, bottom = 110, width - 30, 30, height - 80
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points if math.isfinite(p[1])]
+    x_lo, x_hi = (min(xs), max(xs)) if xs else (0.0, 1.0)
+    y_lo, y_hi = (min(ys), max(ys)) if ys else (0.0, 1.0)
+    pad = (y_hi - y_lo) * 0.05 or 0.05
+    y_lo, y_hi = y_lo - pad, y_hi + pad
+    if x_hi <= x_lo:
+        x_hi = x_lo + 1.0
+
+    def px(x: float) -> int:
+        return round(left + (x - x_lo) / (x_hi - x_lo) * (right - left))
+
+    def py(y: float) -> int:
+        return round(bottom - (y - y_lo) / (y_hi - y_lo) * (bottom - top))
+
+    for tick in nice_ticks(x_lo, x_hi):
+        x = px(tick)
+        image.vline(x, top, bottom, GRID)
+        image.vline(x, bottom, bottom + 6, BLACK)
+        label = _label(tick)
+        image.text(x - text_width(label) // 2, bottom + 12, label)
+    for tick in nice_ticks(y_lo, y_hi):
+        y = py(tick)
+        image.hline(left, right, y, GRID)
+        image.hline(left - 6, left, y, BLACK)
+        label = _label(tick)
+        image.text(left - 12 - text_width(label), y - 5, label)
+    image.hline(left, right, top, BLACK)
+    image.hline(left, right, bottom, BLACK)
+    image.vline(left, top, bottom, BLACK)
+    image.vline(right, top, bottom, BLACK)
+
+    xlabel, ylabel = "EPOCA", "PERDIDA (BCE)"
+    image.text((left + right - text_width(xlabel)) // 2, height - 30, xlabel)
+    image.text(8, top - 22, ylabel)
+
+    previous = None
+    for x, y in points:
+        if not math.isfinite(y):
+            previous = None
+            continue
+        current = (px(x), py(y))
+        if previous is None:
+            image.point(*current, BLUE)
+        elif current != previous:
+            # Dos píxeles de grosor, como la línea por defecto de matplotlib
+            image.line(*previous, *current, BLUE)
+            image.line(previous[0], previous[1] + 1, current[0], current[1] + 1, BLUE)
+        previous = current
+    image.save(path)
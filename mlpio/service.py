@@ -0,0 +1,263 @@
+"""Servicio de exportación en segundo plano para la interfaz.
+
+``ExportService`` genera la curva de pérdida, la traza Markdown y la tabla de
+predicciones en un pool de procesos (una tarea por archivo, en paralelo), de
+modo que matplotlib nunca corre en el hilo de Tk ni en el de entrenamiento.
+
+- Cada archivo se escribe en un temporal del mismo directorio y se publica con
+  ``os.replace``: nunca queda un archivo a medio escribir.
+- Cada artefacto guarda en ``.export_manifest.json`` un resumen SHA-256 de sus
+  entradas (parámetros, puntos de la curva, muestras usadas) y la fecha de
+  modificación del archivo escrito; si ambas coinciden, la tarea se omite.
+- ``progress(hechos, total, ruta, estado)`` se invoca al terminar cada archivo,
+  desde un hilo interno del pool: la UI debe reenviarlo con ``root.after``.
+"""
+
+import contextlib
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Sequence
+
+from data.datasets import XOR, Dataset
+from trainer.history import LossHistory
+
+MANIFEST = ".export_manifest.json"
+
+WRITTEN = "escrito"
+UNCHANGED = "sin cambios"
+
+# mkstemp crea archivos 0600; se aplican los permisos habituales según la umask
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write(path: str, writer: Callable[[str], None]) -> None:
+    """
+    Llama a ``writer(tmp)`` con un temporal junto a ``path`` y luego lo renombra.
+
+    El temporal conserva la extensión (matplotlib deduce el formato de ella) y
+    se borra si ``writer`` falla.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    base, ext = os.path.splitext(os.path.basename(path))
+    fd, tmp = tempfile.mkstemp(prefix=f".{base}.", suffix=ext, dir=directory)
+    os.close(fd)
+    try:
+        os.chmod(tmp, 0o666 & ~_UMASK)
+        writer(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _digest(*parts) -> str:
+    """Resumen estable de las entradas de un artefacto (``repr`` de floats es exacto)."""
+
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+# --------------------------------------------------------------------- tareas
+# Funciones de módulo para que el pool de procesos pueda serializarlas.
+
+def _net(params: Sequence[float]):
+    from core.model import MLP221
+
+    net = MLP221()
+    net.set_params(params)
+    return net
+
+
+def _render_loss(path: str, points, renderer: str) -> str:
+    from mlpio.export import export_loss_points
+
+    atomic_write(path, lambda tmp: export_loss_points(points, tmp, renderer))
+    return path
+
+
+def _render_table(path: str, params, dataset: Dataset) -> str:
+    from mlpio.export import export_pred_table
+
+    net = _net(params)
+    atomic_write(path, lambda tmp: export_pred_table(net, tmp, dataset=dataset))
+    return path
+
+
+def _render_trace(path: str, params, samples, lr: float) -> str:
+    from mlpio.tracer import MarkdownTracer
+
+    net = _net(params)
+
+    def write(tmp):
+        tracer = MarkdownTracer(tmp)
+        tracer.log_epoch_header(0, lr)
+        for x, y in samples:
+            net.forward(x)
+            net.backward(y)
+            tracer.log_sample(x, y, net)
+            tracer.log_update(net)
+        tracer.log_final_predictions([((x, y), net.predict(x)) for x, y in samples])
+
+    atomic_write(path, write)
+    return path
+
+
+# -------------------------------------------------------------------- servicio
+
+class ExportService:
+    """Pool de procesos reutilizable que exporta los artefactos de la UI."""
+
+    def __init__(self, directory: str = ".", workers: int = 3, renderer: str = "matplotlib"):
+        """
+        Parámetros:
+            directory: Carpeta donde se escriben los archivos y el manifiesto
+            workers: Procesos del pool (uno por artefacto basta)
+            renderer: Dibujo de la curva, "matplotlib" o "raster" (``mlpio.raster``)
+        """
+        self.directory = directory
+        self.workers = workers
+        self.renderer = renderer
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._manifest_path = os.path.join(directory, MANIFEST)
+        self._manifest = self._load_manifest()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # "spawn": no se hace fork de un proceso con hilos de Tk activos
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=mp.get_context("spawn")
+            )
+        return self._executor
+
+    def _load_manifest(self) -> Dict[str, list]:
+        try:
+            with open(self._manifest_path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self) -> None:
+        data = json.dumps(self._manifest, indent=2)
+
+        def write(tmp):
+            with open(tmp, "w", encoding="utf-8") as file:
+                file.write(data)
+
+        atomic_write(self._manifest_path, write)
+
+    def _up_to_date(self, path: str, digest: str) -> bool:
+        """True si ``path`` se escribió con estas entradas y nadie lo tocó después."""
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return False
+        with self._lock:
+            return self._manifest.get(path) == [digest, mtime]
+
+    def export(
+        self,
+        net,
+        losses: Optional[LossHistory] = None,
+        dataset: Optional[Dataset] = None,
+        lr: float = 0.5,
+        trace: bool = False,
+        loss_path: str = "loss.png",
+        table_path: str = "predicciones.md",
+        trace_path: str = "trazas.md",
+        progress: Optional[Callable[[int, int, str, str], None]] = None,
+    ) -> Future:
+        """
+        Encola la exportación y devuelve de inmediato.
+
+        Parámetros:
+            net: Red cuyos parámetros se exportan (se copian al encolar)
+            losses: Historial de pérdidas; si está vacío no se dibuja la curva
+            dataset: Conjunto para la tabla y la traza (por defecto XOR)
+            lr: Tasa de aprendizaje anotada en la traza
+            trace: Si es True se genera una traza de una época sobre ``chunk(0)``
+            progress: Callback opcional(hechos, total, ruta, estado)
+
+        Devuelve:
+            Future que se resuelve con ``{ruta: estado}`` (o con la primera
+            excepción de una tarea fallida)
+        """
+        data = XOR if dataset is None else dataset
+        params = net.get_params()
+        jobs = []
+        if losses:
+            points = losses.decimated(4000)
+            jobs.append((
+                loss_path, _digest("loss", self.renderer, points), _render_loss,
+                (points, self.renderer),
+            ))
+        head = list(islice(data, 64))
+        jobs.append((
+            table_path,
+            _digest("table", params, getattr(data, "name", None), len(data), head),
+            _render_table,
+            (params, data),
+        ))
+        if trace:
+            samples = data.chunk(0)
+            jobs.append((
+                trace_path, _digest("trace", params, lr, samples), _render_trace,
+                (params, samples, lr),
+            ))
+        return self._run(jobs, progress)
+
+    def _run(self, jobs: List[tuple], progress) -> Future:
+        result: Future = Future()
+        statuses: Dict[str, str] = {}
+        errors: List[BaseException] = []
+        total = len(jobs)
+        finished = threading.Lock()
+
+        def done(path: str, digest: Optional[str], status: str) -> None:
+            with finished:
+                statuses[path] = status
+                count = len(statuses)
+                if digest is not None:
+                    with self._lock:
+                        self._manifest[path] = [digest, os.stat(path).st_mtime_ns]
+                        self._save_manifest()
+            if progress:
+                progress(count, total, path, status)
+            if count == total:
+                if errors:
+                    result.set_exception(errors[0])
+                else:
+                    result.set_result(statuses)
+
+        def on_finish(path, digest, future):
+            try:
+                future.result()
+            except BaseException as exc:  # noqa: BLE001 - se reenvía al Future
+                errors.append(exc)
+                done(path, None, f"error: {exc}")
+            else:
+                done(path, digest, WRITTEN)
+
+        for path, digest, func, args in jobs:
+            path = os.path.join(self.directory, path)
+            if self._up_to_date(path, digest):
+                done(path, None, UNCHANGED)
+                continue
+            future = self._pool().submit(func, path, *args)
+            future.add_done_callback(lambda f, p=path, d=digest: on_finish(p, d, f))
+        return result
+
+    def shutdown(self) -> None:
+        """Termina el pool de procesos (espera a las tareas en curso)."""
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -6,13 +6,21 @@ pérdida y tabla de predicciones) o abrir la interfaz gráfica de Tkinter.
 """
 
 import argparse
-import tkinter as tk
+from typing import Optional
 
 from core import MLP221
-from mlpio.export import export_loss_plot, export_pred_table
+from core.initializers import SCHEMES
+from data.datasets import load_dataset
+from mlpio.export import RENDERERS, export_loss_plot, export_pred_table
+from mlpio.metrics import MetricsWriter
 from mlpio.tracer import MarkdownTracer
+from trainer.schedules import make_schedule
+from trainer.profiling import PhaseProfiler
+from trainer.optimizers import OPTIMIZERS, make_optimizer
 from trainer.train import train
-from ui.app import App
+
+# Numba, Tkinter y los módulos con NumPy se importan en la rama que los usa:
+# ``--help`` o una corrida con --export no deben pagar su carga.
 
 def main() -> None:
     """Analiza argumentos CLI y coordina entrenamiento, exportación o GUI."""
@@ -24,6 +32,24 @@ def main() -> None:
         "--train", type=int, default=0, help="Entrenar N épocas antes de abrir la GUI"
     )
     parser.add_argument("--lr", type=float, default=0.5, help="Learning rate")
+    parser.add_argument(
+        "--schedule",
+        default="constant",
+        help="Programa de LR: constant, step:N[:G], exp[:G], cosine[:MIN], "
+        "plateau[:P[:F]] o warmup:N[+otro]",
+    )
+    parser.add_argument(
+        "--optimizer",
+        choices=OPTIMIZERS,
+        default="sgd",
+        help="sgd, newton (Hessiano exacto, amortiguado) o lbfgs; con newton/lbfgs cada "
+        "época es una iteración sobre el lote completo",
+    )
+    parser.add_argument(
+        "--find-lr",
+        action="store_true",
+        help="Elegir --lr con una prueba de rango de LR antes de entrenar",
+    )
     parser.add_argument(
         "--export",
         action="store_true",
@@ -34,33 +60,274 @@ def main() -> None:
         action="store_true",
         help="Benchmark comparativo con NumPy (opcional)",
     )
+    parser.add_argument(
+        "--init",
+        choices=SCHEMES,
+        default="fixed",
+        help="Esquema de inicialización de pesos",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Semilla para la inicialización aleatoria"
+    )
+    parser.add_argument(
+        "--restarts",
+        type=int,
+        default=0,
+        help="Buscar entre N semillas la inicialización que converge antes",
+    )
+    parser.add_argument(
+        "--dataset",
+        default="xor",
+        help="Conjunto: xor, noisy-xor[:N], clouds[:N], parity o ruta a .npy",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=("python", "jit"),
+        default="python",
+        help="Motor para --train: python (con trazas) o jit (Numba, sin trazas.md)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reutilizar resultados de --train idénticos (.mlp_cache/, sin trazas.md)",
+    )
+    parser.add_argument(
+        "--metrics",
+        default=None,
+        metavar="RUTA",
+        help="Escribir métricas por época en RUTA (.jsonl o .csv); motor python sin --cache",
+    )
+    parser.add_argument(
+        "--predictor",
+        default=None,
+        metavar="RUTA",
+        help="Tras entrenar/exportar, generar un módulo predictor autónomo en RUTA",
+    )
+    parser.add_argument(
+        "--predictor-numpy",
+        action="store_true",
+        help="Incluir predict_batch (NumPy) en el módulo de --predictor",
+    )
+    parser.add_argument(
+        "--quantize",
+        type=int,
+        choices=(8, 16),
+        default=None,
+        metavar="BITS",
+        help="Tras entrenar/exportar, cuantizar a int8 o int16 y comparar con float (NumPy)",
+    )
+    parser.add_argument(
+        "--trace-compress",
+        choices=("gzip", "lzma"),
+        default=None,
+        help="Escribir las trazas comprimidas por bloques con índice (trazas.md.gz/.xz)",
+    )
+    parser.add_argument(
+        "--plot",
+        choices=RENDERERS,
+        default="matplotlib",
+        help="Dibujo de loss.png: matplotlib o raster (PNG propio, sin cargar matplotlib)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=("phases", "cprofile", "tracemalloc"),
+        default=None,
+        help="Perfilar la ejecución: tiempos por fase, cProfile o tracemalloc",
+    )
     args = parser.parse_args()
+    if args.metrics and (args.engine == "jit" or args.cache):
+        parser.error("--metrics solo está disponible con --engine python y sin --cache")
+    try:
+        make_schedule(args.schedule, 1.0, 1)
+        if load_dataset(args.dataset).n_inputs != 2:
+            raise ValueError(f"--dataset {args.dataset}: MLP221 requiere un conjunto con 2 entradas")
+    except (ValueError, OSError) as exc:
+        parser.error(str(exc))
+    if args.cache and args.schedule != "constant":
+        parser.error("--cache solo está disponible con --schedule constant")
+    if args.optimizer != "sgd" and (
+        args.engine == "jit" or args.cache or args.metrics or args.schedule != "constant"
+    ):
+        parser.error(f"--optimizer {args.optimizer} no admite --engine jit, --cache, "
+                     "--metrics ni --schedule")
+
+    if args.profile == "cprofile":
+        import cProfile
+        import pstats
+
+        profile = cProfile.Profile()
+        profile.runcall(_run, args, None)
+        profile.dump_stats("perfil.prof")
+        pstats.Stats(profile).sort_stats("cumulative").print_stats(25)
+        print("Perfil guardado en perfil.prof")
+    elif args.profile == "tracemalloc":
+        import tracemalloc
+
+        tracemalloc.start()
+        _run(args, None)
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Memoria actual: {current / 1024:.1f} KiB | pico: {peak / 1024:.1f} KiB")
+        for stat in snapshot.statistics("lineno")[:15]:
+            print(stat)
+    elif args.profile == "phases":
+        profiler = PhaseProfiler(record_events=True)
+        _run(args, profiler)
+        print(profiler.summary())
+        profiler.export_chrome_trace("perfil.json")
+        print("Chrome trace guardado en perfil.json")
+    else:
+        _run(args, None)
+
+
+def _run(args: argparse.Namespace, profiler: Optional[PhaseProfiler]) -> None:
+    """Ejecuta entrenamiento, exportación o GUI según los argumentos."""
+
+    metrics = MetricsWriter(args.metrics) if args.metrics else None
+    try:
+        _train_and_show(args, profiler, metrics)
+    finally:
+        if metrics is not None:
+            metrics.close()
+
+
+def _train_and_show(
+    args: argparse.Namespace,
+    profiler: Optional[PhaseProfiler],
+    metrics: Optional[MetricsWriter],
+) -> None:
+    """Cuerpo de ``_run``: reinicios, entrenamiento/exportación y GUI."""
+
+    net = MLP221(init=args.init, seed=args.seed)
+    dataset = load_dataset(args.dataset)
+
+    if args.restarts > 0:
+        from trainer.restarts import multi_restart_search
+
+        scheme = args.init if args.init != "fixed" else "xavier"
+        first = args.seed if args.seed is not None else 0
+        result = multi_restart_search(
+            seeds=range(first, first + args.restarts),
+            scheme=scheme,
+            lr=args.lr,
+            dataset=dataset,
+        )
+        net.set_params(result.params)
+        args.init, args.seed = scheme, result.seed
+        print(
+            f"Mejor semilla: {result.seed} ({scheme}) | "
+            f"pérdida {result.loss:.6f} tras {result.epochs} épocas"
+        )
+
+    if args.find_lr:
+        from trainer.schedules import lr_range_test
 
-    net = MLP221()
+        found = lr_range_test(net, dataset)
+        args.lr = found.suggested
+        print(f"LR sugerido: {args.lr:.4g} (de {found.lrs[0]:.3g} a {found.lrs[-1]:.3g})")
 
     if args.export:
-        tracer = MarkdownTracer("trazas.md")
-        losses = train(net, epochs=max(args.train, 3000), lr=args.lr, tracer=tracer)
-        export_loss_plot(losses, "loss.png")
-        export_pred_table(net, "predicciones.md")
-        preds = [
-            ((x, y), net.predict(x))
-            for x, y in [([0, 0], 0), ([0, 1], 1), ([1, 0], 1), ([1, 1], 0)]
-        ]
+        epochs = max(args.train, 3000)
+        tracer = MarkdownTracer("trazas.md", compress=args.trace_compress)
+        losses = train(
+            net,
+            epochs=epochs,
+            lr=make_schedule(args.schedule, args.lr, epochs),
+            tracer=tracer,
+            profiler=profiler,
+            dataset=dataset,
+            metrics=metrics,
+            optimizer=make_optimizer(args.optimizer),
+        )
+        export_loss_plot(losses, "loss.png", args.plot)
+        export_pred_table(net, "predicciones.md", dataset=dataset)
+        preds = [((x, y), net.predict(x)) for x, y in dataset.chunk(0)[:64]]
         tracer.log_final_predictions(preds)
-        print("Exportado: trazas.md, loss.png, predicciones.md")
+        tracer.close()
+        print(f"Exportado: {tracer.path}, loss.png, predicciones.md")
+        _write_predictor(args, net, epochs)
+        _report_quantized(args, net)
         return
 
+    if args.train > 0 and args.cache:
+        from trainer.cache import cached_train
+        from trainer.jit import train_fast
+
+        losses, cached = cached_train(
+            net,
+            epochs=args.train,
+            lr=args.lr,
+            dataset=dataset,
+            trainer=train_fast if args.engine == "jit" else train,
+            optimizer=f"sgd-{args.engine}",
+        )
+        print(f"Caché: {cached}/{args.train} épocas reutilizadas")
+        export_loss_plot(losses, "loss.png", args.plot)
+        export_pred_table(net, "predicciones.md", dataset=dataset)
+    elif args.train > 0 and args.engine == "jit":
+        from trainer.jit import train_fast
+
+        schedule = make_schedule(args.schedule, args.lr, args.train)
+        losses = train_fast(net, epochs=args.train, lr=schedule, dataset=dataset)
+        export_loss_plot(losses, "loss.png", args.plot)
+        export_pred_table(net, "predicciones.md", dataset=dataset)
+    elif args.train > 0:
+        tracer = MarkdownTracer("trazas.md", compress=args.trace_compress)
+        losses = train(
+            net,
+            epochs=args.train,
+            lr=make_schedule(args.schedule, args.lr, args.train),
+            tracer=tracer,
+            profiler=profiler,
+            dataset=dataset,
+            metrics=metrics,
+            optimizer=make_optimizer(args.optimizer),
+        )
+        tracer.close()
+        export_loss_plot(losses, "loss.png", args.plot)
+        export_pred_table(net, "predicciones.md", dataset=dataset)
     if args.train > 0:
-        tracer = MarkdownTracer("trazas.md")
-        losses = train(net, epochs=args.train, lr=args.lr, tracer=tracer)
-        export_loss_plot(losses, "loss.png")
-        export_pred_table(net, "predicciones.md")
+        _write_predictor(args, net, args.train)
+        _report_quantized(args, net)
+    if metrics is not None:
+        metrics.close()
+
+    import tkinter as tk
+
+    from ui.app import App
 
     root = tk.Tk()
-    App(root, net)
+    App(root, net, init=args.init, seed=args.seed, dataset=dataset)
     root.mainloop()
 
 
+def _write_predictor(args: argparse.Namespace, net: MLP221, epochs: int) -> None:
+    """Genera y verifica el módulo de ``--predictor`` (si se pidió)."""
+
+    if not args.predictor:
+        return
+    from mlpio.codegen import export_predictor, load_predictor, verify_predictor
+
+    description = (
+        f"Entrenado {epochs} épocas con {args.optimizer}, lr={args.lr}, programa {args.schedule}, "
+        f"init={args.init}, seed={args.seed}, conjunto {args.dataset}."
+    )
+    export_predictor(net, args.predictor, args.predictor_numpy, description)
+    error = verify_predictor(load_predictor(args.predictor), net)
+    print(f"Predictor: {args.predictor} (verificado, error máximo {error:.1e})")
+
+
+def _report_quantized(args: argparse.Namespace, net: MLP221) -> None:
+    """Imprime el reporte de ``--quantize`` (si se pidió)."""
+
+    if not args.quantize:
+        return
+    from core.quantized import QuantizedMLP221, quantization_report
+
+    quantized = QuantizedMLP221(net, args.quantize, input_range=1.5)
+    print(quantization_report(net, quantized).to_markdown())
+
+
 if __name__ == "__main__":
     main()
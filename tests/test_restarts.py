@@ -0,0 +1,25 @@
+"""Validación de argumentos de ``trainer.restarts.multi_restart_search``."""
+
+import unittest
+
+from trainer.restarts import multi_restart_search
+
+
+class MultiRestartArgumentsTest(unittest.TestCase):
+    def test_rejects_empty_first_round(self):
+        for first_round in (0, -10):
+            with self.assertRaises(ValueError):
+                multi_restart_search(seeds=[0, 1], first_round=first_round)
+
+    def test_rejects_max_epochs_below_first_round(self):
+        with self.assertRaises(ValueError):
+            multi_restart_search(seeds=[0, 1], first_round=300, max_epochs=100)
+
+    def test_single_round_runs(self):
+        result = multi_restart_search(seeds=[0, 1], first_round=20, max_epochs=20, workers=1)
+        self.assertEqual(result.epochs, 20)
+        self.assertIn(result.seed, (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""Entrenamiento simultáneo de las 16 funciones booleanas de dos entradas.
+
+Cada función de ``data.boolean.FUNCTIONS`` es una red 2-2-1 independiente; las
+16 se apilan en una matriz de parámetros ``(16, 9)`` con objetivos propios por
+red (``Y`` de forma ``(16, 4)``) sobre la misma matriz de entradas y se entrenan
+con ``trainer.jit.train_population``: toda la población y todas las épocas en
+una sola llamada compilada con Numba. El trabajo crece con el número de redes,
+pero sin llamadas de Python por red ni por época, así que las 16 funciones
+tardan menos que una sola corrida de ``trainer.train`` (sin Numba se usa
+``BatchedMLP221.sgd_epoch``, más lento). Cada red sigue la misma trayectoria
+que tendría entrenada sola con ``trainer.train``.
+
+Ejecutar ``python -m trainer.boolean`` imprime la tabla de convergencia y los
+tiempos frente a ``trainer.train``.
+"""
+
+import argparse
+import time
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.initializers import SCHEMES
+from core.model import MLP221
+from core.vectorized import BatchedMLP221
+from data.boolean import FUNCTIONS, INPUTS
+from trainer.jit import train_population
+
+
+class FunctionResult(NamedTuple):
+    """Resultado de una función booleana."""
+
+    name: str
+    targets: Tuple[float, ...]
+    converged_epoch: Optional[int]  # primera época con pérdida media < target_loss
+    final_loss: float
+    accuracy: float
+    params: List[float]
+
+
+def train_boolean(
+    epochs: int = 5000,
+    lr: float = 0.5,
+    init: str = "fixed",
+    seed: Optional[int] = None,
+    target_loss: float = 0.05,
+    functions: Optional[Sequence[str]] = None,
+) -> List[FunctionResult]:
+    """
+    Entrena una red por función booleana, todas en la misma llamada compilada.
+
+    Parámetros:
+        epochs: Épocas de SGD muestra a muestra
+        lr: Tasa de aprendizaje (común a todas las redes)
+        init: Esquema de inicialización; todas las redes parten de los mismos pesos
+        seed: Semilla del esquema
+        target_loss: Pérdida media de época que cuenta como convergencia
+        functions: Nombres a entrenar (por defecto las 16)
+
+    Devuelve:
+        Un ``FunctionResult`` por función, en el orden pedido
+    """
+    names = list(FUNCTIONS) if functions is None else [name.upper() for name in functions]
+    for name in names:
+        if name not in FUNCTIONS:
+            raise ValueError(f"Función booleana desconocida: {name!r}")
+    X = np.array(INPUTS, dtype=np.float64)
+    Y = np.array([FUNCTIONS[name] for name in names], dtype=np.float64)
+    start = MLP221(init=init, seed=seed).get_params()
+    params, losses = train_population(np.tile(start, (len(names), 1)), X, Y, lr, epochs)
+
+    below = losses < target_loss
+    converged = np.where(below.any(axis=1), below.argmax(axis=1) + 1, 0)
+    pop = BatchedMLP221(params)
+    final = pop.losses(X, Y)
+    correct = ((pop.predict(X) > 0.5) == (Y > 0.5)).mean(axis=1)
+    return [
+        FunctionResult(
+            name, FUNCTIONS[name], int(converged[i]) or None, float(final[i]),
+            float(correct[i]), params[i].tolist(),
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+def report(results: Sequence[FunctionResult]) -> str:
+    """Tabla Markdown con la convergencia de cada función."""
+
+    lines = [
+        "| función | tabla | época de convergencia | pérdida final | precisión |",
+        "|---|:---:|---:|---:|---:|",
+    ]
+    for r in results:
+        table = "".join(str(int(t)) for t in r.targets)
+        epoch = "—" if r.converged_epoch is None else str(r.converged_epoch)
+        lines.append(
+            f"| {r.name} | {table} | {epoch} | {r.final_loss:.6f} | {r.accuracy * 100:.0f}% |"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from data.boolean import truth_table
+    from data.datasets import ListDataset
+    from trainer.jit import AVAILABLE
+    from trainer.train import train
+
+    parser = argparse.ArgumentParser(description="Entrena las 16 funciones booleanas en una sola llamada compilada")
+    parser.add_argument("--epochs", type=int, default=5000)
+    parser.add_argument("--lr", type=float, default=0.5)
+    parser.add_argument("--init", choices=SCHEMES, default="fixed")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--target", type=float, default=0.05, help="Pérdida de convergencia")
+    parser.add_argument("--verify", action="store_true",
+                        help="Comparar tiempos y pesos con 16 corridas de trainer.train")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    train_boolean(1, functions=["XOR"])  # compila el núcleo de Numba
+    compile_time = time.perf_counter() - start
+    start = time.perf_counter()
+    results = train_boolean(args.epochs, args.lr, args.init, args.seed, args.target)
+    fast = time.perf_counter() - start
+    print(report(results))
+    engine = "Numba" if AVAILABLE else "Python (sin Numba)"
+    print(f"\n16 funciones en {fast:.3f} s con {engine} ({args.epochs} épocas; "
+          f"compilación {compile_time:.2f} s aparte)")
+    start = time.perf_counter()
+    train(MLP221(init=args.init, seed=args.seed), epochs=args.epochs, lr=args.lr)
+    print(f"Una sola corrida de trainer.train (XOR): {time.perf_counter() - start:.3f} s")
+
+    if args.verify:
+        start = time.perf_counter()
+        worst = 0.0
+        for r in results:
+            net = MLP221(init=args.init, seed=args.seed)
+            train(net, epochs=args.epochs, lr=args.lr, dataset=ListDataset(truth_table(r.name)))
+            worst = max(worst, max(abs(a - b) for a, b in zip(net.get_params(), r.params)))
+        separate = time.perf_counter() - start
+        print(f"16 corridas de trainer.train: {separate:.3f} s ({separate / fast:.1f}x) | "
+              f"máx. diferencia de parámetros {worst:.1e}")
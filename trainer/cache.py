@@ -0,0 +1,202 @@
+"""Caché en disco de resultados de entrenamiento, direccionada por contenido.
+
+El entrenamiento es determinista: mismos pesos iniciales, conjunto, tasa de
+aprendizaje, optimizador y código producen siempre la misma trayectoria. La
+clave de una corrida es el SHA-256 de todo eso (sin las épocas); cada entrada
+guarda los pesos finales y la curva de pérdida tras ``E`` épocas en un archivo
+``<clave>-<E>.bin``:
+
+- una corrida idéntica se devuelve sin entrenar;
+- una corrida con más épocas continúa desde la entrada más larga que no la
+  supere (el prefijo de la trayectoria ya está calculado);
+- el tamaño total se acota con ``max_bytes`` descartando las entradas usadas
+  hace más tiempo (LRU por fecha de modificación, que se renueva en cada uso).
+
+Cada archivo es una línea JSON de cabecera seguida de las pérdidas como
+``float64`` binarios.
+"""
+
+import hashlib
+import json
+import os
+import re
+from array import array
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from core.model import MLP221
+from data.datasets import XOR, Dataset
+from mlpio.service import atomic_write
+from trainer.history import LossHistory
+from trainer.train import train
+
+# Entradas terminadas; los temporales de ``atomic_write`` (".<clave>-<E>.*.bin")
+# no coinciden y nunca se borran mientras otro proceso los escribe.
+_ENTRY = re.compile(r"^[0-9a-f]{64}-\d+\.bin$")
+
+# Archivos cuyo contenido define la trayectoria; cualquier cambio invalida la caché
+CODE_FILES = (
+    "core/model.py",
+    "core/activations.py",
+    "core/losses.py",
+    "trainer/train.py",
+    "trainer/jit.py",
+)
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def code_version() -> str:
+    """Resumen del código que calcula la trayectoria (ver ``CODE_FILES``)."""
+
+    digest = hashlib.sha256()
+    for name in CODE_FILES:
+        digest.update(name.encode())
+        digest.update((_ROOT / name).read_bytes())
+    return digest.hexdigest()
+
+
+class CachedRun(NamedTuple):
+    """Entrada leída de la caché."""
+
+    epochs: int
+    params: List[float]
+    losses: array
+
+
+class ResultCache:
+    """Directorio de resultados con desalojo LRU acotado en bytes."""
+
+    def __init__(self, directory: str = ".mlp_cache", max_bytes: int = 256 << 20):
+        """
+        Parámetros:
+            directory: Carpeta de la caché (se crea si no existe)
+            max_bytes: Tamaño máximo total de las entradas
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._code = code_version()
+
+    def key(self, params: Sequence[float], dataset: Dataset, lr: float,
+            optimizer: str = "sgd") -> str:
+        """Clave de la trayectoria: pesos iniciales, conjunto, lr, optimizador y código."""
+
+        parts = (list(params), dataset.fingerprint(), float(lr), optimizer, self._code)
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _path(self, key: str, epochs: int) -> str:
+        return os.path.join(self.directory, f"{key}-{epochs}.bin")
+
+    def _entries(self, key: str) -> List[int]:
+        """Épocas de las entradas guardadas para ``key``."""
+
+        prefix = f"{key}-"
+        found = []
+        for entry in os.scandir(self.directory):
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".bin"):
+                found.append(int(name[len(prefix):-4]))
+        return found
+
+    def lookup(self, key: str, epochs: int) -> Optional[CachedRun]:
+        """Entrada más larga de ``key`` con a lo sumo ``epochs`` épocas (o None)."""
+
+        candidates = [e for e in self._entries(key) if e <= epochs]
+        if not candidates:
+            return None
+        path = self._path(key, max(candidates))
+        try:
+            with open(path, "rb") as file:
+                header = json.loads(file.readline())
+                losses = array("d")
+                losses.fromfile(file, header["epochs"])
+        except (OSError, ValueError, EOFError, KeyError):
+            return None
+        os.utime(path)  # renueva la posición LRU
+        return CachedRun(header["epochs"], header["params"], losses)
+
+    def store(self, key: str, params: Sequence[float], losses) -> None:
+        """Guarda pesos finales y pérdidas; luego aplica el límite de tamaño."""
+
+        values = losses.to_array() if isinstance(losses, LossHistory) else array("d", losses)
+        header = json.dumps({"epochs": len(values), "params": list(params)}).encode() + b"\n"
+        if len(header) + 8 * len(values) > self.max_bytes:
+            return
+
+        def write(tmp):
+            with open(tmp, "wb") as file:
+                file.write(header)
+                values.tofile(file)
+
+        atomic_write(self._path(key, len(values)), write)
+        self.evict()
+
+    def evict(self) -> None:
+        """Borra las entradas menos usadas hasta quedar bajo ``max_bytes``."""
+
+        entries = []
+        for entry in os.scandir(self.directory):
+            if _ENTRY.match(entry.name):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Vacía la caché."""
+
+        for entry in os.scandir(self.directory):
+            if _ENTRY.match(entry.name):
+                os.unlink(entry.path)
+
+
+def cached_train(
+    net: MLP221,
+    epochs: int,
+    lr: float = 0.5,
+    dataset: Optional[Dataset] = None,
+    trainer: Optional[Callable[..., LossHistory]] = None,
+    optimizer: str = "sgd",
+    cache: Optional[ResultCache] = None,
+):
+    """
+    Entrena ``net`` reutilizando la caché.
+
+    Argumentos:
+        net: El modelo a entrenar (se actualiza en el lugar)
+        epochs: Número total de épocas
+        lr: Tasa de aprendizaje
+        dataset: Conjunto de entrenamiento (por defecto XOR)
+        trainer: Función ``(net, epochs=, lr=, dataset=)`` para las épocas que
+            falten (por defecto ``trainer.train.train`` sin trazador)
+        optimizer: Nombre del optimizador, parte de la clave
+        cache: Caché a usar (por defecto ``ResultCache()``)
+
+    Devuelve:
+        Tupla (LossHistory completo, épocas que se tomaron de la caché)
+    """
+    trainer = train if trainer is None else trainer
+    data = XOR if dataset is None else dataset
+    cache = ResultCache() if cache is None else cache
+    key = cache.key(net.get_params(), data, lr, optimizer)
+
+    losses = LossHistory()
+    hit = cache.lookup(key, epochs)
+    cached = 0
+    if hit is not None:
+        cached = hit.epochs
+        net.set_params(hit.params)
+        losses.extend(hit.losses)
+    if cached < epochs:
+        losses.extend(trainer(net, epochs=epochs - cached, lr=lr, dataset=data))
+        if len(losses) == epochs:
+            cache.store(key, net.get_params(), losses)
+    return losses, cached
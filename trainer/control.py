@@ -0,0 +1,111 @@
+"""Control cooperativo de un entrenamiento en curso: pausar, reanudar y cancelar.
+
+El hilo que entrena consulta ``TrainingControl.check`` cada ``check_every``
+épocas y en la última; la interfaz (u otro hilo) llama a ``pause``, ``resume`` o
+``cancel``. Al cancelar, el bucle guarda un punto de control y la curva de
+pérdida parcial para no desperdiciar el trabajo ya hecho.
+"""
+
+import json
+import threading
+from typing import List, Optional
+
+from trainer.history import LossHistory
+
+
+class TrainingControl:
+    """Ficha de control compartida entre la UI y el bucle de entrenamiento."""
+
+    def __init__(
+        self,
+        check_every: int = 100,
+        checkpoint_path: Optional[str] = "checkpoint.json",
+        loss_path: Optional[str] = "loss_parcial.png",
+    ):
+        """
+        Parámetros:
+            check_every: Épocas entre consultas de la ficha
+            checkpoint_path: Archivo JSON del punto de control al cancelar (None = no guardar)
+            loss_path: Imagen de la curva parcial al cancelar (None = no guardar)
+        """
+        self.check_every = max(1, check_every)
+        self.checkpoint_path = checkpoint_path
+        self.loss_path = loss_path
+        self.stopped_epoch: Optional[int] = None
+        self.saved: List[str] = []
+        self._cancel = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    def pause(self) -> None:
+        """Detiene el bucle en la próxima consulta hasta ``resume`` o ``cancel``."""
+
+        self._running.clear()
+
+    def resume(self) -> None:
+        """Reanuda un entrenamiento pausado."""
+
+        self._running.set()
+
+    def cancel(self) -> None:
+        """Pide terminar el entrenamiento en la próxima consulta."""
+
+        self._cancel.set()
+        self._running.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def check(self) -> bool:
+        """
+        Punto de consulta del bucle: bloquea mientras está en pausa.
+
+        Devuelve:
+            True si hay que detener el entrenamiento
+        """
+        self._running.wait()
+        return self._cancel.is_set()
+
+    def finish(self, net, epoch: int, lr: Optional[float], losses) -> None:
+        """
+        Guarda el punto de control y la curva parcial tras una cancelación.
+
+        ``stopped_epoch`` y ``saved`` (rutas escritas de verdad) quedan como
+        constancia para quien lanzó el entrenamiento.
+        """
+
+        self.stopped_epoch = epoch
+        self.saved = []
+        if self.checkpoint_path:
+            save_checkpoint(net, self.checkpoint_path, epoch, lr, losses)
+            self.saved.append(self.checkpoint_path)
+        if self.loss_path and len(losses):
+            from mlpio.export import export_loss_plot
+
+            export_loss_plot(losses, self.loss_path)
+            self.saved.append(self.loss_path)
+
+
+def save_checkpoint(net, path: str, epoch: int, lr: Optional[float], losses=()) -> None:
+    """Escribe parámetros, época, LR (None sin él) y resumen de pérdidas en un JSON."""
+
+    state = {"epoch": epoch, "lr": lr, "params": net.get_params()}
+    if len(losses):
+        best = losses.min if isinstance(losses, LossHistory) else min(losses)
+        state["loss"] = {"last": losses[-1], "min": best}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(state, file, indent=2)
+
+
+def load_checkpoint(net, path: str) -> dict:
+    """Carga en ``net`` los parámetros de un punto de control y devuelve su contenido."""
+
+    with open(path, encoding="utf-8") as file:
+        state = json.load(file)
+    net.set_params(state["params"])
+    return state
@@ -0,0 +1,207 @@
+"""Verificación de gradientes analíticos contra diferencias finitas centrales.
+
+Las diferencias finitas se calculan en una sola pasada vectorizada: las 18
+perturbaciones ``p ± h·e_i`` de los 9 parámetros se apilan en un
+``BatchedMLP221`` (float64) y se evalúa la pérdida media de todas sobre el lote
+completo a la vez. El gradiente numérico es ``(L(p + h·e_i) - L(p - h·e_i)) / 2h``.
+
+Cada *backend* es una función ``(params, X, Y) -> 9 gradientes medios`` en el
+orden de ``MLP221.get_params``. ``backends()`` adapta los motores del proyecto:
+
+- ``MLP221`` y ``CompactMLP221``: ``forward`` + ``backward`` muestra a muestra
+- ``train_step``: el paso fusionado, recuperando el gradiente del cambio de
+  parámetros tras un paso con ``lr=1`` sobre una sola muestra
+- ``BatchedMLP221``: ``gradients`` vectorizado
+- ``jit``: el núcleo Numba (si está instalado), igual que ``train_step``
+
+``assert_gradients`` sirve como verificación en cualquier prueba o benchmark.
+Requiere NumPy. Ejecutar ``python -m trainer.gradcheck`` revisa todos los motores.
+"""
+
+import argparse
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+from core.compact import CompactMLP221
+from core.model import MLP221
+from core.vectorized import BatchedMLP221
+from data.xor import DATA
+
+GradFn = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+# Tensores en el orden plano de MLP221.get_params
+TENSORS = {"W1": slice(0, 4), "b1": slice(4, 6), "W2": slice(6, 8), "b2": slice(8, 9)}
+
+
+def numeric_gradients(params, X, Y, h: float = 1e-4) -> np.ndarray:
+    """Gradiente de la BCE media por diferencias centrales (las 18 evaluaciones a la vez)."""
+
+    p = np.asarray(params, dtype=np.float64)
+    offsets = np.eye(9) * h
+    pop = BatchedMLP221(np.concatenate([p + offsets, p - offsets]))
+    losses = pop.losses(X, Y)
+    return (losses[:9] - losses[9:]) / (2.0 * h)
+
+
+def relative_errors(analytic, numeric, floor: float = 1e-8) -> Dict[str, float]:
+    """Máximo error relativo por tensor: ``|a - n| / max(|a|, |n|, floor)``."""
+
+    a = np.asarray(analytic, dtype=np.float64)
+    n = np.asarray(numeric, dtype=np.float64)
+    rel = np.abs(a - n) / np.maximum(np.maximum(np.abs(a), np.abs(n)), floor)
+    return {name: float(rel[idx].max()) for name, idx in TENSORS.items()}
+
+
+# ------------------------------------------------------------------ backends
+
+def backward_gradients(cls=MLP221) -> GradFn:
+    """Gradientes medios con ``forward``/``backward`` de una clase tipo ``MLP221``."""
+
+    def grads(params, X, Y):
+        net = cls()
+        net.set_params(list(params))
+        total = np.zeros(9)
+        for x, y in zip(X.tolist(), Y.tolist()):
+            net.forward(x)
+            net.backward(y)
+            total += [
+                net.dW1[0][0], net.dW1[0][1], net.dW1[1][0], net.dW1[1][1],
+                net.db1[0], net.db1[1], net.dW2[0][0], net.dW2[0][1], net.db2[0],
+            ]
+        return total / len(X)
+
+    return grads
+
+
+def train_step_gradients(cls=MLP221) -> GradFn:
+    """Gradientes medios recuperados de ``train_step`` (paso de ``lr=1`` por muestra)."""
+
+    def grads(params, X, Y):
+        start = np.asarray(params, dtype=np.float64)
+        total = np.zeros(9)
+        net = cls()
+        for x, y in zip(X.tolist(), Y.tolist()):
+            net.set_params(start.tolist())
+            net.train_step(x, y, 1.0)
+            total += start - np.array(net.get_params())
+        return total / len(X)
+
+    return grads
+
+
+def batched_gradients(dtype: str = "float64") -> GradFn:
+    """Gradientes medios de ``BatchedMLP221.gradients`` (población de una red)."""
+
+    def grads(params, X, Y):
+        pop = BatchedMLP221(params, dtype)
+        return pop.gradients(X, Y)[0][0].astype(np.float64)
+
+    return grads
+
+
+def jit_gradients() -> Optional[GradFn]:
+    """Gradientes del núcleo compilado de ``trainer.jit`` (None sin Numba)."""
+
+    from trainer import jit
+
+    if not jit.AVAILABLE:
+        return None
+
+    def grads(params, X, Y):
+        start = np.asarray(params, dtype=np.float64)
+        total = np.zeros(9)
+        out = np.empty(1)
+        for k in range(len(X)):
+            p = start.copy()
+            jit._kernel(p, X[k:k + 1], Y[k:k + 1], np.ones(1), 1, out)
+            total += start - p
+        return total / len(X)
+
+    return grads
+
+
+def backends() -> Dict[str, GradFn]:
+    """Todos los motores disponibles en este entorno."""
+
+    found = {
+        "MLP221": backward_gradients(MLP221),
+        "MLP221.train_step": train_step_gradients(MLP221),
+        "CompactMLP221": backward_gradients(CompactMLP221),
+        "CompactMLP221.train_step": train_step_gradients(CompactMLP221),
+        "BatchedMLP221": batched_gradients(),
+    }
+    fast = jit_gradients()
+    if fast is not None:
+        found["jit"] = fast
+    return found
+
+
+# ------------------------------------------------------------------ verificación
+
+def check_gradients(
+    backend: GradFn,
+    params: Optional[Sequence[float]] = None,
+    X=None,
+    Y=None,
+    h: float = 1e-4,
+) -> Dict[str, float]:
+    """
+    Compara el gradiente de ``backend`` con diferencias finitas.
+
+    Args:
+        backend: Función ``(params, X, Y) -> 9 gradientes medios``
+        params: Parámetros donde evaluar (por defecto los fijos de ``MLP221``)
+        X: Entradas ``(B, 2)`` (por defecto las 4 filas del XOR)
+        Y: Objetivos ``(B,)``
+        h: Paso de las diferencias centrales
+
+    Returns:
+        Máximo error relativo por tensor (``W1``, ``b1``, ``W2``, ``b2``)
+    """
+    params = np.asarray(MLP221().get_params() if params is None else params, dtype=np.float64)
+    if X is None:
+        X = np.array([x for x, _ in DATA], dtype=np.float64)
+        Y = np.array([y for _, y in DATA], dtype=np.float64)
+    X = np.asarray(X, dtype=np.float64).reshape(-1, 2)
+    Y = np.asarray(Y, dtype=np.float64)
+    return relative_errors(backend(params, X, Y), numeric_gradients(params, X, Y, h))
+
+
+def assert_gradients(backend: GradFn, tol: float = 1e-6, **kwargs) -> Dict[str, float]:
+    """
+    ``check_gradients`` que falla si algún tensor supera ``tol``.
+
+    Raises:
+        AssertionError con los errores por tensor
+    """
+    errors = check_gradients(backend, **kwargs)
+    if not all(err <= tol for err in errors.values()):
+        detail = ", ".join(f"{name}={err:.2e}" for name, err in errors.items())
+        raise AssertionError(f"Gradiente incorrecto (tol={tol:.0e}): {detail}")
+    return errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verifica los gradientes de todos los motores")
+    parser.add_argument("--seeds", type=int, default=8, help="Inicializaciones xavier a probar")
+    parser.add_argument("--batch", type=int, default=64, help="Puntos aleatorios además del XOR")
+    parser.add_argument("--tol", type=float, default=1e-6)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    X = np.vstack([[x for x, _ in DATA], rng.random((args.batch, 2))])
+    Y = np.round(X[:, 0]) != np.round(X[:, 1])
+    points = [MLP221().get_params()] + [
+        MLP221(init="xavier", seed=s).get_params() for s in range(args.seeds)
+    ]
+
+    print("| motor | W1 | b1 | W2 | b2 | estado |\n|---|---:|---:|---:|---:|---|")
+    for name, backend in backends().items():
+        worst = {key: 0.0 for key in TENSORS}
+        for params in points:
+            errors = check_gradients(backend, params, X, Y.astype(np.float64))
+            worst = {key: max(worst[key], errors[key]) for key in TENSORS}
+        ok = all(err <= args.tol for err in worst.values())
+        cells = " | ".join(f"{worst[key]:.2e}" for key in TENSORS)
+        print(f"| {name} | {cells} | {'ok' if ok else 'FALLA'} |")
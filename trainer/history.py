@@ -0,0 +1,218 @@
+"""Historial de pérdidas compacto con agregados incrementales.
+
+``LossHistory`` sustituye a la lista de floats que devolvían los bucles de
+entrenamiento. Guarda los valores en un ``array('d')`` (8 bytes por época en
+lugar de ~32 de un float en lista), mantiene mínimo, media y EMA en O(1) y una
+pirámide de medias por bloques para dibujar curvas decimadas sin recorrer toda
+la serie. Más allá de ``spill_threshold`` valores el almacenamiento pasa a un
+archivo temporal mapeado en memoria.
+"""
+
+import math
+import mmap
+import tempfile
+from array import array
+from typing import Iterator, List, Optional, Tuple, Union
+
+
+class LossHistory:
+    """Secuencia de pérdidas por época con consultas O(1)/O(log n)."""
+
+    def __init__(
+        self,
+        ema_alpha: float = 0.01,
+        bucket: int = 16,
+        spill_threshold: int = 1 << 22,
+        spill_dir: Optional[str] = None,
+    ):
+        """
+        Parámetros:
+            ema_alpha: Factor de suavizado de la media móvil exponencial
+            bucket: Valores agregados por bloque en cada nivel de la pirámide
+            spill_threshold: Número de valores a partir del cual se usa mmap
+            spill_dir: Carpeta del archivo temporal (None = la del sistema)
+        """
+        if bucket < 2:
+            raise ValueError("bucket debe ser al menos 2")
+        self.ema_alpha = ema_alpha
+        self.bucket = bucket
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+
+        self._values = array("d")
+        self._n = 0
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._capacity = 0
+
+        self._sum = 0.0
+        self._min = math.inf
+        self._ema: Optional[float] = None
+
+        # Pirámide: levels[k] guarda medias de bucket**(k+1) valores consecutivos
+        self.levels: List[array] = []
+        self._partial: List[List[float]] = []  # [suma, cuenta] por nivel
+
+    # ------------------------------------------------------------------ escritura
+    def append(self, value: float) -> None:
+        """Añade la pérdida de una época y actualiza los agregados."""
+
+        value = float(value)
+        if self._view is not None:
+            if self._n == self._capacity:
+                self._grow(self._capacity * 2)
+            self._view[self._n] = value
+        else:
+            self._values.append(value)
+            if self._n + 1 >= self.spill_threshold:
+                self._spill()
+        self._n += 1
+
+        self._sum += value
+        if value < self._min:
+            self._min = value
+        if self._ema is None:
+            self._ema = value
+        else:
+            self._ema += self.ema_alpha * (value - self._ema)
+        self._push_level(0, value)
+
+    def extend(self, values) -> None:
+        """Añade varias pérdidas en orden."""
+
+        for value in values:
+            self.append(value)
+
+    def _push_level(self, level: int, value: float) -> None:
+        """Acumula ``value`` en el nivel indicado y propaga bloques completos."""
+
+        while True:
+            if level == len(self.levels):
+                self.levels.append(array("d"))
+                self._partial.append([0.0, 0])
+            partial = self._partial[level]
+            partial[0] += value
+            partial[1] += 1
+            if partial[1] < self.bucket:
+                return
+            value = partial[0] / partial[1]
+            partial[0], partial[1] = 0.0, 0
+            self.levels[level].append(value)
+            level += 1
+
+    def _spill(self) -> None:
+        """Mueve los valores a un archivo temporal mapeado en memoria."""
+
+        self._file = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._map(max(len(self._values) * 2, mmap.PAGESIZE // 8))
+        self._view[: len(self._values)] = self._values
+        self._values = array("d")
+
+    def _map(self, capacity: int) -> None:
+        self._file.truncate(capacity * 8)
+        self._mmap = mmap.mmap(self._file.fileno(), capacity * 8)
+        self._view = memoryview(self._mmap).cast("d")
+        self._capacity = capacity
+
+    def _grow(self, capacity: int) -> None:
+        self._view.release()
+        self._mmap.close()
+        self._map(capacity)
+
+    def close(self) -> None:
+        """Libera el archivo mapeado (si lo hay); el historial queda vacío."""
+
+        if self._view is not None:
+            self._view.release()
+            self._mmap.close()
+            self._file.close()
+            self._view = self._mmap = self._file = None
+        self._values = array("d")
+        self._n = 0
+
+    # ------------------------------------------------------------------ lectura
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n))]
+        if index < 0:
+            index += self._n
+        if not 0 <= index < self._n:
+            raise IndexError("índice fuera del historial")
+        store = self._view if self._view is not None else self._values
+        return store[index]
+
+    def __iter__(self) -> Iterator[float]:
+        store = self._view if self._view is not None else self._values
+        for i in range(self._n):
+            yield store[i]
+
+    def to_array(self) -> array:
+        """Copia los valores a un ``array('d')`` independiente."""
+
+        if self._view is None:
+            return array("d", self._values)
+        return array("d", self._view[: self._n])
+
+    @property
+    def spilled(self) -> bool:
+        """True si los valores viven en un archivo mapeado."""
+
+        return self._view is not None
+
+    @property
+    def last(self) -> float:
+        """Última pérdida registrada."""
+
+        return self[-1]
+
+    @property
+    def min(self) -> float:
+        """Pérdida mínima registrada (O(1))."""
+
+        return self._min
+
+    @property
+    def mean(self) -> float:
+        """Media de todas las pérdidas (O(1))."""
+
+        return self._sum / self._n if self._n else math.nan
+
+    @property
+    def ema(self) -> float:
+        """Media móvil exponencial de las pérdidas (O(1))."""
+
+        return self._ema if self._ema is not None else math.nan
+
+    def decimated(self, max_points: int = 1000) -> List[Tuple[float, float]]:
+        """
+        Devuelve como mucho ``max_points`` pares (época, pérdida media).
+
+        Elige el nivel más fino de la pirámide que cabe en ``max_points`` (O(log
+        n)) y lo completa con el resto parcial, así que el costo no depende del
+        número total de épocas.
+        """
+        if self._n <= max_points:
+            return [(i + 1.0, v) for i, v in enumerate(self)]
+        size = self.bucket
+        for k, level in enumerate(self.levels):
+            if len(level) + 1 <= max_points:
+                points = [
+                    (i * size + (size + 1) / 2.0, v) for i, v in enumerate(level)
+                ]
+                # El resto sin bloque completo se reconstruye con las sumas
+                # parciales de los niveles 0..k, cada una con su peso
+                tail_sum, weight = 0.0, 1
+                for partial in self._partial[: k + 1]:
+                    tail_sum += partial[0] * weight
+                    weight *= self.bucket
+                tail = self._n - len(level) * size
+                if tail:
+                    start = len(level) * size
+                    points.append((start + (tail + 1) / 2.0, tail_sum / tail))
+                return points
+            size *= self.bucket
+        return [((self._n + 1) / 2.0, self.mean)]
@@ -0,0 +1,298 @@
+"""Motor de entrenamiento compilado con Numba (opcional) y respaldo en Python.
+
+``train_fast`` ejecuta la recurrencia forward/backward/SGD de ``MLP221`` sobre
+todas las muestras y muchas épocas dentro de una única llamada compilada a
+código nativo. Si Numba (o NumPy) no está instalado recurre de forma
+transparente a ``train_with_callback``; ambos caminos hacen las mismas
+operaciones en el mismo orden y ``verify_engine`` comprueba que coinciden dentro
+de una tolerancia.
+
+Ejecutar ``python -m trainer.jit`` compara ambos motores.
+"""
+
+import argparse
+import math
+import time
+from typing import Callable, Optional, Union
+
+from core.activations import sigmoid
+from core.losses import bce
+from core.model import MLP221
+from data.datasets import XOR, Dataset, NpyDataset
+from trainer.control import TrainingControl
+from trainer.history import LossHistory
+from trainer.schedules import Schedule
+from trainer.snapshots import SnapshotRing
+from trainer.train import train_with_callback
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    numba = None
+    np = None
+
+AVAILABLE = numba is not None
+
+
+def _sgd_epochs(p, X, Y, lrs, epochs, out):
+    """
+    Núcleo compilable: ``epochs`` épocas de SGD muestra a muestra.
+
+    ``p`` son los 9 parámetros en el orden de ``MLP221.get_params`` y se
+    actualizan en el lugar; ``lrs[e]`` es la tasa de aprendizaje de la época e
+    y ``out[e]`` recibe su pérdida media.
+    """
+    n = X.shape[0]
+    for ep in range(epochs):
+        lr = lrs[ep]
+        ep_loss = 0.0
+        for k in range(n):
+            x0 = X[k, 0]
+            x1 = X[k, 1]
+            y = Y[k]
+
+            z10 = p[4]
+            z10 += p[0] * x0
+            z10 += p[1] * x1
+            a0 = _sigmoid(z10)
+            z11 = p[5]
+            z11 += p[2] * x0
+            z11 += p[3] * x1
+            a1 = _sigmoid(z11)
+            z2 = p[8]
+            z2 += p[6] * a0
+            z2 += p[7] * a1
+            yhat = _sigmoid(z2)
+            ep_loss += _bce(yhat, y)
+
+            delta2 = yhat - y
+            g_w20 = delta2 * a0
+            g_w21 = delta2 * a1
+            d0 = (p[6] * delta2) * (a0 * (1.0 - a0))
+            d1 = (p[7] * delta2) * (a1 * (1.0 - a1))
+
+            p[4] -= lr * d0
+            p[0] -= lr * (d0 * x0)
+            p[1] -= lr * (d0 * x1)
+            p[5] -= lr * d1
+            p[2] -= lr * (d1 * x0)
+            p[3] -= lr * (d1 * x1)
+            p[8] -= lr * delta2
+            p[6] -= lr * g_w20
+            p[7] -= lr * g_w21
+        out[ep] = ep_loss / n
+
+
+def _sgd_population(P, X, Y, lrs, epochs, out):
+    """
+    Núcleo compilable: ``_sgd_epochs`` para cada fila de ``P`` (una red por fila).
+
+    ``Y[i]`` son los objetivos de la red i y ``out[i, e]`` su pérdida media en
+    la época e; toda la población se entrena en una sola llamada nativa.
+    """
+    for i in range(P.shape[0]):
+        _kernel(P[i], X, Y[i], lrs, epochs, out[i])
+
+
+if AVAILABLE:
+    _sigmoid = numba.njit(sigmoid)
+    _bce = numba.njit(bce)
+    _kernel = numba.njit(_sgd_epochs)
+    _population_kernel = numba.njit(_sgd_population)
+else:
+    _sigmoid = sigmoid
+    _bce = bce
+    _kernel = None
+    _population_kernel = None
+
+
+def _as_arrays(data: Dataset):
+    """Convierte el conjunto en arreglos contiguos ``X (n, 2)`` e ``Y (n,)``."""
+
+    if isinstance(data, NpyDataset):
+        return (
+            np.ascontiguousarray(data.array[:, :2], dtype=np.float64),
+            np.ascontiguousarray(data.array[:, 2], dtype=np.float64),
+        )
+    X = np.empty((len(data), 2))
+    Y = np.empty(len(data))
+    row = 0
+    for block in data.iter_chunks():
+        for x, y in block:
+            X[row, 0] = x[0]
+            X[row, 1] = x[1]
+            Y[row] = y
+            row += 1
+    return X, Y
+
+
+def train_fast(
+    net: MLP221,
+    epochs: int = 3000,
+    lr: Union[float, Schedule] = 0.5,
+    dataset: Optional[Dataset] = None,
+    callback: Optional[Callable[[int, int, float], None]] = None,
+    chunk_epochs: int = 10000,
+    control: Optional[TrainingControl] = None,
+    snapshots: Optional[SnapshotRing] = None,
+) -> LossHistory:
+    """
+    Entrena ``net`` con el motor compilado (o el de Python si no hay Numba).
+
+    Argumentos:
+        net: El modelo a entrenar (se actualiza en el lugar)
+        epochs: Número de épocas
+        lr: Tasa de aprendizaje constante o ``Schedule``; los LR de cada bloque
+            se calculan antes de la llamada compilada, salvo con un programa
+            ``adaptive`` (``ReduceOnPlateau``), que se ejecuta época a época para
+            seguir la misma trayectoria que el motor de Python
+        dataset: Conjunto de entrenamiento (por defecto XOR)
+        callback: Función callback opcional(epoch, total_epochs, avg_loss); con
+            el motor compilado se invoca una vez por bloque de ``chunk_epochs``
+        chunk_epochs: Épocas por llamada compilada entre callbacks
+        control: Ficha opcional de pausa/cancelación, consultada entre bloques
+        snapshots: Anillo opcional de instantáneas; los bloques se acortan a
+            ``snapshots.stride`` épocas para registrar cada múltiplo
+
+    Devuelve:
+        LossHistory con las pérdidas promedio por época
+    """
+    data = XOR if dataset is None else dataset
+    if not AVAILABLE:
+        return train_with_callback(
+            net, epochs=epochs, lr=lr, callback=callback, dataset=data, control=control,
+            snapshots=snapshots,
+        )
+    if data.n_inputs != 2:
+        raise ValueError("MLP221 requiere un conjunto con 2 entradas")
+
+    X, Y = _as_arrays(data)
+    p = np.array(net.get_params(), dtype=np.float64)
+    losses = LossHistory()
+    done = 0
+    schedule = lr if isinstance(lr, Schedule) else None
+    if snapshots is not None:
+        snapshots.record(0, p.tolist())
+        chunk_epochs = min(chunk_epochs, snapshots.stride)
+    while done < epochs:
+        count = min(chunk_epochs, epochs - done)
+        out = np.empty(count)
+        if schedule and schedule.adaptive:
+            # El LR de cada época depende de la pérdida de la anterior: una
+            # llamada compilada por época para que ``update`` llegue a tiempo.
+            lrs = np.empty(count)
+            for e in range(count):
+                lrs[e] = schedule.lr(done + e + 1)
+                _kernel(p, X, Y, lrs[e:e + 1], 1, out[e:e + 1])
+                schedule.update(done + e + 1, float(out[e]))
+        else:
+            if schedule:
+                lrs = np.array([schedule.lr(done + e) for e in range(1, count + 1)])
+            else:
+                lrs = np.full(count, float(lr))
+            _kernel(p, X, Y, lrs, count, out)
+            if schedule:
+                for e, loss in enumerate(out.tolist(), done + 1):
+                    schedule.update(e, loss)
+        losses.extend(out.tolist())
+        done += count
+        if snapshots is not None and (done % snapshots.stride == 0 or done == epochs):
+            snapshots.record(done, p.tolist())
+        if callback:
+            callback(done, epochs, float(out[-1]))
+        if control is not None and control.check():
+            net.set_params(p.tolist())
+            control.finish(net, done, float(lrs[-1]), losses)
+            break
+    net.set_params(p.tolist())
+    return losses
+
+
+def train_population(params, X, Y, lr: float = 0.5, epochs: int = 3000):
+    """
+    Entrena P redes independientes, cada una con sus propios objetivos.
+
+    Con Numba la población completa se entrena en una única llamada compilada;
+    sin Numba recurre a ``BatchedMLP221.sgd_epoch``. Cada red sigue la misma
+    trayectoria que tendría entrenada sola con ``trainer.train``.
+
+    Argumentos:
+        params: Parámetros iniciales ``(P, 9)`` en el orden de ``MLP221.get_params``
+        X: Entradas ``(n, 2)`` comunes a todas las redes
+        Y: Objetivos ``(P, n)``, una fila por red
+        lr: Tasa de aprendizaje constante
+        epochs: Número de épocas
+
+    Devuelve:
+        Tupla ``(parámetros finales (P, 9), pérdidas medias por época (P, epochs))``
+    """
+    P = np.array(params, dtype=np.float64)
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    Y = np.ascontiguousarray(Y, dtype=np.float64)
+    if P.ndim != 2 or P.shape[1] != 9 or Y.shape != (P.shape[0], X.shape[0]):
+        raise ValueError("Se esperaba params (P, 9), X (n, 2) e Y (P, n)")
+    out = np.empty((P.shape[0], epochs))
+    if AVAILABLE:
+        _population_kernel(P, X, Y, np.full(epochs, float(lr)), epochs, out)
+        return P, out
+
+    from core.vectorized import BatchedMLP221
+
+    pop = BatchedMLP221(P)
+    for ep in range(epochs):
+        out[:, ep] = pop.sgd_epoch(X, Y, lr)
+    return pop.params, out
+
+
+def verify_engine(epochs: int = 3000, lr: float = 0.5, rtol: float = 1e-9) -> float:
+    """
+    Comprueba que el núcleo ``_sgd_epochs`` reproduce al motor de Python.
+
+    Siempre ejecuta el núcleo sin compilar sobre arreglos de NumPy y, si hay
+    Numba, también su versión compilada; así la tolerancia cubre la aritmética
+    del núcleo aunque ``train_fast`` esté usando el respaldo de Python.
+
+    Devuelve:
+        Máxima diferencia relativa entre pérdidas y parámetros de los motores
+
+    Lanza:
+        AssertionError si la diferencia supera ``rtol``
+        RuntimeError si NumPy no está instalado
+    """
+    if np is None:
+        raise RuntimeError("verify_engine requiere NumPy")
+    reference = MLP221()
+    ref_losses = train_with_callback(reference, epochs=epochs, lr=lr)
+    X, Y = _as_arrays(XOR)
+    kernels = [_sgd_epochs] + ([_kernel] if AVAILABLE else [])
+
+    def rel(a, b):
+        return abs(a - b) / max(abs(a), abs(b), 1e-300)
+
+    worst = 0.0
+    for kernel in kernels:
+        p = np.array(MLP221().get_params(), dtype=np.float64)
+        out = np.empty(epochs)
+        kernel(p, X, Y, np.full(epochs, float(lr)), epochs, out)
+        worst = max(
+            worst,
+            max(rel(a, b) for a, b in zip(ref_losses, out.tolist())),
+            max(rel(a, b) for a, b in zip(reference.get_params(), p.tolist())),
+        )
+    if not math.isfinite(worst) or worst > rtol:
+        raise AssertionError(f"El núcleo difiere del motor de Python: error relativo {worst:.3e}")
+    return worst
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compara el motor compilado con el de Python")
+    parser.add_argument("--epochs", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"Numba disponible: {AVAILABLE}")
+    print(f"Error relativo máximo: {verify_engine():.3e}")
+    for name, fn in (("python", train_with_callback), ("jit", train_fast)):
+        start = time.perf_counter()
+        fn(MLP221(), epochs=args.epochs)
+        print(f"{name}: {time.perf_counter() - start:.3f} s para {args.epochs} épocas")
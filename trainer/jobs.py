@@ -0,0 +1,534 @@
+"""Cola persistente de trabajos de entrenamiento sobre SQLite.
+
+Para campañas con muchas configuraciones de ``run.py --train``: cada trabajo es
+una configuración (épocas, lr, programa, optimizador, inicialización, semilla,
+conjunto y motor) guardada en una base SQLite con su estado ``pending``,
+``running``, ``done`` o ``failed``.
+
+- **Sin duplicados**: la clave de un trabajo es el SHA-256 de la configuración
+  normalizada y de la versión del código (``trainer.cache.code_version``);
+  encolar dos veces lo mismo no crea un segundo trabajo.
+- **Despacho**: ``run_workers`` lanza procesos que reclaman trabajos de a uno
+  con una transacción ``BEGIN IMMEDIATE``, así que varios procesos (o varios
+  despachadores) nunca toman el mismo.
+- **Recuperación**: cada proceso marca su trabajo con su PID y renueva un
+  latido mientras entrena. Al arrancar, ``run_workers`` devuelve a ``pending``
+  los trabajos ``running`` cuyo proceso ya no existe o cuyo latido es viejo (un
+  despachador que murió); tras ``max_attempts`` intentos pasan a ``failed``.
+- **Resultados**: pesos finales, pérdida final y mínima, época de convergencia,
+  precisión, duración y la curva de pérdida reducida quedan en la tabla
+  ``results``; la vista ``summary`` los une con la configuración, para
+  consultarlos también con ``sqlite3``.
+
+Ejecutar ``python -m trainer.jobs --help`` para la CLI (``add``, ``run``,
+``status``, ``results``, ``retry``).
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing as mp
+import os
+import socket
+import sqlite3
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from core.initializers import SCHEMES
+from core.model import MLP221
+from data.datasets import load_dataset
+from trainer.cache import code_version
+from trainer.optimizers import OPTIMIZERS, make_optimizer
+from trainer.schedules import make_schedule
+
+STATUSES = ("pending", "running", "done", "failed")
+ENGINES = ("python", "jit")
+DEFAULTS = {
+    "train": 3000,
+    "lr": 0.5,
+    "schedule": "constant",
+    "optimizer": "sgd",
+    "init": "fixed",
+    "seed": None,
+    "dataset": "xor",
+    "engine": "python",
+}
+HEARTBEAT = 5.0  # segundos entre latidos de un trabajo en curso
+CONVERGED = 0.05  # pérdida media que cuenta como convergencia
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id        INTEGER PRIMARY KEY,
+    key       TEXT NOT NULL UNIQUE,
+    config    TEXT NOT NULL,
+    status    TEXT NOT NULL DEFAULT 'pending'
+              CHECK (status IN ('pending', 'running', 'done', 'failed')),
+    attempts  INTEGER NOT NULL DEFAULT 0,
+    host      TEXT,
+    pid       INTEGER,
+    created   REAL NOT NULL,
+    started   REAL,
+    heartbeat REAL,
+    finished  REAL,
+    error     TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+CREATE TABLE IF NOT EXISTS results (
+    job_id          INTEGER PRIMARY KEY REFERENCES jobs (id),
+    params          TEXT NOT NULL,
+    final_loss      REAL,
+    min_loss        REAL,
+    converged_epoch INTEGER,
+    accuracy        REAL,
+    epochs          INTEGER,
+    seconds         REAL,
+    curve           TEXT
+);
+CREATE VIEW IF NOT EXISTS summary AS
+SELECT j.id, j.status,
+       json_extract(j.config, '$.train') AS train,
+       json_extract(j.config, '$.lr') AS lr,
+       json_extract(j.config, '$.schedule') AS schedule,
+       json_extract(j.config, '$.optimizer') AS optimizer,
+       json_extract(j.config, '$.init') AS init,
+       json_extract(j.config, '$.seed') AS seed,
+       json_extract(j.config, '$.dataset') AS dataset,
+       json_extract(j.config, '$.engine') AS engine,
+       r.final_loss, r.min_loss, r.converged_epoch, r.accuracy, r.seconds
+FROM jobs j LEFT JOIN results r ON r.job_id = j.id;
+"""
+
+
+class Job(NamedTuple):
+    """Trabajo reclamado por un proceso."""
+
+    id: int
+    config: Dict
+    attempts: int
+
+
+class JobResult(NamedTuple):
+    """Resultado guardado de un trabajo terminado."""
+
+    id: int
+    config: Dict
+    params: List[float]
+    final_loss: float
+    min_loss: float
+    converged_epoch: Optional[int]
+    accuracy: float
+    seconds: float
+
+
+def normalize_config(config: Dict) -> Dict:
+    """
+    Completa ``config`` con ``DEFAULTS`` y la valida.
+
+    Dos configuraciones que entrenan igual quedan idénticas (``lr`` como
+    ``float``; con ``init="fixed"`` la semilla no influye y se descarta, y con
+    un optimizador de segundo orden tampoco el ``lr``, que queda en None).
+
+    Lanza:
+        ValueError si hay claves desconocidas o valores inválidos
+    """
+    unknown = set(config) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Opciones de trabajo desconocidas: {', '.join(sorted(unknown))}")
+    cfg = {**DEFAULTS, **config}
+    cfg["train"] = int(cfg["train"])
+    cfg["lr"] = float(cfg["lr"]) if cfg["optimizer"] == "sgd" else None
+    if cfg["train"] <= 0:
+        raise ValueError("Las épocas deben ser positivas")
+    if cfg["init"] not in SCHEMES:
+        raise ValueError(f"Esquema de inicialización desconocido: {cfg['init']!r}")
+    if cfg["engine"] not in ENGINES:
+        raise ValueError(f"Motor desconocido: {cfg['engine']!r}")
+    make_optimizer(cfg["optimizer"])
+    make_schedule(cfg["schedule"], 1.0, 1)
+    try:
+        if load_dataset(cfg["dataset"]).n_inputs != 2:
+            raise ValueError(f"El conjunto {cfg['dataset']!r} no tiene 2 entradas")
+    except OSError as exc:
+        raise ValueError(f"No se pudo abrir el conjunto {cfg['dataset']!r}: {exc}") from exc
+    if cfg["optimizer"] != "sgd" and (cfg["engine"] != "python" or cfg["schedule"] != "constant"):
+        raise ValueError(f"El optimizador {cfg['optimizer']} solo admite motor python "
+                         "y programa constant")
+    cfg["seed"] = None if cfg["init"] == "fixed" or cfg["seed"] is None else int(cfg["seed"])
+    return cfg
+
+
+def job_key(config: Dict, version: Optional[str] = None) -> str:
+    """Clave de deduplicación: configuración normalizada y versión del código."""
+
+    text = json.dumps(normalize_config(config), sort_keys=True)
+    return hashlib.sha256(f"{text}\n{version or code_version()}".encode()).hexdigest()
+
+
+def run_job(config: Dict, heartbeat: Optional[Callable[[], None]] = None) -> Dict:
+    """
+    Entrena una configuración (sin trazas) y resume el resultado.
+
+    Parámetros:
+        config: Configuración normalizada
+        heartbeat: Función llamada como mucho cada ``HEARTBEAT`` segundos
+
+    Devuelve:
+        Diccionario con las columnas de la tabla ``results``
+    """
+    from trainer.jit import train_fast
+    from trainer.train import train_with_callback
+
+    cfg = normalize_config(config)
+    net = MLP221(init=cfg["init"], seed=cfg["seed"])
+    data = load_dataset(cfg["dataset"])
+    last_beat = [time.monotonic()]
+
+    def callback(epoch: int, total: int, loss: float) -> None:
+        now = time.monotonic()
+        if heartbeat is not None and now - last_beat[0] >= HEARTBEAT:
+            last_beat[0] = now
+            heartbeat()
+
+    # newton/lbfgs ignoran el programa; su ``lr`` normalizado es None
+    schedule = make_schedule(cfg["schedule"], cfg["lr"] or DEFAULTS["lr"], cfg["train"])
+    start = time.perf_counter()
+    if cfg["engine"] == "jit":
+        losses = train_fast(net, epochs=cfg["train"], lr=schedule, dataset=data,
+                            callback=callback, chunk_epochs=max(1, cfg["train"] // 100))
+    else:
+        losses = train_with_callback(net, epochs=cfg["train"], lr=schedule, dataset=data,
+                                     callback=callback, optimizer=make_optimizer(cfg["optimizer"]))
+    seconds = time.perf_counter() - start
+
+    converged = next((i + 1 for i, v in enumerate(losses) if v < CONVERGED), None)
+    hits = total = 0
+    for x, y in data:
+        hits += (net.predict(x) > 0.5) == (y > 0.5)
+        total += 1
+    return {
+        "params": json.dumps(net.get_params()),
+        "final_loss": losses[-1],
+        "min_loss": losses.min,
+        "converged_epoch": converged,
+        "accuracy": hits / total,
+        "epochs": len(losses),
+        "seconds": seconds,
+        "curve": json.dumps(losses.decimated(200)),
+    }
+
+
+def _alive(pid: Optional[int]) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue:
+    """Acceso a la base de trabajos (una conexión por proceso)."""
+
+    def __init__(self, path: str = "campaña.db", max_attempts: int = 3):
+        """
+        Parámetros:
+            path: Archivo SQLite (se crea si no existe)
+            max_attempts: Veces que se reintenta un trabajo abandonado antes de
+                marcarlo ``failed``
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        self.host = socket.gethostname()
+        self.conn = sqlite3.connect(path, timeout=30.0, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self._version = code_version()
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _transaction(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def add(self, config: Dict) -> Tuple[int, bool]:
+        """
+        Encola ``config`` salvo que ya exista.
+
+        Devuelve:
+            Tupla ``(id del trabajo, True si es nuevo)``
+        """
+        cfg = normalize_config(config)
+        key = job_key(cfg, self._version)
+        conn = self._transaction()
+        try:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO jobs (key, config, created) VALUES (?, ?, ?)",
+                (key, json.dumps(cfg, sort_keys=True), time.time()),
+            )
+            inserted = cursor.rowcount == 1
+            job_id = conn.execute("SELECT id FROM jobs WHERE key = ?", (key,)).fetchone()[0]
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return job_id, inserted
+
+    def claim(self) -> Optional[Job]:
+        """Reclama el trabajo pendiente más antiguo para este proceso (o None)."""
+
+        conn = self._transaction()
+        try:
+            row = conn.execute(
+                "SELECT id, config, attempts FROM jobs WHERE status = 'pending' "
+                "ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                now = time.time()
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, host = ?, "
+                    "pid = ?, started = ?, heartbeat = ?, error = NULL WHERE id = ?",
+                    (self.host, os.getpid(), now, now, row[0]),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return None if row is None else Job(row[0], json.loads(row[1]), row[2] + 1)
+
+    def heartbeat(self, job_id: int) -> None:
+        self.conn.execute("UPDATE jobs SET heartbeat = ? WHERE id = ?", (time.time(), job_id))
+
+    def finish(self, job_id: int, result: Dict) -> None:
+        """Guarda ``result`` (ver ``run_job``) y marca el trabajo ``done``."""
+
+        conn = self._transaction()
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (job_id, params, final_loss, min_loss, "
+                "converged_epoch, accuracy, epochs, seconds, curve) VALUES "
+                "(:job_id, :params, :final_loss, :min_loss, :converged_epoch, :accuracy, "
+                ":epochs, :seconds, :curve)",
+                {"job_id": job_id, **result},
+            )
+            conn.execute(
+                "UPDATE jobs SET status = 'done', finished = ?, pid = NULL WHERE id = ?",
+                (time.time(), job_id),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def fail(self, job_id: int, error: str) -> None:
+        self.conn.execute(
+            "UPDATE jobs SET status = 'failed', finished = ?, pid = NULL, error = ? WHERE id = ?",
+            (time.time(), error, job_id),
+        )
+
+    def recover(self, stale_after: float = 60.0) -> int:
+        """
+        Devuelve a ``pending`` los trabajos ``running`` abandonados.
+
+        Un trabajo está abandonado si su proceso (en este equipo) ya no existe o
+        si su último latido tiene más de ``stale_after`` segundos.
+
+        Devuelve:
+            Cantidad de trabajos recuperados (o marcados ``failed`` por agotar
+            los intentos)
+        """
+        now = time.time()
+        conn = self._transaction()
+        try:
+            rows = conn.execute(
+                "SELECT id, host, pid, heartbeat, attempts FROM jobs WHERE status = 'running'"
+            ).fetchall()
+            recovered = 0
+            for job_id, host, pid, beat, attempts in rows:
+                dead = host == self.host and not _alive(pid)
+                if not dead and now - (beat or 0.0) <= stale_after:
+                    continue
+                if attempts >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'failed', pid = NULL, error = ? WHERE id = ?",
+                        (f"Abandonado tras {attempts} intentos", job_id),
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET status = 'pending', pid = NULL WHERE id = ?", (job_id,)
+                    )
+                recovered += 1
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return recovered
+
+    def retry_failed(self) -> int:
+        """Vuelve a encolar los trabajos ``failed`` con los intentos en cero."""
+
+        return self.conn.execute(
+            "UPDATE jobs SET status = 'pending', attempts = 0, error = NULL "
+            "WHERE status = 'failed'"
+        ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Trabajos por estado."""
+
+        counts = dict.fromkeys(STATUSES, 0)
+        for status, count in self.conn.execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def results(self, order_by: str = "final_loss", limit: Optional[int] = None) -> List[JobResult]:
+        """Resultados de los trabajos ``done`` ordenados por una columna de ``results``."""
+
+        columns = ("final_loss", "min_loss", "converged_epoch", "accuracy", "seconds", "job_id")
+        if order_by not in columns:
+            raise ValueError(f"Columna de orden desconocida: {order_by!r}")
+        direction = "DESC" if order_by == "accuracy" else "ASC"
+        rows = self.conn.execute(
+            "SELECT j.id, j.config, r.params, r.final_loss, r.min_loss, r.converged_epoch, "
+            "r.accuracy, r.seconds FROM results r JOIN jobs j ON j.id = r.job_id "
+            f"ORDER BY r.{order_by} IS NULL, r.{order_by} {direction}, j.id "
+            "LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
+        return [
+            JobResult(row[0], json.loads(row[1]), json.loads(row[2]), *row[3:]) for row in rows
+        ]
+
+
+def _worker(path: str, max_attempts: int) -> int:
+    """Bucle de un proceso: reclamar, entrenar y guardar hasta vaciar la cola."""
+
+    done = 0
+    with JobQueue(path, max_attempts) as queue:
+        while True:
+            job = queue.claim()
+            if job is None:
+                return done
+            try:
+                result = run_job(job.config, heartbeat=lambda: queue.heartbeat(job.id))
+            except Exception:
+                queue.fail(job.id, traceback.format_exc())
+                continue
+            queue.finish(job.id, result)
+            done += 1
+
+
+def run_workers(
+    path: str = "campaña.db",
+    workers: Optional[int] = None,
+    stale_after: float = 60.0,
+    max_attempts: int = 3,
+) -> int:
+    """
+    Recupera los trabajos abandonados y procesa la cola con ``workers`` procesos.
+
+    Parámetros:
+        path: Base de trabajos
+        workers: Procesos (por defecto ``os.cpu_count()``); con 1 se trabaja en
+            este mismo proceso
+        stale_after: Segundos sin latido tras los que un trabajo se da por
+            abandonado (ver ``JobQueue.recover``)
+        max_attempts: Intentos por trabajo
+
+    Devuelve:
+        Trabajos terminados en esta llamada
+    """
+    with JobQueue(path, max_attempts) as queue:
+        queue.recover(stale_after)
+        pending = queue.counts()["pending"]
+    workers = min(workers or os.cpu_count() or 1, pending)
+    if workers <= 0:
+        return 0
+    if workers == 1:
+        return _worker(path, max_attempts)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context("spawn")) as pool:
+        futures = [pool.submit(_worker, path, max_attempts) for _ in range(workers)]
+        return sum(future.result() for future in futures)
+
+
+def _grid(args: argparse.Namespace) -> List[Dict]:
+    """Producto cartesiano de los valores dados a ``add``."""
+
+    axes = {name: getattr(args, name) for name in DEFAULTS if getattr(args, name) is not None}
+    names = list(axes)
+    return [dict(zip(names, values)) for values in itertools.product(*axes.values())]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cola persistente de entrenamientos (SQLite)")
+    parser.add_argument("--db", default="campaña.db", help="Base de trabajos")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    add = commands.add_parser("add", help="Encolar el producto cartesiano de las opciones")
+    add.add_argument("--train", type=int, nargs="+")
+    add.add_argument("--lr", type=float, nargs="+")
+    add.add_argument("--schedule", nargs="+")
+    add.add_argument("--optimizer", choices=OPTIMIZERS, nargs="+")
+    add.add_argument("--init", choices=SCHEMES, nargs="+")
+    add.add_argument("--seed", type=int, nargs="+")
+    add.add_argument("--dataset", nargs="+")
+    add.add_argument("--engine", choices=ENGINES, nargs="+")
+
+    run = commands.add_parser("run", help="Procesar la cola (recupera trabajos abandonados)")
+    run.add_argument("--workers", type=int, default=None)
+    run.add_argument("--stale-after", type=float, default=60.0)
+    run.add_argument("--max-attempts", type=int, default=3)
+
+    commands.add_parser("status", help="Trabajos por estado")
+    commands.add_parser("retry", help="Volver a encolar los trabajos fallidos")
+
+    results = commands.add_parser("results", help="Tabla de resultados")
+    results.add_argument("--sort", default="final_loss")
+    results.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.command == "add":
+        with JobQueue(args.db) as queue:
+            new = 0
+            for config in _grid(args):
+                try:
+                    new += queue.add(config)[1]
+                except ValueError as exc:
+                    parser.error(f"{config}: {exc}")
+            total = len(_grid(args))
+            print(f"{new} trabajos nuevos, {total - new} ya estaban en la cola")
+    elif args.command == "run":
+        start = time.perf_counter()
+        done = run_workers(args.db, args.workers, args.stale_after, args.max_attempts)
+        print(f"{done} trabajos terminados en {time.perf_counter() - start:.1f} s")
+    elif args.command == "status":
+        with JobQueue(args.db) as queue:
+            print(" | ".join(f"{status}: {count}" for status, count in queue.counts().items()))
+    elif args.command == "retry":
+        with JobQueue(args.db) as queue:
+            print(f"{queue.retry_failed()} trabajos vueltos a encolar")
+    else:
+        with JobQueue(args.db) as queue:
+            rows = queue.results(args.sort, args.limit)
+        print("| id | configuración | pérdida final | convergencia | precisión | tiempo |")
+        print("|---:|---|---:|---:|---:|---:|")
+        for r in rows:
+            changed = ", ".join(f"{k}={v}" for k, v in r.config.items()
+                                if v is not None and v != DEFAULTS[k])
+            epoch = "—" if r.converged_epoch is None else r.converged_epoch
+            print(f"| {r.id} | {changed or 'por defecto'} | {r.final_loss:.3e} | {epoch} | "
+                  f"{r.accuracy * 100:.0f}% | {r.seconds:.2f} s |")
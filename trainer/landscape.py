@@ -0,0 +1,239 @@
+"""Cortes 2D del paisaje de pérdida de ``MLP221``.
+
+Alrededor de unos parámetros ``p`` (la red entrenada o la inicial) se evalúa la
+BCE media sobre el conjunto en una grilla densa ``p + a·d1 + b·d2``, con ``a`` y
+``b`` en ``[-span, span]``. Todos los puntos de la grilla son redes de un único
+``BatchedMLP221`` (float64), así que una grilla de 201×201 son 40 401 redes
+evaluadas en unas pocas operaciones de NumPy en lugar de millones de llamadas a
+``forward``.
+
+Direcciones disponibles (``d1``, ``d2``):
+
+- ``"W1[0][0],W2[0][1]"``: dos parámetros con nombre (ejes unitarios)
+- ``"random"``: dos direcciones gaussianas normalizadas y ortogonalizadas por
+  tensor (cada tramo W1/b1/W2/b2 con la norma del tramo de ``p``), para que el
+  corte no dependa de la escala de cada capa
+- ``"gradient"``: los dos vectores singulares principales de la matriz de
+  gradientes por muestra, es decir, las direcciones en las que la pérdida de
+  las muestras cambia más
+
+Los resultados se guardan en ``.mlp_cache/landscape/`` con una clave SHA-256 de
+todas las entradas; repetir un corte lo lee del disco. ``export_loss_surface``
+de ``mlpio.export`` lo dibuja como un mapa de contornos.
+
+Requiere NumPy. Ejecutar ``python -m trainer.landscape --help`` para la CLI.
+"""
+
+import argparse
+import hashlib
+import os
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.model import MLP221
+from core.vectorized import BatchedMLP221
+from data.xor import DATA
+from mlpio.service import atomic_write
+from trainer.gradcheck import TENSORS
+
+# Nombres de los 9 parámetros en el orden de MLP221.get_params
+PARAM_NAMES = (
+    "W1[0][0]", "W1[0][1]", "W1[1][0]", "W1[1][1]",
+    "b1[0]", "b1[1]", "W2[0][0]", "W2[0][1]", "b2[0]",
+)
+
+CACHE_DIR = os.path.join(".mlp_cache", "landscape")
+
+# Redes evaluadas por bloque: acota la memoria de las activaciones (P, B)
+BLOCK = 1 << 16
+
+
+class LossSurface(NamedTuple):
+    """Corte 2D del paisaje de pérdida."""
+
+    center: np.ndarray      # (9,) parámetros en el origen del corte
+    directions: np.ndarray  # (2, 9) direcciones d1, d2
+    labels: Tuple[str, str]
+    alphas: np.ndarray      # (R,) coordenadas sobre d1
+    betas: np.ndarray       # (R,) coordenadas sobre d2
+    losses: np.ndarray      # (R, R) BCE media; losses[j, i] en (alphas[i], betas[j])
+
+
+def _samples(X, Y) -> Tuple[np.ndarray, np.ndarray]:
+    if X is None:
+        X = [x for x, _ in DATA]
+        Y = [y for _, y in DATA]
+    return (
+        np.asarray(X, dtype=np.float64).reshape(-1, 2),
+        np.asarray(Y, dtype=np.float64).reshape(-1),
+    )
+
+
+def named_directions(first: str, second: str) -> np.ndarray:
+    """Ejes unitarios de dos parámetros de ``PARAM_NAMES``."""
+
+    for name in (first, second):
+        if name not in PARAM_NAMES:
+            raise ValueError(f"Parámetro desconocido {name!r}; opciones: {', '.join(PARAM_NAMES)}")
+    if first == second:
+        raise ValueError("Las dos direcciones deben ser parámetros distintos")
+    eye = np.eye(9)
+    return np.stack([eye[PARAM_NAMES.index(first)], eye[PARAM_NAMES.index(second)]])
+
+
+def random_directions(center: Sequence[float], seed: int = 0) -> np.ndarray:
+    """
+    Dos direcciones gaussianas ortogonales con la norma de ``center`` en cada tensor.
+
+    La ortogonalización se hace tramo a tramo, después de escalar ``d1``, de
+    modo que el escalado no la deshace. En un tramo de un solo elemento (``b2``)
+    no caben dos direcciones ortogonales no nulas y ``d2`` queda en cero ahí.
+    """
+    center = np.asarray(center, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    d = rng.standard_normal((2, 9))
+    for idx in TENSORS.values():
+        scale = np.linalg.norm(center[idx])
+        d0 = d[0, idx]
+        d0 *= scale / max(np.linalg.norm(d0), 1e-12)
+        d1 = d[1, idx]
+        if d0 @ d0 > 0.0:
+            d1 -= d1 @ d0 / (d0 @ d0) * d0
+        norm = np.linalg.norm(d1)
+        d1 *= scale / norm if norm > 1e-9 * max(scale, 1.0) else 0.0
+    return d
+
+
+def gradient_directions(center: Sequence[float], X=None, Y=None) -> np.ndarray:
+    """
+    Dos direcciones principales de los gradientes por muestra (vectores unitarios).
+
+    Con menos de dos muestras o gradientes degenerados se completa con una
+    dirección ortogonal cualquiera.
+    """
+    X, Y = _samples(X, Y)
+    net = BatchedMLP221(center)
+    per_sample = np.concatenate(
+        [net.gradients(X[k:k + 1], Y[k:k + 1])[0] for k in range(len(X))]
+    )
+    _, _, vt = np.linalg.svd(np.vstack([per_sample, np.eye(9) * 1e-12]))
+    return vt[:2]
+
+
+def _key(center, directions, span, resolution, X, Y) -> str:
+    digest = hashlib.sha256()
+    for part in (center, directions, np.array([span, resolution], dtype=np.float64), X, Y):
+        digest.update(np.ascontiguousarray(part, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _resolve(spec: str, center: np.ndarray, X, Y, seed: int):
+    """Direcciones y etiquetas a partir de ``"random"``, ``"gradient"`` o ``"A,B"``."""
+
+    if spec == "random":
+        return random_directions(center, seed), ("dirección aleatoria 1", "dirección aleatoria 2")
+    if spec == "gradient":
+        return gradient_directions(center, X, Y), ("gradiente principal 1", "gradiente principal 2")
+    names = [name.strip() for name in spec.split(",")]
+    if len(names) != 2:
+        raise ValueError(f"Direcciones inválidas {spec!r}: use random, gradient o 'A,B'")
+    return named_directions(*names), (names[0], names[1])
+
+
+def loss_surface(
+    net: Optional[MLP221] = None,
+    directions: str = "random",
+    span: float = 1.0,
+    resolution: int = 101,
+    X=None,
+    Y=None,
+    seed: int = 0,
+    cache_dir: Optional[str] = CACHE_DIR,
+) -> LossSurface:
+    """
+    Evalúa la BCE media en una grilla ``resolution × resolution`` alrededor de ``net``.
+
+    Parámetros:
+        net: Red en el centro del corte (por defecto ``MLP221()`` con pesos fijos)
+        directions: ``"random"``, ``"gradient"`` o dos nombres de ``PARAM_NAMES``
+            separados por coma (p. ej. ``"W1[0][0],W2[0][1]"``)
+        span: Semiancho de la grilla en unidades de cada dirección
+        resolution: Puntos por eje
+        X, Y: Muestras donde se mide la pérdida (por defecto el XOR de 4 filas)
+        seed: Semilla de las direcciones aleatorias
+        cache_dir: Carpeta de la caché en disco (None la desactiva)
+
+    Devuelve:
+        ``LossSurface`` con la grilla de pérdidas
+    """
+    if resolution < 2 or span <= 0:
+        raise ValueError("Se requieren resolution >= 2 y span > 0")
+    center = np.array((MLP221() if net is None else net).get_params(), dtype=np.float64)
+    X, Y = _samples(X, Y)
+    d, labels = _resolve(directions, center, X, Y, seed)
+    axis = np.linspace(-span, span, resolution)
+
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, _key(center, d, span, resolution, X, Y) + ".npy")
+        try:
+            losses = np.load(path)
+        except (OSError, ValueError):
+            pass
+        else:
+            if losses.shape == (resolution, resolution):
+                return LossSurface(center, d, labels, axis, axis.copy(), losses)
+
+    # Fila j, columna i: p + alphas[i]·d1 + betas[j]·d2
+    b, a = np.meshgrid(axis, axis, indexing="ij")
+    coords = np.stack([a.ravel(), b.ravel()], axis=1)
+    losses = np.empty(len(coords))
+    with np.errstate(over="ignore"):
+        for start in range(0, len(coords), BLOCK):
+            block = coords[start:start + BLOCK]
+            losses[start:start + len(block)] = BatchedMLP221(center + block @ d).losses(X, Y)
+    losses = losses.reshape(resolution, resolution)
+
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        atomic_write(path, lambda tmp: np.save(tmp, losses))
+    return LossSurface(center, d, labels, axis, axis.copy(), losses)
+
+
+if __name__ == "__main__":
+    import time
+
+    from core.initializers import SCHEMES
+    from mlpio.export import export_loss_surface
+    from trainer.train import train
+
+    parser = argparse.ArgumentParser(description="Corte 2D del paisaje de pérdida de la MLP 2-2-1")
+    parser.add_argument("--directions", default="random",
+                        help="random, gradient o dos parámetros, p. ej. 'W1[0][0],W2[0][1]'")
+    parser.add_argument("--span", type=float, default=1.0, help="Semiancho de la grilla")
+    parser.add_argument("--resolution", type=int, default=201, help="Puntos por eje")
+    parser.add_argument("--train", type=int, default=3000, help="Épocas antes de cortar (0 = pesos iniciales)")
+    parser.add_argument("--lr", type=float, default=0.5)
+    parser.add_argument("--init", choices=SCHEMES, default="fixed")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--no-cache", action="store_true", help="No leer ni escribir la caché")
+    parser.add_argument("--out", default="paisaje.png", help="PNG de contornos")
+    args = parser.parse_args()
+
+    net = MLP221(init=args.init, seed=args.seed)
+    if args.train:
+        train(net, epochs=args.train, lr=args.lr)
+    start = time.perf_counter()
+    surface = loss_surface(
+        net, args.directions, args.span, args.resolution,
+        cache_dir=None if args.no_cache else CACHE_DIR,
+    )
+    elapsed = time.perf_counter() - start
+    export_loss_surface(surface, args.out)
+    center_loss = BatchedMLP221(surface.center).losses(*_samples(None, None))[0]
+    print(
+        f"{args.resolution ** 2} puntos en {elapsed:.3f} s | pérdida en el centro "
+        f"{center_loss:.6f} | "
+        f"mínimo {surface.losses.min():.6f} | guardado en {args.out}"
+    )
@@ -0,0 +1,362 @@
+"""Optimizadores de segundo orden para los 9 parámetros de ``MLP221``.
+
+Con solo 9 parámetros el Hessiano exacto de la BCE media cuesta poco:
+``evaluate`` lo calcula de forma analítica en una pasada sobre el conjunto, sin
+NumPy. Para una muestra, con ``z2`` la preactivación de salida y ``J = ∂z2/∂θ``,
+
+    H = ŷ(1 - ŷ) · J Jᵀ + (ŷ - y) · ∂²z2/∂θ²
+
+y ``∂²z2/∂θ²`` solo tiene bloques dentro de cada neurona oculta (sus 3
+parámetros entre sí y con su peso de salida).
+
+- ``Newton``: paso de Newton amortiguado. Si ``H`` no es definida positiva se
+  le suma ``λ·I`` (λ creciente hasta que la factorización de Cholesky funcione),
+  así la dirección siempre es de descenso.
+- ``LBFGS``: cuasi-Newton con memoria limitada (recursión de dos bucles), solo
+  con gradientes.
+
+Ambos usan búsqueda lineal con retroceso (condición de Armijo) sobre la pérdida
+del lote completo. Una iteración equivale a una "época" del entrenador:
+``train(net, epochs=30, optimizer=Newton())`` hace 30 pasos. Ejecutar
+``python -m trainer.optimizers`` compara ambos con SGD.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+from core.activations import sigmoid
+from core.losses import bce
+
+OPTIMIZERS = ("sgd", "newton", "lbfgs")
+
+Matrix = List[List[float]]
+
+
+def evaluate(params: Sequence[float], data, hessian: bool = True):
+    """
+    Pérdida media, gradiente y (opcional) Hessiano analítico de la BCE.
+
+    Parámetros:
+        params: Los 9 parámetros en el orden de ``MLP221.get_params``
+        data: Iterable de pares ``(x, y)`` (p. ej. un ``Dataset``)
+        hessian: Si es False se omite el Hessiano (devuelve None)
+
+    Devuelve:
+        Tupla ``(pérdida, gradiente[9], Hessiano[9][9] o None)``
+    """
+    p = params
+    loss = 0.0
+    g = [0.0] * 9
+    H = [[0.0] * 9 for _ in range(9)] if hessian else None
+    J = [0.0] * 9
+    J[8] = 1.0
+    n = 0
+    for x, y in data:
+        x0 = x[0]
+        x1 = x[1]
+        a0 = sigmoid(p[4] + p[0] * x0 + p[1] * x1)
+        a1 = sigmoid(p[5] + p[2] * x0 + p[3] * x1)
+        yhat = sigmoid(p[8] + p[6] * a0 + p[7] * a1)
+        loss += bce(yhat, y)
+        delta2 = yhat - y
+        n += 1
+
+        # J = ∂z2/∂θ; cada neurona oculta j aporta (W1[j][0], W1[j][1], b1[j]) y W2[0][j]
+        features = (x0, x1, 1.0)
+        for j, a in ((0, a0), (1, a1)):
+            da = a * (1.0 - a)
+            w = p[6 + j]
+            J[2 * j] = w * da * x0
+            J[2 * j + 1] = w * da * x1
+            J[4 + j] = w * da
+            J[6 + j] = a
+        for k in range(9):
+            g[k] += delta2 * J[k]
+        if H is None:
+            continue
+
+        curvature = yhat * (1.0 - yhat)
+        for r in range(9):
+            row = H[r]
+            jr = curvature * J[r]
+            for c in range(9):
+                row[c] += jr * J[c]
+        for j, a in ((0, a0), (1, a1)):
+            da = a * (1.0 - a)
+            second = delta2 * p[6 + j] * da * (1.0 - 2.0 * a)  # (ŷ - y)·w·σ''(z1)
+            block = (2 * j, 2 * j + 1, 4 + j)
+            for u, fu in zip(block, features):
+                for v, fv in zip(block, features):
+                    H[u][v] += second * fu * fv
+                cross = delta2 * da * fu  # ∂²z2 / ∂θ_u ∂W2[0][j]
+                H[u][6 + j] += cross
+                H[6 + j][u] += cross
+
+    if n == 0:
+        raise ValueError("El conjunto de entrenamiento está vacío")
+    g = [v / n for v in g]
+    if H is not None:
+        H = [[v / n for v in row] for row in H]
+    return loss / n, g, H
+
+
+def mean_loss(params: Sequence[float], data) -> float:
+    """Pérdida BCE media del lote completo (sin gradiente)."""
+
+    p = params
+    loss = 0.0
+    n = 0
+    for x, y in data:
+        a0 = sigmoid(p[4] + p[0] * x[0] + p[1] * x[1])
+        a1 = sigmoid(p[5] + p[2] * x[0] + p[3] * x[1])
+        loss += bce(sigmoid(p[8] + p[6] * a0 + p[7] * a1), y)
+        n += 1
+    return loss / n
+
+
+def cholesky(A: Matrix) -> Optional[Matrix]:
+    """Factor triangular inferior ``L`` con ``A = L Lᵀ``; None si ``A`` no es definida positiva."""
+
+    size = len(A)
+    L = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1):
+            s = A[i][j] - sum(L[i][k] * L[j][k] for k in range(j))
+            if i == j:
+                if s <= 0.0 or not math.isfinite(s):
+                    return None
+                L[i][i] = math.sqrt(s)
+            else:
+                L[i][j] = s / L[j][j]
+    return L
+
+
+def cholesky_solve(L: Matrix, b: Sequence[float]) -> List[float]:
+    """Resuelve ``L Lᵀ x = b`` por sustitución hacia adelante y hacia atrás."""
+
+    size = len(L)
+    z = [0.0] * size
+    for i in range(size):
+        z[i] = (b[i] - sum(L[i][k] * z[k] for k in range(i))) / L[i][i]
+    x = [0.0] * size
+    for i in reversed(range(size)):
+        x[i] = (z[i] - sum(L[k][i] * x[k] for k in range(i + 1, size))) / L[i][i]
+    return x
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(u * v for u, v in zip(a, b))
+
+
+def line_search(
+    params: Sequence[float],
+    loss: float,
+    grad: Sequence[float],
+    direction: Sequence[float],
+    data,
+    c1: float = 1e-4,
+    shrink: float = 0.5,
+    max_trials: int = 40,
+) -> Tuple[float, List[float], float]:
+    """
+    Búsqueda lineal con retroceso desde ``t = 1`` hasta cumplir Armijo.
+
+    Devuelve:
+        Tupla ``(t, parámetros nuevos, pérdida nueva)``; ``t = 0`` y los
+        parámetros originales si ningún paso reduce la pérdida
+    """
+    slope = _dot(grad, direction)
+    t = 1.0
+    for _ in range(max_trials):
+        trial = [p + t * d for p, d in zip(params, direction)]
+        trial_loss = mean_loss(trial, data)
+        if trial_loss <= loss + c1 * t * slope:
+            return t, trial, trial_loss
+        t *= shrink
+    return 0.0, list(params), loss
+
+
+class SecondOrderOptimizer(ABC):
+    """Interfaz común: ``step(net, data)`` hace una iteración sobre el lote completo."""
+
+    name = "base"
+
+    def __init__(self, tol: float = 1e-10):
+        """
+        Parámetros:
+            tol: Norma infinito del gradiente por debajo de la cual ya no se mueve
+        """
+        self.tol = tol
+
+    @abstractmethod
+    def step(self, net, data) -> Tuple[float, float]:
+        """
+        Actualiza ``net`` en el lugar.
+
+        Devuelve:
+            Tupla ``(pérdida media tras el paso, longitud de paso t)``
+        """
+
+    def reset(self) -> None:
+        """Olvida el estado acumulado entre iteraciones."""
+
+
+class Newton(SecondOrderOptimizer):
+    """Newton amortiguado con Hessiano analítico y búsqueda lineal."""
+
+    name = "newton"
+
+    def __init__(self, tol: float = 1e-10, min_damping: float = 1e-8):
+        """
+        Parámetros:
+            tol: Norma infinito del gradiente por debajo de la cual ya no se mueve
+            min_damping: Primer λ (relativo a la mayor diagonal) cuando ``H`` no
+                es definida positiva; se multiplica por 10 hasta que lo sea
+        """
+        super().__init__(tol)
+        self.min_damping = min_damping
+        self.damping = 0.0  # λ usado en la última iteración
+
+    def direction(self, H: Matrix, grad: Sequence[float]) -> List[float]:
+        """Resuelve ``(H + λI) d = -g`` con el menor λ que da una matriz definida positiva."""
+
+        scale = max(abs(H[i][i]) for i in range(9)) or 1.0
+        lam = 0.0
+        while True:
+            shifted = [[v + (lam if r == c else 0.0) for c, v in enumerate(row)]
+                       for r, row in enumerate(H)]
+            L = cholesky(shifted)
+            if L is not None:
+                self.damping = lam
+                return cholesky_solve(L, [-v for v in grad])
+            lam = self.min_damping * scale if lam == 0.0 else lam * 10.0
+
+    def step(self, net, data) -> Tuple[float, float]:
+        params = net.get_params()
+        loss, grad, H = evaluate(params, data)
+        if max(abs(v) for v in grad) < self.tol:
+            return loss, 0.0
+        t, params, loss = line_search(params, loss, grad, self.direction(H, grad), data)
+        net.set_params(params)
+        return loss, t
+
+
+class LBFGS(SecondOrderOptimizer):
+    """L-BFGS con búsqueda lineal de Armijo."""
+
+    name = "lbfgs"
+
+    def __init__(self, memory: int = 9, tol: float = 1e-10):
+        """
+        Parámetros:
+            memory: Pares ``(s, y)`` recordados (9 alcanza para el Hessiano completo)
+            tol: Norma infinito del gradiente por debajo de la cual ya no se mueve
+        """
+        super().__init__(tol)
+        self.memory = memory
+        self.reset()
+
+    def reset(self) -> None:
+        self.pairs = deque(maxlen=self.memory)
+        self._state = None  # (parámetros, pérdida, gradiente) del punto actual
+
+    def direction(self, grad: Sequence[float]) -> List[float]:
+        """``-H⁻¹ g`` aproximado con la recursión de dos bucles."""
+
+        q = list(grad)
+        alphas = []
+        for s, y, rho in reversed(self.pairs):
+            alpha = rho * _dot(s, q)
+            q = [a - alpha * b for a, b in zip(q, y)]
+            alphas.append(alpha)
+        if self.pairs:
+            s, y, _ = self.pairs[-1]
+            gamma = _dot(s, y) / _dot(y, y)
+            q = [gamma * v for v in q]
+        for (s, y, rho), alpha in zip(self.pairs, reversed(alphas)):
+            beta = rho * _dot(y, q)
+            q = [a + (alpha - beta) * b for a, b in zip(q, s)]
+        return [-v for v in q]
+
+    def step(self, net, data) -> Tuple[float, float]:
+        params = net.get_params()
+        if self._state is None or self._state[0] != params:
+            # Primera iteración o pesos cambiados desde fuera: el historial no sirve
+            self.pairs.clear()
+            loss, grad, _ = evaluate(params, data, hessian=False)
+        else:
+            _, loss, grad = self._state
+        if max(abs(v) for v in grad) < self.tol:
+            self._state = (params, loss, grad)
+            return loss, 0.0
+
+        direction = self.direction(grad)
+        if _dot(grad, direction) >= 0.0:
+            self.pairs.clear()
+            direction = [-v for v in grad]
+        t, new_params, new_loss = line_search(params, loss, grad, direction, data)
+        if t == 0.0 and self.pairs:
+            # La aproximación dejó de ser útil: reintentar con el gradiente
+            self.pairs.clear()
+            t, new_params, new_loss = line_search(params, loss, grad, [-v for v in grad], data)
+        _, new_grad, _ = evaluate(new_params, data, hessian=False)
+
+        s = [a - b for a, b in zip(new_params, params)]
+        y = [a - b for a, b in zip(new_grad, grad)]
+        sy = _dot(s, y)
+        if sy > 1e-12 * math.sqrt(_dot(s, s) * _dot(y, y)):
+            self.pairs.append((s, y, 1.0 / sy))
+        net.set_params(new_params)
+        self._state = (new_params, new_loss, new_grad)
+        return new_loss, t
+
+
+def make_optimizer(name: str) -> Optional[SecondOrderOptimizer]:
+    """Optimizador para ``name`` de ``OPTIMIZERS``; None para ``"sgd"`` (el bucle por defecto)."""
+
+    if name == "sgd":
+        return None
+    if name == "newton":
+        return Newton()
+    if name == "lbfgs":
+        return LBFGS()
+    raise ValueError(f"Optimizador desconocido: {name!r} (opciones: {', '.join(OPTIMIZERS)})")
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from core.initializers import SCHEMES
+    from core.model import MLP221
+    from data.datasets import load_dataset
+    from trainer.train import train
+
+    parser = argparse.ArgumentParser(description="Compara Newton y L-BFGS con SGD")
+    parser.add_argument("--dataset", default="xor")
+    parser.add_argument("--init", choices=SCHEMES, default="fixed")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--target", type=float, default=0.01, help="Pérdida objetivo")
+    parser.add_argument("--iterations", type=int, default=100, help="Iteraciones de segundo orden")
+    parser.add_argument("--sgd-epochs", type=int, default=20000)
+    parser.add_argument("--lr", type=float, default=0.5)
+    args = parser.parse_args()
+    data = load_dataset(args.dataset)
+
+    def first_below(losses) -> str:
+        hit = next((i + 1 for i, v in enumerate(losses) if v < args.target), None)
+        return "—" if hit is None else str(hit)
+
+    print(f"| optimizador | iteraciones hasta {args.target} | pérdida final | tiempo |")
+    print("|---|---:|---:|---:|")
+    runs = [("sgd", args.sgd_epochs, None)] + [
+        (name, args.iterations, make_optimizer(name)) for name in ("newton", "lbfgs")
+    ]
+    for name, epochs, optimizer in runs:
+        net = MLP221(init=args.init, seed=args.seed)
+        start = time.perf_counter()
+        losses = train(net, epochs=epochs, lr=args.lr, dataset=data, optimizer=optimizer)
+        elapsed = time.perf_counter() - start
+        print(f"| {name} | {first_below(losses)} | {losses[-1]:.3e} | {elapsed:.3f} s |")
@@ -0,0 +1,217 @@
+"""Entrenamiento data-parallel en varios procesos con reducción de gradientes.
+
+El conjunto se reparte en fragmentos contiguos, uno por proceso. En cada época
+cada proceso lee los parámetros actuales de memoria compartida, acumula con
+``MLP221.backward`` la suma de ``dW1/db1/dW2/db2`` (y de la pérdida) sobre su
+fragmento y la deja en su ranura del búfer compartido. El proceso principal suma
+las ranuras en orden de rango, promedia y aplica un único ``step``.
+
+A diferencia de ``trainer.train`` (SGD muestra a muestra) esto es descenso de
+gradiente por lotes completos. Como cada suma parcial se hace siempre en el
+mismo orden y la reducción recorre los rangos en orden fijo, el resultado es
+idéntico bit a bit para una misma semilla y cantidad de procesos.
+"""
+
+import argparse
+import multiprocessing as mp
+import time
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+from core.losses import bce
+from core.model import MLP221
+from data.datasets import XOR, Dataset, load_dataset
+from trainer.history import LossHistory
+
+# Ranura por proceso: 9 gradientes + suma de pérdidas
+_SLOT = 10
+
+
+def _shard_bounds(n: int, rank: int, workers: int) -> Tuple[int, int]:
+    """Límites ``[inicio, fin)`` del fragmento contiguo del proceso ``rank``."""
+
+    return n * rank // workers, n * (rank + 1) // workers
+
+
+def _accumulate(net: MLP221, samples, acc: List[float]) -> None:
+    """Suma en ``acc`` los gradientes y la pérdida de cada muestra."""
+
+    for x, y in samples:
+        yhat = net.forward(x)
+        acc[9] += bce(yhat, y)
+        net.backward(y)
+        acc[0] += net.dW1[0][0]
+        acc[1] += net.dW1[0][1]
+        acc[2] += net.dW1[1][0]
+        acc[3] += net.dW1[1][1]
+        acc[4] += net.db1[0]
+        acc[5] += net.db1[1]
+        acc[6] += net.dW2[0][0]
+        acc[7] += net.dW2[0][1]
+        acc[8] += net.db2[0]
+
+
+def _iter_flat(flat: array):
+    """Recorre un fragmento compacto ``x1, x2, y`` como muestras ``([x1, x2], y)``."""
+
+    for i in range(0, len(flat), 3):
+        yield [flat[i], flat[i + 1]], flat[i + 2]
+
+
+def _worker(rank, workers, dataset, params, grads, stop, start_barrier, done_barrier, cache):
+    """Bucle de un proceso: espera parámetros, calcula su gradiente y lo publica."""
+
+    try:
+        begin, end = _shard_bounds(len(dataset), rank, workers)
+        if cache:
+            # Fragmento compacto en array('d'): x1, x2, y por muestra
+            flat = array("d")
+            for x, y in dataset.iter_range(begin, end):
+                flat.extend((x[0], x[1], y))
+        net = MLP221()
+        while True:
+            start_barrier.wait()
+            if stop.value:
+                return
+            net.set_params(params[:9])
+            acc = [0.0] * _SLOT
+            _accumulate(net, _iter_flat(flat) if cache else dataset.iter_range(begin, end), acc)
+            grads[rank * _SLOT:(rank + 1) * _SLOT] = acc
+            done_barrier.wait()
+    except Exception:
+        start_barrier.abort()
+        done_barrier.abort()
+        raise
+
+
+def train_data_parallel(
+    net: MLP221,
+    epochs: int = 100,
+    lr: float = 0.5,
+    dataset: Optional[Dataset] = None,
+    workers: int = 2,
+    callback: Optional[Callable[[int, int, float], None]] = None,
+    cache_shards: bool = True,
+) -> LossHistory:
+    """
+    Entrena con descenso de gradiente por lotes repartiendo el conjunto entre procesos.
+
+    Argumentos:
+        net: El modelo MLP221 a entrenar (se actualiza en el lugar)
+        epochs: Número de épocas (un paso sincronizado por época)
+        lr: Tasa de aprendizaje
+        dataset: Conjunto de entrenamiento (por defecto XOR)
+        workers: Cantidad de procesos
+        callback: Función callback opcional(epoch, total_epochs, avg_loss)
+        cache_shards: Si es True cada proceso guarda su fragmento en memoria en
+            lugar de regenerarlo en cada época
+
+    Devuelve:
+        LossHistory con la pérdida media de cada época (antes del paso)
+    """
+    data = XOR if dataset is None else dataset
+    if workers < 1:
+        raise ValueError("Se necesita al menos un proceso")
+    n = len(data)
+
+    ctx = mp.get_context()
+    params = ctx.RawArray("d", 9)
+    grads = ctx.RawArray("d", workers * _SLOT)
+    stop = ctx.RawValue("b", 0)
+    start_barrier = ctx.Barrier(workers + 1)
+    done_barrier = ctx.Barrier(workers + 1)
+    procs = [
+        ctx.Process(
+            target=_worker,
+            args=(
+                rank, workers, data, params, grads, stop,
+                start_barrier, done_barrier, cache_shards,
+            ),
+            daemon=True,
+        )
+        for rank in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+
+    losses = LossHistory()
+    try:
+        for ep in range(1, epochs + 1):
+            params[:] = net.get_params()
+            start_barrier.wait()
+            done_barrier.wait()
+
+            # Reducción en orden de rango: determinista para un número fijo de procesos
+            total = [0.0] * _SLOT
+            for rank in range(workers):
+                slot = grads[rank * _SLOT:(rank + 1) * _SLOT]
+                for i in range(_SLOT):
+                    total[i] += slot[i]
+            g = [v / n for v in total]
+            net.dW1 = [[g[0], g[1]], [g[2], g[3]]]
+            net.db1 = [g[4], g[5]]
+            net.dW2 = [[g[6], g[7]]]
+            net.db2 = [g[8]]
+            net.step(lr)
+
+            avg_loss = g[9]
+            losses.append(avg_loss)
+            if callback:
+                callback(ep, epochs, avg_loss)
+    finally:
+        stop.value = 1
+        try:
+            start_barrier.wait(timeout=5)
+        except Exception:
+            pass
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+    return losses
+
+
+def benchmark_scaling(
+    dataset: Dataset, max_workers: int, epochs: int = 3, lr: float = 0.5
+) -> List[Tuple[int, float, float]]:
+    """
+    Mide el tiempo por época con 1..``max_workers`` procesos.
+
+    El cronómetro arranca al terminar la primera época, de modo que el arranque
+    de los procesos y la carga de fragmentos no cuentan.
+
+    Devuelve:
+        Lista de tuplas (procesos, segundos por época, aceleración respecto a 1)
+    """
+    if epochs < 2:
+        raise ValueError("Se necesitan al menos 2 épocas para medir")
+    results = []
+    base = None
+    for workers in range(1, max_workers + 1):
+        marks = []
+        train_data_parallel(
+            MLP221(),
+            epochs=epochs,
+            lr=lr,
+            dataset=dataset,
+            workers=workers,
+            callback=lambda ep, total, loss: marks.append(time.perf_counter()),
+        )
+        per_epoch = (marks[-1] - marks[0]) / (epochs - 1)
+        base = base or per_epoch
+        results.append((workers, per_epoch, base / per_epoch))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de escalado data-parallel")
+    parser.add_argument("--dataset", default="clouds:200000", help="Especificación del conjunto")
+    parser.add_argument("--max-workers", type=int, default=mp.cpu_count())
+    parser.add_argument("--epochs", type=int, default=3)
+    args = parser.parse_args()
+
+    print("| procesos | s/época | aceleración |\n|---:|---:|---:|")
+    for workers, per_epoch, speedup in benchmark_scaling(
+        load_dataset(args.dataset), args.max_workers, args.epochs
+    ):
+        print(f"| {workers} | {per_epoch:.3f} | {speedup:.2f}x |")
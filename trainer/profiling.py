@@ -0,0 +1,102 @@
+"""Instrumentación opcional por fases del bucle de entrenamiento.
+
+``PhaseProfiler`` acumula tiempo de pared y de CPU por fase (forward, loss,
+backward, step, tracer, metrics, callback) con contadores ``perf_counter_ns`` y
+``process_time_ns``. Sirve para comprobar si en una corrida dominan las trazas,
+los callbacks de la UI o la matemática del modelo.
+
+Uso dentro de un bucle::
+
+    t = profiler.start()
+    net.forward(x)
+    t = profiler.lap("forward", t)
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+PHASES = ("forward", "loss", "backward", "step", "tracer", "metrics", "callback")
+
+
+class PhaseProfiler:
+    """Acumulador de tiempos por fase con exportación a tabla y Chrome trace."""
+
+    def __init__(self, record_events: bool = False):
+        """
+        Parámetros:
+            record_events: Si es True guarda cada intervalo para exportarlo como
+                Chrome trace (memoria proporcional al número de pasos).
+        """
+        self.wall_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.cpu_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.calls: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.record_events = record_events
+        self.events: List[Tuple[str, int, int, int]] = []
+        self._origin = time.perf_counter_ns()
+
+    @staticmethod
+    def start() -> Tuple[int, int]:
+        """Devuelve la marca (pared, CPU) de inicio de una fase."""
+
+        return time.perf_counter_ns(), time.process_time_ns()
+
+    def lap(self, phase: str, mark: Tuple[int, int]) -> Tuple[int, int]:
+        """Cierra ``phase`` iniciada en ``mark`` y devuelve la marca siguiente."""
+
+        wall, cpu = time.perf_counter_ns(), time.process_time_ns()
+        self.wall_ns[phase] = self.wall_ns.get(phase, 0) + wall - mark[0]
+        self.cpu_ns[phase] = self.cpu_ns.get(phase, 0) + cpu - mark[1]
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+        if self.record_events:
+            self.events.append((phase, mark[0], wall, threading.get_ident()))
+        return wall, cpu
+
+    def summary(self) -> str:
+        """Tabla Markdown con tiempo total, porcentaje y costo medio por fase."""
+
+        total = sum(self.wall_ns.values()) or 1
+        lines = [
+            "| fase | llamadas | pared (ms) | CPU (ms) | % pared | µs/llamada |",
+            "|---|---:|---:|---:|---:|---:|",
+        ]
+        for phase in sorted(self.wall_ns, key=self.wall_ns.get, reverse=True):
+            calls = self.calls[phase]
+            if not calls:
+                continue
+            wall = self.wall_ns[phase]
+            lines.append(
+                f"| {phase} | {calls} | {wall / 1e6:.2f} | {self.cpu_ns[phase] / 1e6:.2f} "
+                f"| {100.0 * wall / total:.1f} | {wall / calls / 1e3:.2f} |"
+            )
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path: str = "perfil.json") -> None:
+        """
+        Escribe los intervalos registrados en formato Chrome trace.
+
+        El archivo se abre en ``chrome://tracing``, Perfetto o speedscope. Sin
+        ``record_events`` solo contiene un evento agregado por fase.
+        """
+        pid = os.getpid()
+        trace = []
+        if self.record_events:
+            for phase, begin, end, tid in self.events:
+                trace.append({
+                    "name": phase, "ph": "X", "pid": pid, "tid": tid,
+                    "ts": (begin - self._origin) / 1e3, "dur": (end - begin) / 1e3,
+                })
+        else:
+            ts = 0.0
+            for phase, wall in self.wall_ns.items():
+                if not self.calls[phase]:
+                    continue
+                trace.append({
+                    "name": phase, "ph": "X", "pid": pid, "tid": 0,
+                    "ts": ts, "dur": wall / 1e3, "args": {"calls": self.calls[phase]},
+                })
+                ts += wall / 1e3
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, file)
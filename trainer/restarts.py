@@ -0,0 +1,108 @@
+"""Búsqueda multi-reinicio de inicializaciones que converjan.
+
+Entrena muchas semillas en paralelo durante unas pocas épocas, descarta las que
+no progresan y continúa solo con las más prometedoras (estilo *successive
+halving*). Así encontrar una inicialización que converja cuesta una fracción de
+entrenar exhaustivamente cada semilla.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from core.model import MLP221
+from data.datasets import Dataset
+from trainer.train import train
+
+
+class RestartResult(NamedTuple):
+    """Resultado de la búsqueda: mejor semilla y su estado final."""
+
+    seed: int
+    params: List[float]
+    loss: float
+    epochs: int
+    history: Dict[int, List[Tuple[int, float]]]
+
+
+def _train_chunk(
+    task: Tuple[int, str, List[float], int, float, Optional[Dataset]]
+) -> Tuple[int, List[float], float]:
+    """Entrena una semilla durante ``epochs`` épocas desde ``params``."""
+
+    seed, scheme, params, epochs, lr, dataset = task
+    net = MLP221(init=scheme, seed=seed)
+    if params is not None:
+        net.set_params(params)
+    losses = train(net, epochs=epochs, lr=lr, dataset=dataset)
+    return seed, net.get_params(), losses[-1]
+
+
+def multi_restart_search(
+    seeds: Iterable[int] = range(32),
+    scheme: str = "xavier",
+    lr: float = 0.5,
+    first_round: int = 300,
+    max_epochs: int = 5000,
+    keep_fraction: float = 0.5,
+    target_loss: float = 0.05,
+    workers: Optional[int] = None,
+    dataset: Optional[Dataset] = None,
+) -> RestartResult:
+    """
+    Busca la semilla cuya inicialización converge antes.
+
+    En cada ronda todas las semillas vivas se entrenan en paralelo, se ordenan
+    por pérdida y solo sobrevive la fracción ``keep_fraction``; la ronda
+    siguiente duplica las épocas. La búsqueda termina cuando alguna semilla
+    alcanza ``target_loss``, queda una sola o se agota ``max_epochs``.
+
+    Parámetros:
+        seeds: Semillas candidatas
+        scheme: Esquema de inicialización aleatoria
+        lr: Tasa de aprendizaje
+        first_round: Épocas de la primera ronda
+        max_epochs: Épocas totales máximas por semilla
+        keep_fraction: Fracción de semillas que sobrevive a cada ronda
+        target_loss: Pérdida media que se considera convergencia
+        workers: Procesos del pool (None = núcleos disponibles)
+        dataset: Conjunto de entrenamiento (por defecto XOR)
+
+    Devuelve:
+        ``RestartResult`` con la mejor semilla, sus parámetros, su pérdida, las
+        épocas entrenadas y el historial ``{seed: [(época, pérdida), ...]}``
+    """
+    if not 0.0 < keep_fraction <= 1.0:
+        raise ValueError("keep_fraction debe estar en (0, 1]")
+    if first_round < 1 or max_epochs < first_round:
+        raise ValueError("Se requiere 1 <= first_round <= max_epochs")
+
+    alive: Dict[int, Optional[List[float]]] = {seed: None for seed in seeds}
+    if not alive:
+        raise ValueError("Se necesita al menos una semilla")
+
+    history: Dict[int, List[Tuple[int, float]]] = {seed: [] for seed in alive}
+    last_loss: Dict[int, float] = {}
+    done = 0
+    chunk = first_round
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            chunk = min(chunk, max_epochs - done)
+            tasks = [
+                (seed, scheme, params, chunk, lr, dataset) for seed, params in alive.items()
+            ]
+            for seed, params, loss in pool.map(_train_chunk, tasks):
+                alive[seed] = params
+                last_loss[seed] = loss
+                history[seed].append((done + chunk, loss))
+            done += chunk
+
+            # Orden estable por pérdida y luego por semilla para ser determinista
+            ranked = sorted(alive, key=lambda s: (last_loss[s], s))
+            best = ranked[0]
+            if last_loss[best] <= target_loss or len(ranked) == 1 or done >= max_epochs:
+                return RestartResult(best, alive[best], last_loss[best], done, history)
+
+            keep = max(1, int(len(ranked) * keep_fraction))
+            alive = {seed: alive[seed] for seed in ranked[:keep]}
+            chunk *= 2
@@ -0,0 +1,255 @@
+"""Programas de tasa de aprendizaje y prueba de rango de LR.
+
+Un ``Schedule`` da la tasa de aprendizaje de cada época (``lr(epoch)``, con
+épocas numeradas desde 1) y recibe la pérdida media al final de cada una
+(``update``), que solo usa ``ReduceOnPlateau``. ``train``/``train_with_callback``
+y ``train_fast`` aceptan un ``Schedule`` en lugar de un ``lr`` constante.
+
+``lr_range_test`` hace la prueba de rango de LR: entrena en paralelo (con
+``BatchedMLP221``) una copia de la red por cada LR de una grilla logarítmica
+durante una corrida corta y recomienda un LR a distancia segura de la
+divergencia (la mitad del mayor LR estable con pérdida cercana a la mejor).
+
+Especificaciones de texto para ``make_schedule`` (CLI y UI)::
+
+    constant
+    step:ÉPOCAS[:GAMMA]          multiplica por GAMMA (0.5) cada ÉPOCAS
+    exp[:GAMMA]                  multiplica por GAMMA (0.999) cada época
+    cosine[:LR_MIN]              coseno hasta LR_MIN (0) en las épocas totales
+    plateau[:PACIENCIA[:FACTOR]] reduce por FACTOR (0.5) tras PACIENCIA (100) sin mejora
+    warmup:ÉPOCAS[+OTRA]         rampa lineal desde 0 y luego OTRA (constant)
+"""
+
+import math
+from typing import List, NamedTuple, Optional
+
+from core.model import MLP221
+from data.datasets import XOR, Dataset
+
+NAMES = ("constant", "step", "exp", "cosine", "plateau", "warmup")
+
+
+class Schedule:
+    """Tasa de aprendizaje constante; base de los demás programas."""
+
+    # True si ``lr`` depende de las pérdidas recibidas por ``update``
+    adaptive = False
+
+    def __init__(self, lr: float):
+        if lr <= 0:
+            raise ValueError("El learning rate debe ser positivo")
+        self.base_lr = lr
+
+    def lr(self, epoch: int) -> float:
+        """Tasa de aprendizaje para la época ``epoch`` (desde 1)."""
+
+        return self.base_lr
+
+    def update(self, epoch: int, loss: float) -> None:
+        """Recibe la pérdida media de la época recién terminada."""
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{k}={v!r}" for k, v in vars(self).items() if not k.startswith("_"))
+        return f"{type(self).__name__}({args})"
+
+
+class StepDecay(Schedule):
+    """Multiplica el LR por ``gamma`` cada ``step_size`` épocas."""
+
+    def __init__(self, lr: float, step_size: int, gamma: float = 0.5):
+        super().__init__(lr)
+        self.step_size = max(1, step_size)
+        self.gamma = gamma
+
+    def lr(self, epoch: int) -> float:
+        return self.base_lr * self.gamma ** ((epoch - 1) // self.step_size)
+
+
+class ExponentialDecay(Schedule):
+    """Multiplica el LR por ``gamma`` en cada época."""
+
+    def __init__(self, lr: float, gamma: float = 0.999):
+        super().__init__(lr)
+        self.gamma = gamma
+
+    def lr(self, epoch: int) -> float:
+        return self.base_lr * self.gamma ** (epoch - 1)
+
+
+class CosineDecay(Schedule):
+    """Media onda de coseno desde ``lr`` hasta ``min_lr`` en ``total_epochs``."""
+
+    def __init__(self, lr: float, total_epochs: int, min_lr: float = 0.0):
+        super().__init__(lr)
+        self.total_epochs = max(1, total_epochs)
+        self.min_lr = min_lr
+
+    def lr(self, epoch: int) -> float:
+        t = min(epoch - 1, self.total_epochs) / self.total_epochs
+        return self.min_lr + (self.base_lr - self.min_lr) * 0.5 * (1.0 + math.cos(math.pi * t))
+
+
+class Warmup(Schedule):
+    """Rampa lineal durante ``warmup_epochs`` y luego el programa ``after``."""
+
+    def __init__(self, after: Schedule, warmup_epochs: int):
+        super().__init__(after.base_lr)
+        self.after = after
+        self.warmup_epochs = max(1, warmup_epochs)
+
+    def lr(self, epoch: int) -> float:
+        if epoch <= self.warmup_epochs:
+            return self.base_lr * epoch / self.warmup_epochs
+        return self.after.lr(epoch - self.warmup_epochs)
+
+    @property
+    def adaptive(self) -> bool:
+        return self.after.adaptive
+
+    def update(self, epoch: int, loss: float) -> None:
+        if epoch > self.warmup_epochs:
+            self.after.update(epoch - self.warmup_epochs, loss)
+
+
+class ReduceOnPlateau(Schedule):
+    """
+    Reduce el LR por ``factor`` cuando la pérdida no mejora durante ``patience`` épocas.
+
+    Una mejora es bajar del mejor valor en más de ``threshold`` (relativo).
+    """
+
+    adaptive = True
+
+    def __init__(self, lr: float, patience: int = 100, factor: float = 0.5,
+                 threshold: float = 1e-4, min_lr: float = 1e-6):
+        super().__init__(lr)
+        self.patience = max(1, patience)
+        self.factor = factor
+        self.threshold = threshold
+        self.min_lr = min_lr
+        self._current = lr
+        self._best = math.inf
+        self._stale = 0
+
+    def lr(self, epoch: int) -> float:
+        return self._current
+
+    def update(self, epoch: int, loss: float) -> None:
+        if loss < self._best * (1.0 - self.threshold):
+            self._best = loss
+            self._stale = 0
+            return
+        self._stale += 1
+        if self._stale >= self.patience:
+            self._current = max(self._current * self.factor, self.min_lr)
+            self._stale = 0
+
+
+def make_schedule(spec: str, lr: float, epochs: int) -> Schedule:
+    """
+    Construye un programa a partir de una especificación de texto (ver el módulo).
+
+    Parámetros:
+        spec: Especificación, p. ej. ``"cosine"``, ``"step:1000:0.5"`` o ``"warmup:100+cosine"``
+        lr: Tasa de aprendizaje base
+        epochs: Épocas totales de la corrida (para ``cosine``)
+    """
+    head, plus, rest = spec.partition("+")
+    name, *args = head.split(":")
+    try:
+        values = [float(a) for a in args]
+        if name == "constant" and not values:
+            return Schedule(lr)
+        if name == "step" and 1 <= len(values) <= 2:
+            return StepDecay(lr, int(values[0]), *values[1:])
+        if name == "exp" and len(values) <= 1:
+            return ExponentialDecay(lr, *values)
+        if name == "cosine" and len(values) <= 1:
+            return CosineDecay(lr, epochs, *values)
+        if name == "plateau" and len(values) <= 2:
+            patience = int(values[0]) if values else 100
+            return ReduceOnPlateau(lr, patience, *values[1:])
+        if name == "warmup" and len(values) == 1:
+            warm = int(values[0])
+            after = make_schedule(rest, lr, epochs - warm) if plus else Schedule(lr)
+            return Warmup(after, warm)
+    except ValueError as exc:
+        raise ValueError(f"Programa de LR inválido {spec!r}: {exc}") from None
+    raise ValueError(f"Programa de LR desconocido: {spec!r}")
+
+
+class LRRangeResult(NamedTuple):
+    """Resultado de ``lr_range_test``."""
+
+    lrs: List[float]
+    losses: List[float]
+    suggested: float
+
+
+def lr_range_test(
+    net: Optional[MLP221] = None,
+    dataset: Optional[Dataset] = None,
+    min_lr: float = 1e-2,
+    max_lr: float = 20.0,
+    num: int = 32,
+    epochs: int = 300,
+    margin: float = 0.5,
+    safety: float = 0.5,
+) -> LRRangeResult:
+    """
+    Prueba de rango de LR: barre ``num`` LR log-espaciados en una corrida corta.
+
+    Cada LR entrena una copia de ``net`` durante ``epochs`` épocas de SGD; todas
+    las copias avanzan juntas en un ``BatchedMLP221`` (float64, misma trayectoria
+    que ``MLP221``), así que el barrido cuesta lo mismo que unas pocas corridas.
+    ``net`` no se modifica.
+
+    El LR con menor pérdida final suele estar al borde de la divergencia, así que
+    la sugerencia se aleja de él: el barrido se corta en el primer LR que termina
+    peor que la pérdida inicial (o no finita), se toma el mayor LR por debajo del
+    corte cuya pérdida no supera la mejor en más de ``margin`` (relativo) y se
+    multiplica por ``safety``.
+
+    Parámetros:
+        net: Red de partida (por defecto ``MLP221()`` con pesos fijos)
+        dataset: Conjunto de entrenamiento (por defecto XOR; se usa su primer bloque)
+        min_lr, max_lr: Extremos del barrido
+        num: Cantidad de LR probados
+        epochs: Épocas de la corrida corta
+        margin: Tolerancia relativa respecto de la mejor pérdida
+        safety: Factor (en ``(0, 1]``) aplicado al LR elegido
+
+    Devuelve:
+        ``LRRangeResult`` con los LR probados, la pérdida final de cada uno y el LR sugerido
+    """
+    import numpy as np
+
+    from core.vectorized import BatchedMLP221
+
+    if not 0 < min_lr < max_lr:
+        raise ValueError("Se requiere 0 < min_lr < max_lr")
+    if num < 2 or epochs < 1:
+        raise ValueError("Se necesitan al menos 2 LR y 1 época")
+    if margin < 0 or not 0 < safety <= 1:
+        raise ValueError("Se requiere margin >= 0 y 0 < safety <= 1")
+    start = (MLP221() if net is None else net).get_params()
+    samples = (XOR if dataset is None else dataset).chunk(0)
+    X = np.array([x for x, _ in samples], dtype=np.float64)
+    Y = np.array([y for _, y in samples], dtype=np.float64)
+
+    lrs = np.geomspace(min_lr, max_lr, num)
+    pop = BatchedMLP221(np.tile(start, (num, 1)))
+    initial = float(pop.losses(X, Y)[0])
+    with np.errstate(over="ignore", invalid="ignore"):
+        for _ in range(epochs):
+            pop.sgd_epoch(X, Y, lrs)
+        losses = pop.losses(X, Y)
+    losses = np.where(np.isfinite(losses), losses, np.inf)
+
+    diverged = np.flatnonzero(losses > initial)
+    edge = int(diverged[0]) if len(diverged) else num
+    if edge == 0:
+        return LRRangeResult(lrs.tolist(), losses.tolist(), float(lrs[0] * safety))
+    stable = losses[:edge]
+    close = np.flatnonzero(stable <= stable.min() * (1.0 + margin))
+    return LRRangeResult(lrs.tolist(), losses.tolist(), float(lrs[close[-1]] * safety))
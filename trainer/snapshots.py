@@ -0,0 +1,145 @@
+"""Anillo de instantáneas de pesos para recorrer la trayectoria del entrenamiento.
+
+``SnapshotRing`` guarda cada ``stride`` épocas los 9 parámetros de la red (más
+la época) en un búfer contiguo de ``float64`` de capacidad fija: 80 bytes por
+instantánea, en memoria o en un archivo mapeado con ``mmap``. Al llenarse se
+sobrescriben las más antiguas. Leer la instantánea i es indexar el búfer, O(1),
+sin volver a entrenar; la interfaz lo usa para su deslizador de épocas.
+
+``train``/``train_with_callback`` y ``train_fast`` aceptan ``snapshots=`` y
+registran la época 0 (pesos iniciales), cada múltiplo de ``stride`` y la última
+época.
+"""
+
+import mmap
+from array import array
+from typing import Callable, List, Optional, Sequence, Tuple
+
+_WIDTH = 10  # época + 9 parámetros
+
+
+class SnapshotRing:
+    """Búfer circular de ``(época, parámetros)``."""
+
+    def __init__(self, capacity: int = 4096, stride: int = 1, path: Optional[str] = None):
+        """
+        Parámetros:
+            capacity: Instantáneas que caben antes de sobrescribir las más antiguas
+            stride: Épocas entre instantáneas
+            path: Si se indica, el búfer es un archivo de ese nombre mapeado en memoria
+        """
+        if capacity < 1:
+            raise ValueError("La capacidad debe ser positiva")
+        self.capacity = capacity
+        self.stride = max(1, stride)
+        self.path = path
+        size = capacity * _WIDTH * 8
+        self._map: Optional[mmap.mmap] = None
+        if path is None:
+            raw = bytearray(size)
+        else:
+            with open(path, "w+b") as file:
+                file.truncate(size)
+                self._map = mmap.mmap(file.fileno(), size)
+            raw = self._map
+        self._buf = memoryview(raw).cast("d")
+        self._count = 0
+
+    @classmethod
+    def for_epochs(
+        cls, epochs: int, capacity: int = 4096, path: Optional[str] = None
+    ) -> "SnapshotRing":
+        """Anillo cuyo ``stride`` hace caber la corrida entera de ``epochs`` épocas."""
+
+        # La época 0 y la última ocupan dos lugares además de los múltiplos de stride
+        return cls(capacity, max(1, -(-epochs // max(1, capacity - 2))), path)
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def record(self, epoch: int, params: Sequence[float]) -> None:
+        """Guarda una instantánea (sobrescribe la más antigua si está lleno)."""
+
+        start = (self._count % self.capacity) * _WIDTH
+        self._buf[start:start + _WIDTH] = array("d", [epoch, *params])
+        self._count += 1
+
+    def ensure(self, epoch: int, params: Sequence[float]) -> None:
+        """Registra ``epoch`` salvo que ya sea la última instantánea (p. ej. tras cancelar)."""
+
+        if not len(self) or self.epoch_at(-1) != epoch:
+            self.record(epoch, params)
+
+    def _slot(self, index: int) -> int:
+        if not -len(self) <= index < len(self):
+            raise IndexError("Instantánea fuera de rango")
+        if index < 0:
+            index += len(self)
+        oldest = self._count - len(self)
+        return ((oldest + index) % self.capacity) * _WIDTH
+
+    def epoch_at(self, index: int) -> int:
+        """Época de la instantánea ``index`` (0 = la más antigua conservada)."""
+
+        return int(self._buf[self._slot(index)])
+
+    def params_at(self, index: int) -> List[float]:
+        """Los 9 parámetros de la instantánea ``index``, en el orden de ``get_params``."""
+
+        start = self._slot(index) + 1
+        return self._buf[start:start + _WIDTH - 1].tolist()
+
+    def __getitem__(self, index: int) -> Tuple[int, List[float]]:
+        return self.epoch_at(index), self.params_at(index)
+
+    def recorder(self, net, callback: Optional[Callable[[int, int, float], None]] = None):
+        """
+        Envuelve ``callback`` para registrar ``net`` cada ``stride`` épocas.
+
+        Registra de inmediato la época 0 (pesos actuales) y, durante el
+        entrenamiento, cada múltiplo de ``stride`` y la última época.
+        """
+        self.record(0, net.get_params())
+        stride = self.stride
+
+        def wrapped(epoch: int, total: int, loss: float) -> None:
+            if epoch % stride == 0 or epoch == total:
+                self.record(epoch, net.get_params())
+            if callback:
+                callback(epoch, total, loss)
+
+        return wrapped
+
+    def close(self) -> None:
+        """Libera el mapeo del archivo (si lo hay)."""
+
+        self._buf.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+if __name__ == "__main__":
+    import time
+
+    from core.model import MLP221
+    from trainer.train import train
+
+    epochs = 100_000
+    ring = SnapshotRing.for_epochs(epochs)
+    net = MLP221()
+    start = time.perf_counter()
+    train(net, epochs=epochs, snapshots=ring)
+    with_ring = time.perf_counter() - start
+    start = time.perf_counter()
+    train(MLP221(), epochs=epochs)
+    plain = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(len(ring)):
+        ring.params_at(i)
+    seek = (time.perf_counter() - start) / len(ring)
+    print(f"{len(ring)} instantáneas (stride {ring.stride}) | entrenamiento {with_ring:.2f} s "
+          f"vs {plain:.2f} s sin anillo | lectura {seek * 1e9:.0f} ns por instantánea")
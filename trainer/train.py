@@ -1,85 +1,362 @@
-from typing import Optional, Callable
+import math
+import time
+from typing import Optional, Callable, Union
 from core.model import MLP221
 from core.losses import bce
-from data.xor import DATA
+from data.datasets import XOR, Dataset
+from mlpio.metrics import MetricsWriter
 from mlpio.tracer import MarkdownTracer
+from trainer.control import TrainingControl
+from trainer.history import LossHistory
+from trainer.optimizers import SecondOrderOptimizer
+from trainer.profiling import PhaseProfiler
+from trainer.schedules import Schedule
+from trainer.snapshots import SnapshotRing
 
-def train(net: MLP221, epochs: int = 3000, lr: float = 0.5, tracer: Optional[MarkdownTracer] = None):
+def train(
+    net: MLP221,
+    epochs: int = 3000,
+    lr: Union[float, Schedule] = 0.5,
+    tracer: Optional[MarkdownTracer] = None,
+    profiler: Optional[PhaseProfiler] = None,
+    dataset: Optional[Dataset] = None,
+    control: Optional[TrainingControl] = None,
+    metrics: Optional[MetricsWriter] = None,
+    snapshots: Optional[SnapshotRing] = None,
+    optimizer: Optional[SecondOrderOptimizer] = None,
+):
     """
     Bucle de entrenamiento estándar sin callbacks.
-    
+
     Argumentos:
         net: El modelo MLP221 a entrenar
         epochs: Número de épocas de entrenamiento
-        lr: Tasa de aprendizaje
+        lr: Tasa de aprendizaje constante o ``Schedule`` (LR por época)
         tracer: Trazador opcional para registrar detalles del entrenamiento
-        
+        profiler: Acumulador opcional de tiempos por fase
+        dataset: Conjunto de entrenamiento (por defecto el XOR de 4 filas)
+        control: Ficha opcional para pausar o cancelar el entrenamiento
+        metrics: Sumidero opcional de métricas por época (JSONL/CSV)
+        snapshots: Anillo opcional de instantáneas de pesos cada ``stride`` épocas
+        optimizer: ``Newton``/``LBFGS`` en lugar de SGD (una iteración por época)
+
     Devuelve:
-        Lista de pérdidas promedio por época
+        LossHistory con las pérdidas promedio por época
     """
-    losses = []
-    for ep in range(1, epochs + 1):
-        if tracer: 
-            tracer.log_epoch_header(ep, lr)
-        ep_loss = 0.0
-        for x, y in DATA:
-            yhat = net.forward(x)
-            L = bce(yhat, y)
-            ep_loss += L
-            net.backward(y)
-            if tracer: 
-                tracer.log_sample(x, y, net)
-            net.step(lr)
-            if tracer: 
-                tracer.log_update(net)
-        losses.append(ep_loss / len(DATA))
-    return losses
+    return train_with_callback(
+        net,
+        epochs=epochs,
+        lr=lr,
+        tracer=tracer,
+        profiler=profiler,
+        dataset=dataset,
+        control=control,
+        metrics=metrics,
+        snapshots=snapshots,
+        optimizer=optimizer,
+    )
 
 
 def train_with_callback(
-    net: MLP221, 
-    epochs: int = 3000, 
-    lr: float = 0.5, 
+    net: MLP221,
+    epochs: int = 3000,
+    lr: Union[float, Schedule] = 0.5,
     tracer: Optional[MarkdownTracer] = None,
-    callback: Optional[Callable[[int, int, float], None]] = None
+    callback: Optional[Callable[[int, int, float], None]] = None,
+    profiler: Optional[PhaseProfiler] = None,
+    dataset: Optional[Dataset] = None,
+    control: Optional[TrainingControl] = None,
+    metrics: Optional[MetricsWriter] = None,
+    snapshots: Optional[SnapshotRing] = None,
+    optimizer: Optional[SecondOrderOptimizer] = None,
 ):
     """
     Bucle de entrenamiento con soporte de callback para actualizaciones en tiempo real de la interfaz.
-    
+
     Argumentos:
         net: El modelo MLP221 a entrenar
         epochs: Número de épocas de entrenamiento
-        lr: Tasa de aprendizaje
+        lr: Tasa de aprendizaje constante o ``Schedule`` (LR por época)
         tracer: Trazador opcional para registrar detalles del entrenamiento
         callback: Función callback opcional(epoch, total_epochs, avg_loss)
-        
+        profiler: Acumulador opcional de tiempos por fase (forward, loss,
+            backward, step, tracer, callback)
+        dataset: Conjunto de entrenamiento (por defecto el XOR de 4 filas); se
+            recorre en streaming, sin materializarlo
+        control: Ficha opcional consultada cada ``control.check_every`` épocas;
+            al cancelar se guarda un punto de control y se devuelven las
+            pérdidas parciales
+        metrics: Sumidero opcional que recibe un registro por época (pérdida,
+            precisión, normas de gradiente y pesos, duración); se vacía al
+            terminar pero no se cierra
+        snapshots: Anillo opcional que recibe los pesos de la época 0, de cada
+            ``snapshots.stride`` épocas y de la última
+        optimizer: Optimizador de segundo orden (``trainer.optimizers``); si se
+            indica, cada época es una iteración de Newton/L-BFGS sobre el lote
+            completo con búsqueda lineal, ``lr`` se ignora y la pérdida
+            registrada es la del punto aceptado. No admite ``metrics``
+
     Devuelve:
-        Lista de pérdidas promedio por época
+        LossHistory con las pérdidas promedio por época
+    """
+    data = XOR if dataset is None else dataset
+    if data.n_inputs != 2:
+        raise ValueError("MLP221 requiere un conjunto con 2 entradas")
+    if snapshots is not None:
+        callback = snapshots.recorder(net, callback)
+    if optimizer is not None:
+        if metrics is not None:
+            raise ValueError("Las métricas por época solo están disponibles con SGD")
+        losses = _train_second_order(net, epochs, optimizer, tracer, callback, profiler, data,
+                                     control)
+    elif profiler is not None:
+        losses = _train_profiled(net, epochs, lr, tracer, callback, profiler, data, control, metrics)
+    elif tracer is None and metrics is None:
+        losses = _train_fused(net, epochs, lr, callback, data, control)
+    elif tracer is None:
+        losses = _train_metrics(net, epochs, lr, callback, data, control, metrics)
+    else:
+        losses = _train_traced(net, epochs, lr, tracer, callback, data, control, metrics)
+    if metrics is not None:
+        metrics.flush()
+    return losses
+
+
+class _EpochLoop:
     """
-    losses = []
-    for ep in range(1, epochs + 1):
-        if tracer: 
+    Lo común a todos los bucles: LR de cada época y cierre de la época.
+
+    Cada variante solo especializa el recorrido de las muestras::
+
+        loop = _EpochLoop(net, epochs, lr, callback, control)
+        for ep, lr in loop:
+            ...  # muestras
+            if loop.end(ep, avg_loss):
+                break
+        return loop.losses
+    """
+
+    def __init__(self, net, epochs, lr, callback, control, stats=None, metrics=None,
+                 profiler=None, n=0):
+        self.net = net
+        self.epochs = epochs
+        self.lr = lr
+        self.schedule = lr if isinstance(lr, Schedule) else None
+        self.callback = callback
+        self.control = control
+        self.stats = stats
+        self.metrics = metrics
+        self.profiler = profiler
+        self.n = n
+        self.losses = LossHistory()
+
+    def __iter__(self):
+        for ep in range(1, self.epochs + 1):
+            if self.schedule:
+                self.lr = self.schedule.lr(ep)
+            yield ep, self.lr
+
+    def end(self, ep: int, avg_loss: float, t=None) -> bool:
+        """
+        Registra la pérdida, métricas, programa de LR, callback y control.
+
+        ``t`` es la marca del perfilador (si lo hay). Devuelve True si hay que
+        detener el entrenamiento.
+        """
+        profiler = self.profiler
+        self.losses.append(avg_loss)
+        if self.stats:
+            self.stats.emit(self.metrics, ep, avg_loss, self.n, self.net)
+            if profiler:
+                t = profiler.lap("metrics", t)
+        if self.schedule:
+            self.schedule.update(ep, avg_loss)
+        if self.callback:
+            self.callback(ep, self.epochs, avg_loss)
+            if profiler:
+                profiler.lap("callback", t)
+        return _should_stop(self.control, ep, self.epochs, self.net, self.lr, self.losses)
+
+
+def _train_traced(net, epochs, lr, tracer, callback, data, control, metrics):
+    """Bucle paso a paso con trazador (y métricas opcionales)."""
+
+    stats = _EpochStats() if metrics is not None else None
+    loop = _EpochLoop(net, epochs, lr, callback, control, stats, metrics, n=len(data))
+    for ep, lr in loop:
+        if tracer:
             tracer.log_epoch_header(ep, lr)
         ep_loss = 0.0
-        
+
         # Entrenar con todas las muestras
-        for x, y in DATA:
+        for x, y in data:
             yhat = net.forward(x)
             L = bce(yhat, y)
             ep_loss += L
             net.backward(y)
-            if tracer: 
+            if stats:
+                stats.add(net, y)
+            if tracer:
                 tracer.log_sample(x, y, net)
             net.step(lr)
-            if tracer: 
+            if tracer:
                 tracer.log_update(net)
-        
-        # Calcular la pérdida promedio para esta época
-        avg_loss = ep_loss / len(DATA)
-        losses.append(avg_loss)
-        
-        # Invocar callback para actualizaciones de la UI
-        if callback:
-            callback(ep, epochs, avg_loss)
-    
-    return losses
+
+        if loop.end(ep, ep_loss / len(data)):
+            break
+
+    return loop.losses
+
+
+class _EpochStats:
+    """Acumula aciertos y gradiente medio de una época para ``MetricsWriter``."""
+
+    __slots__ = ("grads", "correct", "start")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self.grads = [0.0] * 9
+        self.correct = 0
+        self.start = time.perf_counter()
+
+    def add(self, net, y: float) -> None:
+        """Suma el gradiente de la muestra (ya calculado) y si ``yhat`` acertó."""
+
+        g = self.grads
+        dW1 = net.dW1
+        g[0] += dW1[0][0]
+        g[1] += dW1[0][1]
+        g[2] += dW1[1][0]
+        g[3] += dW1[1][1]
+        db1 = net.db1
+        g[4] += db1[0]
+        g[5] += db1[1]
+        dW2 = net.dW2
+        g[6] += dW2[0][0]
+        g[7] += dW2[0][1]
+        g[8] += net.db2[0]
+        if (net.yhat > 0.5) == (y > 0.5):
+            self.correct += 1
+
+    def emit(self, metrics: MetricsWriter, ep: int, avg_loss: float, n: int, net) -> None:
+        """Escribe el registro de la época y reinicia los acumuladores."""
+
+        grad_norm = math.sqrt(sum((v / n) ** 2 for v in self.grads))
+        weight_norm = math.sqrt(sum(v * v for v in net.get_params()))
+        metrics.log_epoch(
+            ep, avg_loss, self.correct / n, grad_norm, weight_norm,
+            time.perf_counter() - self.start,
+        )
+        self.reset()
+
+
+def _should_stop(control, ep, epochs, net, lr, losses) -> bool:
+    """
+    Consulta la ficha de control cada ``check_every`` épocas y en la última.
+
+    Así una cancelación pedida tras el último múltiplo también deja su punto
+    de control en vez de perderse al terminar el bucle.
+    """
+
+    if control is None or (ep % control.check_every and ep != epochs):
+        return False
+    if control.check():
+        control.finish(net, ep, lr, losses)
+        return True
+    return False
+
+
+def _train_fused(net, epochs, lr, callback, data, control):
+    """Bucle sin trazador: un ``train_step`` fusionado por muestra."""
+
+    step = net.train_step
+    n = len(data)
+    loop = _EpochLoop(net, epochs, lr, callback, control, n=n)
+    for ep, lr in loop:
+        ep_loss = 0.0
+        for x, y in data:
+            ep_loss += step(x, y, lr)
+        if loop.end(ep, ep_loss / n):
+            break
+    return loop.losses
+
+
+def _train_metrics(net, epochs, lr, callback, data, control, metrics):
+    """Bucle fusionado que además conserva gradientes para las métricas."""
+
+    stats = _EpochStats()
+    step = net.train_step
+    n = len(data)
+    loop = _EpochLoop(net, epochs, lr, callback, control, stats, metrics, n=n)
+    for ep, lr in loop:
+        ep_loss = 0.0
+        for x, y in data:
+            ep_loss += step(x, y, lr, keep_grads=True)
+            stats.add(net, y)
+        if loop.end(ep, ep_loss / n):
+            break
+    return loop.losses
+
+
+def _train_profiled(net, epochs, lr, tracer, callback, profiler: PhaseProfiler, data, control,
+                    metrics=None):
+    """Mismo bucle que ``train_with_callback`` midiendo cada fase por separado."""
+
+    stats = _EpochStats() if metrics is not None else None
+    loop = _EpochLoop(net, epochs, lr, callback, control, stats, metrics, profiler, len(data))
+    for ep, lr in loop:
+        t = profiler.start()
+        if tracer:
+            tracer.log_epoch_header(ep, lr)
+            t = profiler.lap("tracer", t)
+        ep_loss = 0.0
+
+        for x, y in data:
+            yhat = net.forward(x)
+            t = profiler.lap("forward", t)
+            ep_loss += bce(yhat, y)
+            t = profiler.lap("loss", t)
+            net.backward(y)
+            t = profiler.lap("backward", t)
+            if stats:
+                stats.add(net, y)
+                t = profiler.lap("metrics", t)
+            if tracer:
+                tracer.log_sample(x, y, net)
+                t = profiler.lap("tracer", t)
+            net.step(lr)
+            t = profiler.lap("step", t)
+            if tracer:
+                tracer.log_update(net)
+                t = profiler.lap("tracer", t)
+
+        if loop.end(ep, ep_loss / len(data), t):
+            break
+
+    return loop.losses
+
+
+def _train_second_order(net, epochs, optimizer, tracer, callback, profiler, data, control):
+    """
+    Una iteración de ``optimizer`` por época sobre el lote completo.
+
+    No hay tasa de aprendizaje: el punto de control guarda ``lr`` como None y la
+    traza anota el optimizador y la longitud de paso de la búsqueda lineal.
+    """
+
+    loop = _EpochLoop(net, epochs, None, callback, control, profiler=profiler)
+    for ep, _ in loop:
+        t = profiler.start() if profiler else None
+        avg_loss, step = optimizer.step(net, data)
+        if profiler:
+            t = profiler.lap("step", t)
+        if tracer:
+            tracer.log_epoch_header(ep, None, f"{optimizer.name}, paso t={step:.4g}")
+            tracer.log_update(net)
+            if profiler:
+                t = profiler.lap("tracer", t)
+        if loop.end(ep, avg_loss, t):
+            break
+    return loop.losses
@@ -1,3 +1,4 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 from threading import Thread
@@ -5,15 +6,29 @@ from threading import Thread
 from typing import Optional
 
 from core import MLP221
-from data.xor import DATA
+from data.datasets import XOR, Dataset
 from mlpio.tracer import MarkdownTracer
-from mlpio.export import export_loss_plot, export_pred_table
-
+from mlpio.service import ExportService
+
+from trainer.control import TrainingControl
+from trainer.history import LossHistory
+from trainer.jit import AVAILABLE as JIT_AVAILABLE, train_fast
+from trainer.optimizers import OPTIMIZERS, make_optimizer
+from trainer.schedules import lr_range_test, make_schedule
+from trainer.snapshots import SnapshotRing
 from trainer.train import train_with_callback
+from ui.live_chart import LiveLossChart
 
 
 class App:
-    def __init__(self, root, net: MLP221):
+    def __init__(
+        self,
+        root,
+        net: MLP221,
+        init: str = "fixed",
+        seed: Optional[int] = None,
+        dataset: Optional[Dataset] = None,
+    ):
 
 
 
@@ -22,18 +37,28 @@ class App:
         self.root.title("MLP XOR 2-2-1 - Simulador Didáctico Interactivo")
         self.root.resizable(True, True)
         self.net = net
+        self.init = init
+        self.seed = seed
+        self.dataset = XOR if dataset is None else dataset
         self.lr = 0.5
+        self.schedule_spec = "constant"
+        self.optimizer_name = "sgd"
         self.epochs = 3000
-        self.losses = []
+        self.fast_engine = False
+        self.losses = LossHistory()
         self.is_training = False
         self.training_thread: Optional[Thread] = None
+        self.control: Optional[TrainingControl] = None
+        self.exporter = ExportService()
+        self.snapshots = SnapshotRing(capacity=2)
+        self._scrub_pending = False
         
         self.option_buttons = {}
         self.edge_order = []
         self.edge_items = {}
         self.edge_labels = []
         
-        self.root.minsize(900, 700)
+        self.root.minsize(1040, 880)
         
         self._configure_style()
         self._build_ui()
@@ -174,6 +199,34 @@ class App:
                                highlightbackground=self.colors["bg_light"])
         self.canvas.pack(fill="both", expand=True)
 
+        self.loss_chart = LiveLossChart(main_container, self.colors, height=150)
+        self.loss_chart.pack(fill="x", pady=(0, 8))
+
+        scrub_frame = ttk.Frame(main_container)
+        scrub_frame.pack(fill="x", pady=(0, 16))
+        ttk.Label(scrub_frame, text="Trayectoria:").pack(side="left", padx=(0, 8))
+        self.var_scrub = tk.DoubleVar(value=0)
+        self.scrubber = ttk.Scale(scrub_frame, from_=0, to=0, orient="horizontal",
+                                  variable=self.var_scrub, command=self._on_scrub)
+        self.scrubber.pack(side="left", fill="x", expand=True)
+        self.scrubber.state(["disabled"])
+        self.lbl_scrub = ttk.Label(scrub_frame, text="Época -", width=40,
+                                   foreground=self.colors["text_secondary"])
+        self.lbl_scrub.pack(side="left", padx=(8, 0))
+        self._create_tooltip(
+            self.scrubber,
+            "Recorrer los pesos guardados durante el entrenamiento "
+            "sin modificar la red entrenada"
+        )
+        self.btn_adopt = ttk.Button(scrub_frame, text="Usar estos pesos",
+                                    command=self.adopt_snapshot_click)
+        self.btn_adopt.pack(side="left", padx=(8, 0))
+        self.btn_adopt.state(["disabled"])
+        self._create_tooltip(
+            self.btn_adopt,
+            "Cargar en la red los pesos mostrados para que Entrenar continúe desde ellos"
+        )
+
         controls = ttk.Frame(main_container)
         controls.pack(fill="x", pady=(0, 12))
 
@@ -208,6 +261,56 @@ class App:
         ep_entry.pack(side="left")
         self._create_tooltip(ep_entry, "Número de iteraciones de entrenamiento")
 
+        sched_container = ttk.Frame(params_inputs)
+        sched_container.pack(side="left", padx=(20, 0))
+
+        self.var_schedule = tk.StringVar(value=self.schedule_spec)
+        ttk.Label(sched_container, text="Programa LR:").pack(side="left", padx=(0, 8))
+        sched_combo = ttk.Combobox(
+            sched_container,
+            textvariable=self.var_schedule,
+            values=("constant", "cosine", "step:1000:0.5", "exp:0.999", "plateau:100:0.5",
+                    "warmup:100+cosine"),
+            width=16,
+        )
+        sched_combo.pack(side="left")
+        self._create_tooltip(
+            sched_combo,
+            "Cómo varía el LR por época: constant, step:N[:G], exp[:G], cosine[:MIN], "
+            "plateau[:P[:F]] o warmup:N[+otro]"
+        )
+
+        opt_container = ttk.Frame(params_inputs)
+        opt_container.pack(side="left", padx=(20, 0))
+
+        self.var_optimizer = tk.StringVar(value=self.optimizer_name)
+        ttk.Label(opt_container, text="Optimizador:").pack(side="left", padx=(0, 8))
+        opt_combo = ttk.Combobox(
+            opt_container,
+            textvariable=self.var_optimizer,
+            values=OPTIMIZERS,
+            state="readonly",
+            width=8,
+        )
+        opt_combo.pack(side="left")
+        self._create_tooltip(
+            opt_combo,
+            "sgd: descenso por muestra con el LR y su programa; newton (Hessiano exacto) "
+            "y lbfgs: una iteración por época sobre las 4 muestras, converge en decenas"
+        )
+
+        self.var_fast = tk.BooleanVar(value=False)
+        fast_check = ttk.Checkbutton(params_inputs,
+                                     text="Motor rápido",
+                                     variable=self.var_fast)
+        fast_check.pack(side="left", padx=(20, 0))
+        self._create_tooltip(
+            fast_check,
+            "Entrena en código compilado (Numba) sin escribir trazas.md; "
+            "permite hasta 10 millones de épocas"
+            + ("" if JIT_AVAILABLE else " (Numba no instalado: usa Python)")
+        )
+
         test_frame = ttk.Frame(controls)
         test_frame.pack(fill="x", pady=(0, 12))
 
@@ -266,8 +369,31 @@ class App:
                                     text="Reiniciar Pesos", 
                                     style="TButton", 
                                     command=self.reset_weights)
-        self.btn_reset.pack(side="left")
-        self._create_tooltip(self.btn_reset, "Volver a los pesos iniciales aleatorios")
+        self.btn_reset.pack(side="left", padx=(0, 10))
+        self._create_tooltip(self.btn_reset, "Volver a los pesos iniciales (fijos o aleatorios con semilla)")
+
+        self.btn_find_lr = ttk.Button(buttons_row, 
+                                      text="Buscar LR", 
+                                      style="TButton", 
+                                      command=self.find_lr_click)
+        self.btn_find_lr.pack(side="left")
+        self._create_tooltip(self.btn_find_lr, "Probar 32 LR en paralelo desde los pesos actuales y usar el mejor")
+
+        self.btn_stop = ttk.Button(buttons_row, 
+                                   text="Detener", 
+                                   style="TButton", 
+                                   command=self.stop_click)
+        self.btn_stop.pack(side="right")
+        self.btn_stop.state(["disabled"])
+        self._create_tooltip(self.btn_stop, "Cancelar el entrenamiento guardando checkpoint.json y la curva parcial")
+
+        self.btn_pause = ttk.Button(buttons_row, 
+                                    text="Pausar", 
+                                    style="TButton", 
+                                    command=self.pause_click)
+        self.btn_pause.pack(side="right", padx=(0, 10))
+        self.btn_pause.state(["disabled"])
+        self._create_tooltip(self.btn_pause, "Pausar o reanudar el entrenamiento en curso")
 
         progress_frame = ttk.Frame(main_container)
         progress_frame.pack(fill="x", pady=(0, 8))
@@ -383,7 +509,7 @@ class App:
              "• Botones de Prueba: Probar predicciones con las 4 combinaciones XOR\n"
              "• Botón Entrenar: Inicia el proceso de entrenamiento\n"
              "• Botón Exportar: Guarda trazas, gráficas y tablas de predicción\n"
-             "• Botón Reiniciar: Vuelve a pesos iniciales aleatorios\n"
+             "• Botón Reiniciar: Vuelve a los pesos iniciales (fijos o con semilla)\n"
              "• Barra de Progreso: Muestra avance del entrenamiento\n"
              "• Panel de Estado: Información detallada de la red"),
 
@@ -727,17 +853,18 @@ class App:
             base = self.base_node_colors.get(name[0], "#60a5fa")
             self.canvas.itemconfigure(node, fill=base, outline="#f1f5f9", width=3)
 
-    def _refresh_weight_labels(self):
-        """Update all weight and bias labels on the graph."""
+    def _refresh_weight_labels(self, net: Optional[MLP221] = None):
+        """Update all weight and bias labels on the graph (from ``net`` or the model)."""
+        net = net or self.net
         texts = [
-            f"{self.net.W1[0][0]:+.2f}", f"{self.net.W1[0][1]:+.2f}",
-            f"{self.net.W1[1][0]:+.2f}", f"{self.net.W1[1][1]:+.2f}",
-            f"{self.net.W2[0][0]:+.2f}", f"{self.net.W2[0][1]:+.2f}",
+            f"{net.W1[0][0]:+.2f}", f"{net.W1[0][1]:+.2f}",
+            f"{net.W1[1][0]:+.2f}", f"{net.W1[1][1]:+.2f}",
+            f"{net.W2[0][0]:+.2f}", f"{net.W2[0][1]:+.2f}",
         ]
         weights = [
-            self.net.W1[0][0], self.net.W1[0][1],
-            self.net.W1[1][0], self.net.W1[1][1],
-            self.net.W2[0][0], self.net.W2[0][1],
+            net.W1[0][0], net.W1[0][1],
+            net.W1[1][0], net.W1[1][1],
+            net.W2[0][0], net.W2[0][1],
         ]
         for i, t in enumerate(texts):
             color = self._edge_color(weights[i])
@@ -748,8 +875,8 @@ class App:
                 fill=color,
                 width=3 + min(abs(weights[i]) * 1.2, 5),
             )
-        self.canvas.itemconfigure(self.lbl_b1, text=f"b1={ [round(v,2) for v in self.net.b1] }")
-        self.canvas.itemconfigure(self.lbl_b2, text=f"b2={ [round(v,2) for v in self.net.b2] }")
+        self.canvas.itemconfigure(self.lbl_b1, text=f"b1={ [round(v,2) for v in net.b1] }")
+        self.canvas.itemconfigure(self.lbl_b2, text=f"b2={ [round(v,2) for v in net.b2] }")
 
     def _update_labels(self, x, y):
         """Update the info panel with current network state."""
@@ -765,13 +892,14 @@ class App:
         self.lbl_info.config(text=" | ".join(info))
 
     def _calculate_accuracy(self) -> float:
-        """Calculate current model accuracy on XOR dataset."""
+        """Calculate current model accuracy on the first chunk of the dataset."""
+        samples = self.dataset.chunk(0)
         correct = 0
-        for x, y in DATA:
+        for x, y in samples:
             pred = self.net.predict(x)
             if (pred > 0.5 and y == 1.0) or (pred <= 0.5 and y == 0.0):
                 correct += 1
-        return (correct / len(DATA)) * 100
+        return (correct / len(samples)) * 100
 
     def run_one(self, x, y):
         """Execute forward pass for one input and update visualization."""
@@ -835,6 +963,10 @@ class App:
 
     def _training_callback(self, epoch: int, total_epochs: int, loss: float):
         """Callback executed during training to update UI."""
+        self.loss_chart.feed(epoch, total_epochs, loss)
+        # Throttle status updates so long runs don't flood the Tk event queue
+        if epoch % max(1, total_epochs // 200) and epoch != total_epochs:
+            return
         progress = (epoch / total_epochs) * 100
         self.root.after(0, lambda: self._update_training_status(epoch, total_epochs, loss, progress))
 
@@ -853,17 +985,41 @@ class App:
     def _run_training_thread(self):
         """Execute training in a separate thread to keep UI responsive."""
         try:
+            schedule = make_schedule(self.schedule_spec, self.lr, self.epochs)
+            optimizer = make_optimizer(self.optimizer_name)
+            snapshots = self.snapshots
+            if self.fast_engine:
+                self.losses = train_fast(
+                    self.net,
+                    epochs=self.epochs,
+                    lr=schedule,
+                    dataset=self.dataset,
+                    callback=self._training_callback,
+                    chunk_epochs=max(1, self.epochs // 100),
+                    control=self.control,
+                    snapshots=snapshots,
+                )
+                if self.control.stopped_epoch is not None:
+                    self.root.after(0, self._training_cancelled)
+                    return
+                self.root.after(0, self._training_complete)
+                return
+
             tracer = MarkdownTracer("trazas.md")
             self.losses = train_with_callback(
                 self.net, 
                 epochs=self.epochs, 
-                lr=self.lr, 
+                lr=schedule, 
                 tracer=tracer,
-                callback=self._training_callback
+                callback=self._training_callback,
+                dataset=self.dataset,
+                control=self.control,
+                snapshots=snapshots,
+                optimizer=optimizer,
             )
-            export_loss_plot(self.losses, "loss.png")
-            export_pred_table(self.net, "predicciones.md")
-
+            if self.control.stopped_epoch is not None:
+                self.root.after(0, self._training_cancelled)
+                return
             self.root.after(0, self._training_complete)
         except Exception as e:
             self.root.after(0, lambda: self._training_error(str(e)))
@@ -871,27 +1027,49 @@ class App:
     def _training_complete(self):
         """Called when training finishes successfully."""
         self.is_training = False
+        self.loss_chart.stop()
+        self._enable_scrubber()
         self._refresh_weight_labels()
         self._enable_controls()
         accuracy = self._calculate_accuracy()
+        summary = f"Entrenamiento completado | Precisión final: {accuracy:.1f}%"
+        self.lbl_training.config(text=summary, foreground=self.colors["accent_success"])
+
+        def show(statuses):
+            self.lbl_training.config(text=summary, foreground=self.colors["accent_success"])
+            files = [f"  • {os.path.basename(path)} ({status})" for path, status in statuses.items()]
+            if not self.fast_engine:
+                files.insert(0, "  • trazas.md")
+            messagebox.showinfo(
+                "Entrenamiento Completado", 
+                f"El entrenamiento ha finalizado exitosamente.\n\n"
+                f"Precisión: {accuracy:.1f}%\n"
+                f"Pérdida final: {self.losses.last if self.losses else 0:.6f}\n"
+                f"Pérdida mínima: {self.losses.min if self.losses else 0:.6f}\n\n"
+                f"Archivos guardados:\n"
+                + "\n".join(files)
+            )
+
+        self._start_export(trace=False, on_done=show)
+
+    def _training_cancelled(self):
+        """Called when training stops after a cancel request."""
+        self.is_training = False
+        self.loss_chart.stop()
+        self._enable_scrubber()
+        self._refresh_weight_labels()
+        self._enable_controls()
+        saved = ", ".join(self.control.saved) or "nada"
         self.lbl_training.config(
-            text=f"Entrenamiento completado | Precisión final: {accuracy:.1f}%",
-            foreground=self.colors["accent_success"]
-        )
-        messagebox.showinfo(
-            "Entrenamiento Completado", 
-            f"El entrenamiento ha finalizado exitosamente.\n\n"
-            f"Precisión: {accuracy:.1f}%\n"
-            f"Pérdida final: {self.losses[-1] if self.losses else 0:.6f}\n\n"
-            f"Archivos guardados:\n"
-            f"  • trazas.md\n"
-            f"  • loss.png\n"
-            f"  • predicciones.md"
+            text=f"Entrenamiento detenido en la época {self.control.stopped_epoch} | "
+                 f"Guardado: {saved}",
+            foreground=self.colors["accent_warning"]
         )
 
     def _training_error(self, error_msg: str):
         """Called when training encounters an error."""
         self.is_training = False
+        self.loss_chart.stop()
         self._enable_controls()
         self.progress["value"] = 0
         self.lbl_training.config(
@@ -905,16 +1083,24 @@ class App:
         self.btn_train.state(["disabled"])
         self.btn_export.state(["disabled"])
         self.btn_reset.state(["disabled"])
+        self.btn_find_lr.state(["disabled"])
+        self.btn_adopt.state(["disabled"])
         for btn in self.option_buttons.values():
             btn.state(["disabled"])
+        self.btn_pause.config(text="Pausar")
+        self.btn_pause.state(["!disabled"])
+        self.btn_stop.state(["!disabled"])
 
     def _enable_controls(self):
         """Re-enable all control buttons after training."""
         self.btn_train.state(["!disabled"])
         self.btn_export.state(["!disabled"])
         self.btn_reset.state(["!disabled"])
+        self.btn_find_lr.state(["!disabled"])
         for btn in self.option_buttons.values():
             btn.state(["!disabled"])
+        self.btn_pause.state(["disabled"])
+        self.btn_stop.state(["disabled"])
 
     def train_click(self):
         """Handle training button click with validation and threading."""
@@ -925,17 +1111,32 @@ class App:
         try:
             self.lr = float(self.var_lr.get())
             self.epochs = int(self.var_ep.get())
+            self.fast_engine = bool(self.var_fast.get())
+            self.schedule_spec = self.var_schedule.get().strip() or "constant"
+            make_schedule(self.schedule_spec, 1.0, self.epochs)
+            self.optimizer_name = self.var_optimizer.get()
+            if self.optimizer_name != "sgd" and self.fast_engine:
+                raise ValueError("El motor rápido solo está disponible con SGD")
+            if self.optimizer_name != "sgd" and self.schedule_spec != "constant":
+                raise ValueError(f"{self.optimizer_name} no usa learning rate: "
+                                 "el programa debe ser constant")
+            max_epochs = 10_000_000 if self.fast_engine and JIT_AVAILABLE else 100000
 
             if self.lr <= 0 or self.lr > 10:
                 raise ValueError("Learning rate debe estar entre 0 y 10")
-            if self.epochs <= 0 or self.epochs > 100000:
-                raise ValueError("Épocas debe estar entre 1 y 100000")
+            if self.epochs <= 0 or self.epochs > max_epochs:
+                raise ValueError(f"Épocas debe estar entre 1 y {max_epochs}")
 
         except ValueError as e:
             messagebox.showerror("Error de validación", str(e))
             return
 
         self.is_training = True
+        self.control = TrainingControl(check_every=50)
+        self.snapshots = SnapshotRing.for_epochs(self.epochs)
+        self.scrubber.state(["disabled"])
+        self.lbl_scrub.config(text="Época -")
+        self.loss_chart.start(self.epochs)
         self._disable_controls()
         self.progress["value"] = 0
         self.lbl_training.config(
@@ -946,21 +1147,160 @@ class App:
         self.training_thread = Thread(target=self._run_training_thread, daemon=True)
         self.training_thread.start()
 
-    def export_click(self):
-        """Export traces and figures without training."""
-        if not self.losses:
-            tracer = MarkdownTracer("trazas.md")
-            tracer.log_epoch_header(0, self.lr)
-            for x, y in DATA:
-                self.net.forward(x)
-                self.net.backward(y)
-                tracer.log_sample(x, y, self.net)
-                tracer.log_update(self.net)
-            tracer.log_final_predictions([((x, y), self.net.predict(x)) for x, y in DATA])
+    def find_lr_click(self):
+        """Run the LR range test in a background thread and adopt the suggested LR."""
+        if self.is_training:
+            return
+        self.btn_find_lr.state(["disabled"])
+        self.btn_train.state(["disabled"])
+        self.lbl_training.config(text="Buscando learning rate...",
+                                 foreground=self.colors["accent_warning"])
+        start = MLP221()
+        start.set_params(self.net.get_params())
+
+        def work():
+            try:
+                result = lr_range_test(start, self.dataset)
+            except Exception as e:
+                self.root.after(0, lambda: self._find_lr_finished(None, str(e)))
+            else:
+                self.root.after(0, lambda: self._find_lr_finished(result, None))
+
+        Thread(target=work, daemon=True).start()
+
+    def _find_lr_finished(self, result, error: Optional[str]):
+        """Called in the Tk thread when the LR range test ends."""
+        self.btn_find_lr.state(["!disabled"])
+        self.btn_train.state(["!disabled"])
+        if error is not None:
+            self.lbl_training.config(text="Error al buscar LR",
+                                     foreground=self.colors["accent_danger"])
+            messagebox.showerror("Error", f"Error en la prueba de rango de LR:\n{error}")
+            return
+        self.lr = min(round(result.suggested, 4), 10.0)
+        self.var_lr.set(self.lr)
+        self.lbl_training.config(
+            text=f"LR sugerido: {self.lr:g} (margen seguro tras {len(result.lrs)} corridas cortas)",
+            foreground=self.colors["accent_success"])
+
+    def _enable_scrubber(self):
+        """Point the trajectory slider at the snapshots of the finished run."""
+        self.snapshots.ensure(len(self.losses), self.net.get_params())
+        last = len(self.snapshots) - 1
+        self.scrubber.configure(to=max(last, 0))
+        self.var_scrub.set(last)
+        self.scrubber.state(["!disabled"] if last > 0 else ["disabled"])
+        self._show_snapshot(last)
+
+    def _on_scrub(self, _value):
+        """Coalesce slider events so at most one redraw runs per idle cycle."""
+        if not self._scrub_pending:
+            self._scrub_pending = True
+            self.root.after_idle(self._scrub_redraw)
+
+    def _scrub_redraw(self):
+        self._scrub_pending = False
+        if self.is_training or not len(self.snapshots):
+            return
+        self._show_snapshot(round(self.var_scrub.get()))
+
+    def _show_snapshot(self, index: int):
+        """Draw snapshot ``index`` on the graph labels (O(1)) without touching the model."""
+        if not 0 <= index < len(self.snapshots):
+            return
+        epoch, params = self.snapshots[index]
+        shown = MLP221()
+        shown.set_params(params)
+        self._refresh_weight_labels(shown)
+        self.btn_adopt.state(["!disabled"] if index < len(self.snapshots) - 1 else ["disabled"])
+        loss = f" | Pérdida: {self.losses[epoch - 1]:.6f}" if 0 < epoch <= len(self.losses) else ""
+        self.lbl_scrub.config(text=f"Época {epoch}/{len(self.losses)}{loss}")
+
+    def adopt_snapshot_click(self):
+        """Load the weights shown by the slider into the model to continue from them."""
+        if self.is_training or not len(self.snapshots):
+            return
+        epoch, params = self.snapshots[round(self.var_scrub.get())]
+        self.net.set_params(params)
+        self.btn_adopt.state(["disabled"])
+        self.lbl_training.config(
+            text=f"Pesos de la época {epoch} cargados - Entrenar continúa desde ellos",
+            foreground=self.colors["accent_success"]
+        )
+
+    def pause_click(self):
+        """Pause or resume the running training."""
+        if not self.is_training or self.control is None:
+            return
+        if self.control.paused:
+            self.control.resume()
+            self.btn_pause.config(text="Pausar")
+            self.lbl_training.config(text="Reanudando entrenamiento...",
+                                     foreground=self.colors["accent_success"])
         else:
-            export_loss_plot(self.losses, "loss.png")
-        export_pred_table(self.net, "predicciones.md")
-        messagebox.showinfo("Exportado", "Se guardaron:\n  • trazas.md\n  • loss.png\n  • predicciones.md")
+            self.control.pause()
+            self.btn_pause.config(text="Reanudar")
+            self.lbl_training.config(text="Entrenamiento en pausa",
+                                     foreground=self.colors["accent_warning"])
+
+    def stop_click(self):
+        """Request cancellation of the running training."""
+        if not self.is_training or self.control is None:
+            return
+        self.control.cancel()
+        self.btn_pause.state(["disabled"])
+        self.btn_stop.state(["disabled"])
+        self.lbl_training.config(text="Deteniendo entrenamiento...",
+                                 foreground=self.colors["accent_warning"])
+
+    def export_click(self):
+        """Export traces and figures without training (rendered in the background)."""
+        def show(statuses):
+            self.lbl_training.config(text="Exportación terminada",
+                                     foreground=self.colors["accent_success"])
+            messagebox.showinfo(
+                "Exportado",
+                "Se guardaron:\n" + "\n".join(
+                    f"  • {os.path.basename(path)} ({status})" for path, status in statuses.items()
+                ),
+            )
+
+        # Sin historial se documenta el estado actual con una traza de una época
+        self._start_export(trace=not self.losses, on_done=show)
+
+    def _start_export(self, trace: bool, on_done):
+        """Queue an export in the worker process pool and report progress in the status bar."""
+        self.btn_export.state(["disabled"])
+
+        def progress(done, total, path, status):
+            text = f"Exportando {done}/{total}: {os.path.basename(path)} ({status})"
+            self.root.after(0, lambda: self.lbl_training.config(
+                text=text, foreground=self.colors["accent_warning"]))
+
+        future = self.exporter.export(
+            self.net,
+            self.losses,
+            dataset=self.dataset,
+            lr=self.lr,
+            trace=trace,
+            progress=progress,
+        )
+        future.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._export_finished(f, on_done))
+        )
+
+    def _export_finished(self, future, on_done):
+        """Called in the Tk thread once every artifact of an export is done."""
+        if not self.is_training:
+            self.btn_export.state(["!disabled"])
+        try:
+            statuses = future.result()
+        except Exception as e:
+            self.lbl_training.config(text="Error al exportar",
+                                     foreground=self.colors["accent_danger"])
+            messagebox.showerror("Error", f"Error al exportar:\n{e}")
+            return
+        on_done(statuses)
 
     def reset_weights(self):
         """Reset network to initial weights and clear training history."""
@@ -968,8 +1308,14 @@ class App:
             messagebox.showwarning("Advertencia", "No se puede reiniciar durante el entrenamiento")
             return
 
-        self.net = MLP221()
-        self.losses = []
+        self.net = MLP221(init=self.init, seed=self.seed)
+        self.losses = LossHistory()
+        self.loss_chart.clear()
+        self.snapshots.clear()
+        self.scrubber.configure(to=0)
+        self.scrubber.state(["disabled"])
+        self.btn_adopt.state(["disabled"])
+        self.lbl_scrub.config(text="Época -")
         self.progress["value"] = 0
         self.lbl_training.config(
             text="Pesos reiniciados - Listo para entrenar",
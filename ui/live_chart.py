@@ -0,0 +1,198 @@
+"""Live loss chart drawn incrementally on a Tk canvas.
+
+The training thread only calls ``feed`` (a few float operations and, once per
+bucket, an append to a ``deque``). The Tk main loop drains that queue every
+``interval_ms`` and extends a single canvas line with ``Canvas.insert``, so each
+update costs O(new points) instead of redrawing the whole series.
+
+The x axis spans the planned number of epochs and epochs are averaged into
+buckets of ``ceil(total / max_points)``, so the line never holds more than
+``max_points`` vertices. When a loss exceeds the y range the range doubles and
+the existing line is rescaled in place with ``Canvas.scale``; doubling keeps the
+total rescaling work amortized O(1) per point.
+"""
+
+import math
+import tkinter as tk
+from collections import deque
+from typing import Optional
+
+
+class LiveLossChart:
+    """Embedded loss-vs-epoch chart fed from a worker thread."""
+
+    MARGIN_LEFT = 56
+    MARGIN_RIGHT = 12
+    MARGIN_TOP = 12
+    MARGIN_BOTTOM = 22
+
+    def __init__(self, parent, colors: dict, height: int = 150,
+                 max_points: int = 800, interval_ms: int = 50):
+        self.colors = colors
+        self.max_points = max(2, max_points)
+        self.interval_ms = interval_ms
+        self.canvas = tk.Canvas(parent,
+                                height=height,
+                                bg=colors["bg_medium"],
+                                highlightthickness=2,
+                                highlightbackground=colors["bg_light"])
+        self.canvas.bind("<Configure>", self._on_resize)
+
+        self._pending = deque()
+        self._after_id: Optional[str] = None
+        self._line: Optional[int] = None
+        self._width = 1
+        self._height = 1
+        self._reset_state(1)
+        self._draw_frame()
+
+    def pack(self, **kwargs):
+        self.canvas.pack(**kwargs)
+
+    # ------------------------------------------------------------ worker side
+    def feed(self, epoch: int, total: int, loss: float) -> None:
+        """Accumulate one callback value; safe to call from the training thread."""
+        self._sum += loss
+        self._count += 1
+        if epoch >= self._next_edge or epoch >= total:
+            self._pending.append((epoch, self._sum / self._count))
+            self._sum = 0.0
+            self._count = 0
+            self._next_edge = (epoch // self._bucket + 1) * self._bucket
+
+    # --------------------------------------------------------------- UI side
+    def start(self, total_epochs: int) -> None:
+        """Clear the chart and start polling for points of a new run."""
+        self.stop()
+        self._reset_state(total_epochs)
+        self._draw_frame()
+        self._schedule()
+
+    def stop(self) -> None:
+        """Draw any queued points and stop polling."""
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+        self._drain()
+
+    def clear(self) -> None:
+        """Stop polling and remove the curve."""
+        self.stop()
+        self._reset_state(1)
+        self._draw_frame()
+
+    def _reset_state(self, total_epochs: int) -> None:
+        self._total = max(1, total_epochs)
+        self._bucket = max(1, math.ceil(self._total / self.max_points))
+        self._next_edge = self._bucket
+        self._sum = 0.0
+        self._count = 0
+        self._pending.clear()
+        self._ymax: Optional[float] = None
+        self._last = None
+
+    def _schedule(self) -> None:
+        self._after_id = self.canvas.after(self.interval_ms, self._tick)
+
+    def _tick(self) -> None:
+        self._drain()
+        self._schedule()
+
+    def _drain(self) -> None:
+        """Append every queued bucket to the line in one ``insert`` call."""
+        if not self._pending:
+            return
+        coords = []
+        while self._pending:
+            epoch, loss = self._pending.popleft()
+            if not math.isfinite(loss):
+                continue
+            if self._ymax is None:
+                self._ymax = max(loss * 1.1, 1e-12)
+                self._update_axis_labels()
+            elif loss > self._ymax:
+                self._grow_y(loss)
+            coords.extend(self._to_pixels(epoch, loss))
+            self._last = (epoch, loss)
+        if not coords:
+            return
+        if self._line is None:
+            if len(coords) == 2:
+                coords = coords * 2
+            self._line = self.canvas.create_line(*coords,
+                                                 fill=self.colors["accent_primary"],
+                                                 width=2)
+        else:
+            self.canvas.insert(self._line, "end", coords)
+        epoch, loss = self._last
+        self.canvas.itemconfigure(self._status,
+                                  text=f"época {epoch}/{self._total}  pérdida {loss:.6f}")
+
+    # -------------------------------------------------------------- geometry
+    def _plot_box(self):
+        left = self.MARGIN_LEFT
+        bottom = self._height - self.MARGIN_BOTTOM
+        width = max(1, self._width - self.MARGIN_LEFT - self.MARGIN_RIGHT)
+        height = max(1, bottom - self.MARGIN_TOP)
+        return left, bottom, width, height
+
+    def _to_pixels(self, epoch: int, loss: float):
+        left, bottom, width, height = self._plot_box()
+        return (left + width * epoch / self._total,
+                bottom - height * loss / self._ymax)
+
+    def _grow_y(self, loss: float) -> None:
+        """Double the y range until ``loss`` fits and rescale the drawn line."""
+        new_max = self._ymax
+        while loss > new_max:
+            new_max *= 2.0
+        if self._line is not None:
+            left, bottom, _, _ = self._plot_box()
+            self.canvas.scale(self._line, left, bottom, 1.0, self._ymax / new_max)
+        self._ymax = new_max
+        self._update_axis_labels()
+
+    def _draw_frame(self) -> None:
+        """Redraw the axes and drop the line (start, clear and resize only)."""
+        self.canvas.delete("all")
+        self._line = None
+        left, bottom, width, height = self._plot_box()
+        axis = self.colors["text_muted"]
+        self.canvas.create_line(left, self.MARGIN_TOP, left, bottom, left + width, bottom,
+                                fill=axis)
+        self._lbl_ymax = self.canvas.create_text(left - 6, self.MARGIN_TOP, anchor="e",
+                                                 fill=axis, font=("Consolas", 8))
+        self.canvas.create_text(left - 6, bottom, anchor="e", text="0",
+                                fill=axis, font=("Consolas", 8))
+        self._lbl_xmax = self.canvas.create_text(left + width, bottom + 4, anchor="ne",
+                                                 text=str(self._total),
+                                                 fill=axis, font=("Consolas", 8))
+        self._status = self.canvas.create_text(left + 8, self.MARGIN_TOP, anchor="nw",
+                                               text="Pérdida (BCE) por época",
+                                               fill=self.colors["text_secondary"],
+                                               font=("Segoe UI", 9))
+        self._update_axis_labels()
+
+    def _update_axis_labels(self) -> None:
+        text = "" if self._ymax is None else f"{self._ymax:.3g}"
+        self.canvas.itemconfigure(self._lbl_ymax, text=text)
+
+    def _on_resize(self, event) -> None:
+        """Stretch the existing drawing to the new size (one ``scale`` per item)."""
+        old_w, old_h = self._width, self._height
+        self._width, self._height = max(event.width, 1), max(event.height, 1)
+        if self._line is None or (old_w, old_h) == (self._width, self._height):
+            self._draw_frame()
+            return
+        old_left = self.MARGIN_LEFT
+        old_bottom = old_h - self.MARGIN_BOTTOM
+        old_pw = max(1, old_w - self.MARGIN_LEFT - self.MARGIN_RIGHT)
+        old_ph = max(1, old_bottom - self.MARGIN_TOP)
+        line = self._line
+        coords = self.canvas.coords(line)
+        self._draw_frame()
+        left, bottom, width, height = self._plot_box()
+        self._line = self.canvas.create_line(*coords, fill=self.colors["accent_primary"],
+                                             width=2)
+        self.canvas.move(self._line, 0, bottom - old_bottom)
+        self.canvas.scale(self._line, old_left, bottom, width / old_pw, height / old_ph)